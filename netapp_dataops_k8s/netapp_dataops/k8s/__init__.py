@@ -14,7 +14,6 @@ from time import sleep
 import warnings
 import os
 
-from notebook import auth as jupyter_auth
 from kubernetes import client, config
 from kubernetes.client import (
     V1ConfigMap,
@@ -23,8 +22,9 @@ from kubernetes.client import (
 from kubernetes.client.models.v1_object_meta import V1ObjectMeta
 from kubernetes.client.rest import ApiException
 from tabulate import tabulate
-import pandas as pd
-import astraSDK
+
+# astraSDK and notebook are slow to import, and are only needed by a few functions, so those functions import them
+# when they are called instead of when the toolkit is imported
 
 
 # Using this decorator in lieu of using a dependency to manage deprecation
@@ -657,6 +657,8 @@ def clone_jupyter_lab(new_workspace_name: str, source_workspace_name: str, sourc
 
 
 def clone_jupyter_lab_to_new_namespace(source_workspace_name: str, new_namespace: str, source_workspace_namespace: str = "default", clone_to_cluster_name: str = None, print_output: bool = False) :
+    import astraSDK
+
     # Retrieve list of Astra apps
     try :
         astra_apps = astraSDK.getApps().main(namespace=source_workspace_namespace)
@@ -782,6 +784,7 @@ def create_jupyter_lab(workspace_name: str, workspace_size: str, mount_pvc: str
         labels = _get_jupyter_lab_labels(workspaceName=workspace_name)
 
     # Step 0 - Set password
+    from notebook import auth as jupyter_auth
     if not workspace_password:
         print("Setting workspace password (this password will be required in order to access the workspace)...")
         hashedPassword = jupyter_auth.passwd()
@@ -1700,6 +1703,7 @@ def list_jupyter_labs(namespace: str = "default", include_astra_app_id: bool = F
 
     # Retrieve list of Astra apps
     if include_astra_app_id :
+        import astraSDK
         try :
             astra_apps = astraSDK.getApps().main(namespace=namespace)
         except Exception as err :
@@ -1790,9 +1794,7 @@ def list_jupyter_labs(namespace: str = "default", include_astra_app_id: bool = F
 
     # Print list of workspaces
     if print_output:
-        # Convert workspaces array to Pandas DataFrame
-        workspacesDF = pd.DataFrame.from_dict(workspacesList, dtype="string")
-        print(tabulate(workspacesDF, showindex=False, headers=workspacesDF.columns))
+        print(tabulate(workspacesList, headers="keys"))
 
     return workspacesList
 
@@ -1853,9 +1855,7 @@ def list_triton_servers(namespace: str = "default", print_output: bool = False)
 
     # Print list of workspaces
     if print_output:
-        # Convert workspaces array to Pandas DataFrame
-        workspacesDF = pd.DataFrame.from_dict(workspacesList, dtype="string")
-        print(tabulate(workspacesDF, showindex=False, headers=workspacesDF.columns))
+        print(tabulate(workspacesList, headers="keys"))
 
     return workspacesList
 
@@ -1941,9 +1941,7 @@ def list_volumes(namespace: str = "default", print_output: bool = False) -> list
 
     # Print list of volumes
     if print_output:
-        # Convert volumes array to Pandas DataFrame
-        volumesDF = pd.DataFrame.from_dict(volumesList, dtype="string")
-        print(tabulate(volumesDF, showindex=False, headers=volumesDF.columns))
+        print(tabulate(volumesList, headers="keys"))
 
     return volumesList
 
@@ -2019,14 +2017,14 @@ def list_volume_snapshots(pvc_name: str = None, namespace: str = "default", prin
 
     # Print list of snapshots
     if print_output:
-        # Convert snapshots array to Pandas DataFrame
-        snapshotsDF = pd.DataFrame.from_dict(snapshotsList, dtype="string")
-        print(tabulate(snapshotsDF, showindex=False, headers=snapshotsDF.columns))
+        print(tabulate(snapshotsList, headers="keys"))
 
     return snapshotsList
 
 
 def register_jupyter_lab_with_astra(workspace_name: str, namespace: str = "default", print_output: bool = False) :
+    import astraSDK
+
     # Retrieve list of unmanaged Astra apps
     try :
         astra_apps_unmanaged = astraSDK.getApps().main(discovered=True, namespace=namespace)
@@ -2091,6 +2089,8 @@ def register_jupyter_lab_with_astra(workspace_name: str, namespace: str = "defau
 
 
 def backup_jupyter_lab_with_astra(workspace_name: str, backup_name: str, namespace: str = "default", print_output: bool = False) :
+    import astraSDK
+
     # Retrieve list of Astra apps
     try :
         astra_apps = astraSDK.getApps().main(namespace=namespace)
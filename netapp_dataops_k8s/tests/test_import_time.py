@@ -0,0 +1,29 @@
+"""Regression test for the import cost of netapp_dataops.k8s.
+
+astraSDK and notebook are imported by the few functions that need them, rather
+than when the toolkit is imported. This test fails if a new top-level import
+pulls one of them (or pandas, which the toolkit no longer uses) back in.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The Kubernetes client is a required, eagerly imported dependency of the toolkit
+pytest.importorskip("kubernetes")
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be loaded by 'import netapp_dataops.k8s'
+LAZY_MODULES = ("astraSDK", "notebook", "pandas", "numpy", "boto3", "netapp_ontap")
+
+
+def test_import_does_not_load_lazy_modules():
+    code = "import sys, netapp_dataops.k8s; print(','.join(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PACKAGE_ROOT,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    loadedModules = result.stdout.strip().split(",")
+    loadedLazyModules = [module for module in LAZY_MODULES if module in loadedModules]
+    assert not loadedLazyModules, "import netapp_dataops.k8s loaded: " + ", ".join(loadedLazyModules)
@@ -12,17 +12,22 @@ sys.path.insert(0, "/root/netapp-dataops-toolkit/netapp_dataops_traditional/neta
 from netapp_dataops import traditional
 from netapp_dataops.traditional import (
     clone_volume,
+    clone_volumes_bulk,
     InvalidConfigError,
     InvalidVolumeParameterError,
     InvalidSnapMirrorParameterError,
     InvalidSnapshotParameterError,
     APIConnectionError,
     mount_volume,
+    mount_volumes,
     unmount_volume,
+    unmount_volumes,
     MountOperationError,
     ConnectionTypeError,
+    list_data_lifs,
     list_volumes,
     create_snapshot,
+    create_snapshots,
     create_volume,
     delete_snapshot,
     delete_volume,
@@ -33,7 +38,10 @@ from netapp_dataops.traditional import (
     prepopulate_flex_cache,
     pull_bucket_from_s3,
     pull_object_from_s3,
+    pull_shard_member_from_s3,
+    pull_shards_from_s3,
     push_directory_to_s3,
+    push_directory_to_s3_as_shards,
     push_file_to_s3,
     restore_snapshot,
     CloudSyncSyncOperationError,
@@ -60,6 +68,7 @@ Note: To view details regarding options/arguments for a specific command, run th
 \tcreate volume\t\t\tCreate a new data volume.
 \tdelete volume\t\t\tDelete an existing data volume.
 \tlist volumes\t\t\tList all data volumes.
+\tlist data-lifs\t\t\tList the NFS data LIFs that volumes can be mounted through.
 \tmount volume\t\t\tMount an existing data volume locally. Note: on Linux hosts - must be run as root.
 \tunmount volume\t\t\tUnmount an existing data volume. Note: on Linux hosts - must be run as root.
 
@@ -78,7 +87,10 @@ Note: To view details regarding options/arguments for a specific command, run th
 \tsync cloud-sync-relationship\tTrigger a sync operation for an existing Cloud Sync relationship.
 \tpull-from-s3 bucket\t\tPull the contents of a bucket from S3.
 \tpull-from-s3 object\t\tPull an object from S3.
+\tpull-from-s3 shards\t\tPull a set of tar shards from S3 and extract their contents (multithreaded).
+\tpull-from-s3 shard-member\tPull a single file from a set of tar shards in S3.
 \tpush-to-s3 directory\t\tPush the contents of a directory to S3 (multithreaded).
+\tpush-to-s3 shards\t\tPack the contents of a directory into tar shards and push them to S3 (multithreaded).
 \tpush-to-s3 file\t\t\tPush a file to S3.
 
 Advanced Data Fabric Commands:
@@ -117,6 +129,12 @@ Optional Options/Arguments:
 \t-r, --refresh\t\tdelete existing clone if exists before creating a new one 
 \t-d, --svm-dr-unprotect\tdisable svm dr protection if svm-dr protection exists 
 
+Bulk Clone Options/Arguments (create many clones of the same source in parallel):
+\t--count=\t\tNumber of clones to create. Clones will be named <name>_1 through <name>_<count>.
+\t--names-file=\t\tFile containing the names of the clones to create, one name per line (replaces -n/--name).
+\t--max-workers=\t\tMaximum number of clone requests to submit concurrently (default: 8).
+\t\t\t\tNote: mountpoint, junction, export-hosts, split, refresh and svm-dr-unprotect are not supported when creating clones in bulk.
+
 Examples (basic usage):
 \tnetapp_dataops_cli.py clone volume --name=project1 --source-volume=gold_dataset
 \tnetapp_dataops_cli.py clone volume -n project2 -v gold_dataset -s snap1
@@ -126,6 +144,10 @@ Examples (basic usage):
 Examples (advanced usage):
 \tnetapp_dataops_cli.py clone volume -n testvol -v gold_dataset -u 1000 -g 1000 -x -j /project1 -d snappolicy1
 \tnetapp_dataops_cli.py clone volume --name=project1 --source-volume=gold_dataset --source-svm=svm1 --target-svm=svm2 --source-snapshot=daily* --export-hosts 10.5.5.3:host1:10.6.4.0/24 --split
+
+Examples (bulk usage):
+\tnetapp_dataops_cli.py clone volume --name=experiment --source-volume=gold_dataset --source-snapshot=snap1 --count=50
+\tnetapp_dataops_cli.py clone volume --names-file=experiments.txt --source-volume=gold_dataset --source-snapshot=daily* --max-workers=16
 '''
 helpTextConfig = '''
 Command: config
@@ -151,12 +173,20 @@ Optional Options/Arguments:
 \t                \tCan be count of snapshots when int (ex. 10) or days when retention is suffixed by d (ex. 10d)
 \t-l, --snapmirror-label=\tif provided snapmirror label will be configured on the created snapshot 
 
+Multi-Volume Options/Arguments (snapshot many volumes at once):
+\t--volumes=\t\tComma separated list of volume names (replaces -v/--volume). By default, a crash-consistent snapshot of all volumes
+\t\t\t\tis created through a consistency group; if that is not possible, the volumes are snapshotted in parallel.
+\t--not-consistent\tSnapshot the volumes in parallel without a consistency group.
+\t--max-workers=\t\tMaximum number of snapshot requests to submit concurrently when snapshotting in parallel (default: 8).
+\t\t\t\tNote: retention is not supported when snapshotting many volumes.
+
 Examples:
 \tnetapp_dataops_cli.py create snapshot --volume=project1 --name=snap1
 \tnetapp_dataops_cli.py create snapshot -v project2 -n final_dataset
 \tnetapp_dataops_cli.py create snapshot --volume=test1
 \tnetapp_dataops_cli.py create snapshot -v project2 -n daily_consistent -r 7 -l daily
 \tnetapp_dataops_cli.py create snapshot -v project2 -n daily_for_month -r 30d -l daily
+\tnetapp_dataops_cli.py create snapshot --volumes=dataset,feature_store,checkpoints --name=epoch10
 '''
 helpTextCreateVolume = '''
 Command: create volume
@@ -249,9 +279,15 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-h, --help\t\tPrint help text.
 
+Bulk Unmount Options/Arguments (unmount many volumes in parallel):
+\t--nested\t\tUnmount every volume that is mounted directly beneath the mountpoint (e.g. volumes mounted with 'mount volume --count').
+\t--mountpoints-file=\tFile containing the mountpoints to unmount, one mountpoint per line (replaces -m/--mountpoint).
+\t--max-workers=\t\tMaximum number of volumes to unmount concurrently (default: 8).
+
 Examples:
 \tnetapp_dataops_cli.py unmount volume --mountpoint=/project2
 \tnetapp_dataops_cli.py unmount volume -m /project2
+\tnetapp_dataops_cli.py unmount volume --mountpoint=/mnt/datasets --nested
 '''
 
 helpTextListCloudSyncRelationships = '''
@@ -305,6 +341,22 @@ Examples:
 \tnetapp_dataops_cli.py list volumes
 \tnetapp_dataops_cli.py list volumes --include-space-usage-details
 '''
+helpTextListDataLifs = '''
+Command: list data-lifs
+
+List the NFS data LIFs of an SVM that are up. These are the LIFs that 'mount volume --lif-policy' picks from.
+
+No options/arguments are required.
+
+Optional Options/Arguments:
+\t-u, --cluster-name=\tnon default hosting cluster
+\t-v, --svm=\t\tlist data LIFs of non default svm
+\t-h, --help\t\tPrint help text.
+
+Examples:
+\tnetapp_dataops_cli.py list data-lifs
+\tnetapp_dataops_cli.py list data-lifs --svm=svm1
+'''
 helpTextMountVolume = '''
 Command: mount volume
 
@@ -318,14 +370,25 @@ Required Options/Arguments:
 
 Optional Options/Arguments:
 \t-v, --svm \t\tnon default SVM name
-\t-l, --lif \t\tnon default lif (nfs server ip/name)
+\t-l, --lif \t\tnon default lif (nfs server ip/name); in bulk mode, a comma separated list of lifs to spread mounts across round-robin
+\t-o, --options=\t\tNFS mount options to pass to the mount command (e.g. 'vers=4.1,nconnect=8,rsize=1048576,wsize=1048576,hard,timeo=600').
+\t--lif-policy=\t\tPick the lif to mount through from the svm's NFS data lifs (ignored if -l/--lif is specified). Must be one of:
+\t\t\t\tround-robin (rotate through the lifs), client-hash (hash of the client hostname and volume name) or local (lif on the node that hosts the volume's aggregate).
 \t-h, --help\t\tPrint help text.
 \t-x, --readonly\t\tMount volume locally as read-only.
 
+Bulk Mount Options/Arguments (mount many volumes in parallel; each volume is mounted at <mountpoint>/<volume name>):
+\t--count=\t\tNumber of volumes to mount. Volumes named <name>_1 through <name>_<count> will be mounted.
+\t--names-file=\t\tFile containing the names of the volumes to mount, one name per line (replaces -n/--name).
+\t--max-workers=\t\tMaximum number of volumes to mount concurrently (default: 8).
+
 Examples:
 \tsudo -E netapp_dataops_cli.py mount volume --name=project1 --mountpoint=/mnt/project1
 \tsudo -E netapp_dataops_cli.py mount volume -m ~/testvol -n testvol -x
 \tsudo -E netapp_dataops_cli.py mount volume --name=project1 --mountpoint=/mnt/project1 --readonly
+\tsudo -E netapp_dataops_cli.py mount volume --name=project1 --mountpoint=/mnt/project1 --options=vers=4.1,nconnect=8
+\tsudo -E netapp_dataops_cli.py mount volume --name=dataset --count=20 --mountpoint=/mnt/datasets --lif=10.0.0.1,10.0.0.2 --options=vers=4.1,nconnect=8,hard
+\tsudo -E netapp_dataops_cli.py mount volume --name=dataset --count=20 --mountpoint=/mnt/datasets --lif-policy=local
 '''
 helpTextPullFromS3Bucket = '''
 Command: pull-from-s3 bucket
@@ -343,10 +406,43 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-h, --help\t\tPrint help text.
 \t-p, --key-prefix=\tObject key prefix (pull will be limited to objects with key that starts with this prefix).
+\t--delete\t\tIn sync mode, delete local files that are not present in the bucket (limited to files with path that starts with the key prefix).
+\t--listing-shards=\tComma-separated list of key prefixes, relative to the key prefix, to split the listing of the bucket into and list concurrently (pull will be limited to objects with key that starts with one of these prefixes).
+\t--listing-workers=\tNumber of shards of the bucket to list concurrently (default: 1). If greater than 1 and --listing-shards is not specified, shards are discovered by splitting keys on '/'.
+\t--max-bandwidth=\tMaximum bandwidth, in bytes per second, of all requests combined (default: unlimited).
+\t--max-concurrency=\tMaximum number of concurrent requests per object (default: auto-tuned).
+\t--max-io-queue=\t\tMaximum number of read/write tasks to queue per object (default: auto-tuned).
+\t--max-retries=\t\tMaximum number of times to retry transferring an object after a transient failure (default: 3).
+\t--max-rps=\t\tMaximum number of requests per second, across all concurrent transfers (default: unlimited).
+\t--max-workers=\t\tMaximum number of objects to transfer concurrently (default: auto-tuned).
+\t--multipart-chunksize=\tSize, in bytes, of each part of a multipart transfer (default: auto-tuned).
+\t--multipart-threshold=\tSize, in bytes, above which objects are transferred in multiple parts (default: auto-tuned).
+\t--progress\t\tDisplay a single, continuously updated line of progress, including throughput and estimated time remaining, in place of a message for each object.
+\t--resume\t\tResume an interrupted pull, skipping objects that it already pulled.
+\t--sync\t\t\tOnly pull objects that are new or that have changed, either in the bucket or locally, since they were last pulled (sync mode).
+\t--verify\t\tVerify each object against its checksum while it is being downloaded. Objects that do not match are downloaded again, and reported as failed if they still do not match.
+
+Note: Transfer settings that are not specified are taken from the config file, if present there, and are otherwise auto-tuned based on the number and size of the objects being transferred.
+
+Note: Verification (--verify) checks data in the same pass as the transfer, against the flexible checksum (e.g. CRC32) that is stored with each object, or, for objects without one, against the ETag. Objects that have neither (e.g. objects that are encrypted with SSE-KMS or SSE-C and were pushed without a checksum) are transferred, but counted as unverified.
+
+Note: Transient S3 errors (e.g. throttling, timeouts, and 5xx responses) are retried with exponential backoff. A summary of the transfer is printed when it completes; if any object fails, the command exits with a non-zero status.
+
+Note: Bandwidth and request rate limits that are not specified are taken from the config file, if present there, along with any time-of-day schedule of limits; limits that are specified as options apply at all times of day.
+
+Note: Progress (--progress) is updated in place every second when output is to a terminal, and is otherwise printed as a new line every second. Throughput is measured over the last few seconds. While the bucket is still being listed, the totals are marked with a '+' and no estimated time remaining is displayed.
 
 Examples:
 \tnetapp_dataops_cli.py pull-from-s3 bucket --bucket=project1 --directory=/mnt/project1
 \tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -p project1/ -d ./project1/
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d ./project1/ --max-workers=64 --max-concurrency=1
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d ./project1/ --sync --delete
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d ./project1/ --resume
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d ./project1/ --verify
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d ./project1/ --max-bandwidth=1250000000
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b project1 -d ./project1/ --progress
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b imagenet -d /mnt/imagenet --listing-workers=16
+\tnetapp_dataops_cli.py pull-from-s3 bucket -b imagenet -p train/ -d /mnt/imagenet --listing-shards=n01,n02,n03,n04 --listing-workers=4
 '''
 helpTextPullFromS3Object = '''
 Command: pull-from-s3 object
@@ -362,11 +458,74 @@ Required Options/Arguments:
 Optional Options/Arguments:
 \t-f, --file=\t\tLocal filepath (including filename) to save object to (if not specified, value of -k/--key argument will be used)
 \t-h, --help\t\tPrint help text.
+\t--max-bandwidth=\tMaximum bandwidth, in bytes per second, of all requests combined (default: unlimited).
+\t--max-concurrency=\tMaximum number of concurrent requests per object (default: auto-tuned).
+\t--max-io-queue=\t\tMaximum number of read/write tasks to queue per object (default: auto-tuned).
+\t--max-rps=\t\tMaximum number of requests per second, across all concurrent transfers (default: unlimited).
+\t--multipart-chunksize=\tSize, in bytes, of each part of a multipart transfer (default: auto-tuned).
+\t--multipart-threshold=\tSize, in bytes, above which objects are transferred in multiple parts (default: auto-tuned).
+\t--verify\t\tVerify the object against its checksum while it is being downloaded.
+
+Note: Transfer settings that are not specified are taken from the config file, if present there, and are otherwise auto-tuned based on the size of the object being transferred.
+
+Note: Bandwidth and request rate limits that are not specified are taken from the config file, if present there, along with any time-of-day schedule of limits; limits that are specified as options apply at all times of day.
 
 Examples:
 \tnetapp_dataops_cli.py pull-from-s3 object --bucket=project1 --key=data.csv --file=./project1/data.csv
 \tnetapp_dataops_cli.py pull-from-s3 object -b project1 -k data.csv
 '''
+helpTextPullFromS3Shards = '''
+Command: pull-from-s3 shards
+
+Pull a set of tar shards that was pushed using 'push-to-s3 shards' from S3, and extract their contents (multithreaded). Each shard is extracted while it is being downloaded.
+
+Note: To pull to a data volume, the volume must be mounted locally.
+
+Required Options/Arguments:
+\t-b, --bucket=\t\tS3 bucket to pull from.
+\t-d, --directory=\tLocal directory to extract contents of shards to.
+
+Optional Options/Arguments:
+\t-h, --help\t\tPrint help text.
+\t-p, --key-prefix=\tKey prefix of shards and shard index.
+\t--max-bandwidth=\tMaximum bandwidth, in bytes per second, of all requests combined (default: unlimited).
+\t--max-retries=\t\tMaximum number of times to retry transferring a shard after a transient failure (default: 3).
+\t--max-rps=\t\tMaximum number of requests per second, across all concurrent transfers (default: unlimited).
+\t--max-workers=\t\tMaximum number of shards to transfer concurrently (default: number of shards, up to 16).
+\t--progress\t\tDisplay a single, continuously updated line of progress, including throughput and estimated time remaining, in place of a message for each shard.
+\t--verify\t\tVerify each shard against its checksum while it is being downloaded and extracted. Shards that do not match are downloaded again, and reported as failed if they still do not match.
+
+Note: If any shard fails, the command exits with a non-zero status.
+
+Note: Bandwidth and request rate limits that are not specified are taken from the config file, if present there, along with any time-of-day schedule of limits; limits that are specified as options apply at all times of day.
+
+Note: Progress (--progress) is updated in place every second when output is to a terminal, and is otherwise printed as a new line every second. Throughput is measured over the last few seconds.
+
+Examples:
+\tnetapp_dataops_cli.py pull-from-s3 shards --bucket=imagenet --key-prefix=train/ --directory=/mnt/imagenet/train
+\tnetapp_dataops_cli.py pull-from-s3 shards -b imagenet -p train/ -d /mnt/imagenet/train --max-workers=32
+\tnetapp_dataops_cli.py pull-from-s3 shards -b imagenet -p train/ -d /mnt/imagenet/train --progress
+'''
+helpTextPullFromS3ShardMember = '''
+Command: pull-from-s3 shard-member
+
+Pull a single file from a set of tar shards that was pushed using 'push-to-s3 shards'. The file is located using the shard index and retrieved from its shard by byte range, without downloading the rest of the shard.
+
+Note: To pull to a data volume, the volume must be mounted locally.
+
+Required Options/Arguments:
+\t-b, --bucket=\t\tS3 bucket to pull from.
+\t-m, --member=\t\tPath of file within shards (relative to the directory that was pushed).
+
+Optional Options/Arguments:
+\t-f, --file=\t\tLocal filepath (including filename) to save file to (if not specified, value of -m/--member argument will be used)
+\t-h, --help\t\tPrint help text.
+\t-p, --key-prefix=\tKey prefix of shards and shard index.
+
+Examples:
+\tnetapp_dataops_cli.py pull-from-s3 shard-member --bucket=imagenet --key-prefix=train/ --member=n01440764/n01440764_10026.JPEG
+\tnetapp_dataops_cli.py pull-from-s3 shard-member -b imagenet -p train/ -m n01440764/n01440764_10026.JPEG -f ./sample.JPEG
+'''
 helpTextPushToS3Directory = '''
 Command: push-to-s3 directory
 
@@ -384,10 +543,76 @@ Optional Options/Arguments:
 \t-e, --extra-args=\tExtra args to apply to newly-pushed S3 objects (For details on this field, refer to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter).
 \t-h, --help\t\tPrint help text.
 \t-p, --key-prefix=\tPrefix to add to key for newly-pushed S3 objects (Note: by default, key will be local filepath relative to directory being pushed).
+\t--delete\t\tIn sync mode, delete objects that are not present in the local directory (limited to objects with key that starts with the key prefix).
+\t--max-bandwidth=\tMaximum bandwidth, in bytes per second, of all requests combined (default: unlimited).
+\t--max-concurrency=\tMaximum number of concurrent requests per object (default: auto-tuned).
+\t--max-io-queue=\t\tMaximum number of read/write tasks to queue per object (default: auto-tuned).
+\t--max-retries=\t\tMaximum number of times to retry transferring an object after a transient failure (default: 3).
+\t--max-rps=\t\tMaximum number of requests per second, across all concurrent transfers (default: unlimited).
+\t--max-workers=\t\tMaximum number of objects to transfer concurrently (default: auto-tuned).
+\t--multipart-chunksize=\tSize, in bytes, of each part of a multipart transfer (default: auto-tuned).
+\t--multipart-threshold=\tSize, in bytes, above which objects are transferred in multiple parts (default: auto-tuned).
+\t--progress\t\tDisplay a single, continuously updated line of progress, including throughput and estimated time remaining, in place of a message for each file.
+\t--resume\t\tResume an interrupted push, skipping files that it already pushed and continuing incomplete multipart uploads.
+\t--sync\t\t\tOnly push files that are new or that have changed since they were last pushed (sync mode).
+\t--verify\t\tVerify each object against its checksum while it is being uploaded. Files that do not match are uploaded again, and reported as failed if they still do not match.
+
+Note: Transfer settings that are not specified are taken from the config file, if present there, and are otherwise auto-tuned based on the number and size of the files being transferred.
+
+Note: Verification (--verify) sends a CRC32 checksum, computed in the same pass as the transfer, with each object or part, so that S3 rejects data that was corrupted in transit and stores the checksum with the object; the checksums that S3 returns are then checked. Objects pushed to S3 endpoints that do not support flexible checksums are verified against their ETags instead.
+
+Note: Transient S3 errors (e.g. throttling, timeouts, and 5xx responses) are retried with exponential backoff. A summary of the transfer is printed when it completes; if any file fails, the command exits with a non-zero status.
+
+Note: Bandwidth and request rate limits that are not specified are taken from the config file, if present there, along with any time-of-day schedule of limits; limits that are specified as options apply at all times of day.
+
+Note: Progress (--progress) is updated in place every second when output is to a terminal, and is otherwise printed as a new line every second. Throughput is measured over the last few seconds.
 
 Examples:
 \tnetapp_dataops_cli.py push-to-s3 directory --bucket=project1 --directory=/mnt/project1
 \tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 -p project1/ -e '{"Metadata": {"mykey": "myvalue"}}'
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/checkpoints --max-workers=4 --multipart-chunksize=67108864
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/project1 --sync
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/checkpoints --resume
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/checkpoints --verify
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/checkpoints --max-bandwidth=1250000000 --max-rps=500
+\tnetapp_dataops_cli.py push-to-s3 directory -b project1 -d /mnt/checkpoints --progress
+'''
+helpTextPushToS3Shards = '''
+Command: push-to-s3 shards
+
+Pack the contents of a directory into tar shards of a configurable size and push them to S3, along with a shard index (multithreaded). Pushing a few large shards instead of many small files avoids paying the latency of a request per file. Shards are streamed to S3 while they are being packed, so no temporary files are created.
+
+Note: Files are packed in order of path, so files that share a path apart from their extension (e.g. sample.jpg and sample.cls) are stored next to each other, as expected by WebDataset.
+
+Note: To push from a data volume, the volume must be mounted locally.
+
+Required Options/Arguments:
+\t-b, --bucket=\t\tS3 bucket to push to.
+\t-d, --directory=\tLocal directory to push contents of.
+
+Optional Options/Arguments:
+\t-e, --extra-args=\tExtra args to apply to newly-pushed shards (For details on this field, refer to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter).
+\t-h, --help\t\tPrint help text.
+\t-p, --key-prefix=\tPrefix to add to key for newly-pushed shards and shard index.
+\t--max-bandwidth=\tMaximum bandwidth, in bytes per second, of all requests combined (default: unlimited).
+\t--max-retries=\t\tMaximum number of times to retry transferring a shard after a transient failure (default: 3).
+\t--max-rps=\t\tMaximum number of requests per second, across all concurrent transfers (default: unlimited).
+\t--max-workers=\t\tMaximum number of shards to transfer concurrently (default: number of shards, up to 16).
+\t--multipart-chunksize=\tSize, in bytes, of each part of a shard (default: 8388608, raised as needed for very large shards).
+\t--progress\t\tDisplay a single, continuously updated line of progress, including throughput and estimated time remaining, in place of a message for each shard.
+\t--shard-size=\t\tTarget size, in bytes, of each shard (default: 1073741824).
+\t--verify\t\tVerify each shard against its checksum while it is being uploaded. Shards that do not match are uploaded again, and reported as failed if they still do not match.
+
+Note: Shards are named 'shard-000000.tar', 'shard-000001.tar', etc., and the shard index is named 'index.json.gz'. The index is only written if all shards are pushed successfully; if any shard fails, the command exits with a non-zero status.
+
+Note: Bandwidth and request rate limits that are not specified are taken from the config file, if present there, along with any time-of-day schedule of limits; limits that are specified as options apply at all times of day.
+
+Note: Progress (--progress) is updated in place every second when output is to a terminal, and is otherwise printed as a new line every second. Throughput is measured over the last few seconds.
+
+Examples:
+\tnetapp_dataops_cli.py push-to-s3 shards --bucket=imagenet --key-prefix=train/ --directory=/mnt/imagenet/train
+\tnetapp_dataops_cli.py push-to-s3 shards -b imagenet -p train/ -d /mnt/imagenet/train --shard-size=268435456 --max-workers=32
+\tnetapp_dataops_cli.py push-to-s3 shards -b imagenet -p train/ -d /mnt/imagenet/train --progress
 '''
 helpTextPushToS3File = '''
 Command: push-to-s3 file
@@ -404,6 +629,17 @@ Optional Options/Arguments:
 \t-e, --extra-args=\tExtra args to apply to newly-pushed S3 object (For details on this field, refer to https://boto3.amazonaws.com/v1/documentation/api/latest/guide/s3-uploading-files.html#the-extraargs-parameter).
 \t-h, --help\t\tPrint help text.
 \t-k, --key=\t\tKey to assign to newly-pushed S3 object (if not specified, key will be set to value of -f/--file argument).
+\t--max-bandwidth=\tMaximum bandwidth, in bytes per second, of all requests combined (default: unlimited).
+\t--max-concurrency=\tMaximum number of concurrent requests per object (default: auto-tuned).
+\t--max-io-queue=\t\tMaximum number of read/write tasks to queue per object (default: auto-tuned).
+\t--max-rps=\t\tMaximum number of requests per second, across all concurrent transfers (default: unlimited).
+\t--multipart-chunksize=\tSize, in bytes, of each part of a multipart transfer (default: auto-tuned).
+\t--multipart-threshold=\tSize, in bytes, above which objects are transferred in multiple parts (default: auto-tuned).
+\t--verify\t\tVerify the object against its checksum while it is being uploaded.
+
+Note: Transfer settings that are not specified are taken from the config file, if present there, and are otherwise auto-tuned based on the size of the file being transferred.
+
+Note: Bandwidth and request rate limits that are not specified are taken from the config file, if present there, along with any time-of-day schedule of limits; limits that are specified as options apply at all times of day.
 
 Examples:
 \tnetapp_dataops_cli.py push-to-s3 file --bucket=project1 --file=data.csv
@@ -710,6 +946,49 @@ def getTarget(args: list) -> str:
     return target
 
 
+def getS3TransferOptions(opts: list, helpText: str) -> dict:
+    # Retrieve S3 transfer settings from command line options
+    s3TransferOptions = dict()
+    for opt, arg in opts:
+        if opt in ("--listing-workers", "--max-retries", "--shard-size", "--max-workers", "--multipart-threshold", "--multipart-chunksize", "--max-concurrency", "--max-io-queue", "--max-bandwidth", "--max-rps"):
+            try:
+                s3TransferOptions[opt[2:].replace("-", "_")] = int(arg)
+            except ValueError:
+                print("Error: " + opt + " must be an integer.")
+                handleInvalidCommand(helpText=helpText, invalidOptArg=True)
+            if opt in ("--max-bandwidth", "--max-rps") and s3TransferOptions[opt[2:].replace("-", "_")] <= 0:
+                print("Error: " + opt + " must be greater than 0.")
+                handleInvalidCommand(helpText=helpText, invalidOptArg=True)
+    return s3TransferOptions
+
+
+def printS3Progress(progress: dict):
+    # Render progress of a bulk S3 transfer as a single line, updated in place when output is to a terminal
+    totalsMark = "" if progress["Totals Final"] else "+"
+    line = str(progress["Objects"]) + "/" + str(progress["Total Objects"]) + totalsMark + " objects, "
+    line += traditional._convert_bytes_to_pretty_size(progress["Bytes"]) + "/" + traditional._convert_bytes_to_pretty_size(progress["Total Bytes"]) + totalsMark
+    if progress["Total Bytes"]:
+        line += " (" + str(min(int(progress["Bytes"] * 100 / progress["Total Bytes"]), 100)) + "%)"
+    if progress["Complete"]:
+        line += ", " + traditional._convert_bytes_to_pretty_size(progress["Average Throughput"]) + "/s average"
+    else:
+        line += ", " + traditional._convert_bytes_to_pretty_size(progress["Throughput"]) + "/s"
+        if progress["ETA"] is not None:
+            minutes, seconds = divmod(int(progress["ETA"]), 60)
+            hours, minutes = divmod(minutes, 60)
+            line += ", ETA " + ("%d:%02d:%02d" % (hours, minutes, seconds))
+    if progress["Failures"]:
+        line += ", " + str(progress["Failures"]) + " failed"
+
+    if sys.stdout.isatty():
+        sys.stdout.write("\r" + line + "\033[K")
+        if progress["Complete"]:
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+    else:
+        print(line, flush=True)
+
+
 def handleInvalidCommand(helpText: str = helpTextStandard, invalidOptArg: bool = False):
     if invalidOptArg:
         print("Error: Invalid option/argument.")
@@ -753,10 +1032,13 @@ if __name__ == '__main__':
             snapshotPolicy = None
             exportHosts = None
             svmDrUnprotect = False
+            count = None
+            namesFile = None
+            maxWorkers = 8
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hl:c:t:n:v:s:m:u:g:j:xe:p:i:srd", ["help", "cluster-name=", "source-svm=","target-svm=","name=", "source-volume=", "source-snapshot=", "mountpoint=", "uid=", "gid=", "junction=", "readonly","export-hosts=","export-policy=","snapshot-policy=","split","refresh","svm-dr-unprotect"])
+                opts, args = getopt.getopt(sys.argv[3:], "hl:c:t:n:v:s:m:u:g:j:xe:p:i:srd", ["help", "cluster-name=", "source-svm=","target-svm=","name=", "source-volume=", "source-snapshot=", "mountpoint=", "uid=", "gid=", "junction=", "readonly","export-hosts=","export-policy=","snapshot-policy=","split","refresh","svm-dr-unprotect","count=","names-file=","max-workers="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextCloneVolume, invalidOptArg=True)
@@ -800,6 +1082,44 @@ if __name__ == '__main__':
                     snapshotPolicy = arg                     
                 elif opt in ("-e", "--export-hosts"):
                     exportHosts = arg                                                        
+                elif opt == "--count":
+                    count = arg
+                elif opt == "--names-file":
+                    namesFile = arg
+                elif opt == "--max-workers":
+                    maxWorkers = arg
+
+            # Bulk clone
+            if count or namesFile:
+                if not sourceVolumeName or (count and not newVolumeName) or (count and namesFile) or (namesFile and newVolumeName):
+                    handleInvalidCommand(helpText=helpTextCloneVolume, invalidOptArg=True)
+                if mountpoint or junction or exportHosts or split or refresh or svmDrUnprotect:
+                    print("Error: mountpoint, junction, export-hosts, split, refresh and svm-dr-unprotect options are not supported when creating clones in bulk.")
+                    handleInvalidCommand(helpText=helpTextCloneVolume, invalidOptArg=True)
+                try:
+                    maxWorkers = int(maxWorkers)
+                    if count:
+                        newVolumeNames = [newVolumeName + "_" + str(i) for i in range(1, int(count) + 1)]
+                except ValueError:
+                    print("Error: --count and --max-workers must be integers.")
+                    handleInvalidCommand(helpText=helpTextCloneVolume, invalidOptArg=True)
+                if namesFile:
+                    try:
+                        with open(os.path.expanduser(namesFile)) as file:
+                            newVolumeNames = [line.strip() for line in file if line.strip()]
+                    except OSError as err:
+                        print("Error: could not read names file: ", err)
+                        sys.exit(1)
+
+                try:
+                    results = clone_volumes_bulk(new_volume_names=newVolumeNames, source_volume_name=sourceVolumeName, source_snapshot_name=sourceSnapshotName,
+                                                 cluster_name=clusterName, source_svm=sourceSVM, target_svm=targetSVM, export_policy=exportPolicy,
+                                                 snapshot_policy=snapshotPolicy, unix_uid=unixUID, unix_gid=unixGID, max_workers=maxWorkers, print_output=True)
+                except (InvalidConfigError, APIConnectionError, InvalidSnapshotParameterError, InvalidVolumeParameterError):
+                    sys.exit(1)
+                if [result for result in results if result["Status"] != "success"]:
+                    sys.exit(1)
+                sys.exit(0)
 
             # Check for required options
             if not newVolumeName or not sourceVolumeName:
@@ -851,10 +1171,13 @@ if __name__ == '__main__':
             retentionCount = 0
             retentionDays = False
             snapmirrorLabel = None
+            volumeNames = None
+            consistent = True
+            maxWorkers = 8
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hn:v:s:r:u:l:", ["cluster-name=","help", "svm=", "name=", "volume=", "retention=", "snapmirror-label="])
+                opts, args = getopt.getopt(sys.argv[3:], "hn:v:s:r:u:l:", ["cluster-name=","help", "svm=", "name=", "volume=", "retention=", "snapmirror-label=", "volumes=", "not-consistent", "max-workers="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextCreateSnapshot, invalidOptArg=True)
@@ -876,6 +1199,31 @@ if __name__ == '__main__':
                     volumeName = arg
                 elif opt in ("-l", "--snapmirror-label"):
                     snapmirrorLabel = arg                    
+                elif opt == "--volumes":
+                    volumeNames = [name.strip() for name in arg.split(",") if name.strip()]
+                elif opt == "--not-consistent":
+                    consistent = False
+                elif opt == "--max-workers":
+                    maxWorkers = arg
+
+            # Snapshot many volumes
+            if volumeNames:
+                if volumeName or retentionCount:
+                    handleInvalidCommand(helpText=helpTextCreateSnapshot, invalidOptArg=True)
+                try:
+                    maxWorkers = int(maxWorkers)
+                except ValueError:
+                    print("Error: --max-workers must be an integer.")
+                    handleInvalidCommand(helpText=helpTextCreateSnapshot, invalidOptArg=True)
+
+                try:
+                    results = create_snapshots(volume_names=volumeNames, snapshot_name=snapshotName, cluster_name=clusterName, svm_name=svmName,
+                                               snapmirror_label=snapmirrorLabel, consistent=consistent, max_workers=maxWorkers, print_output=True)
+                except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError):
+                    sys.exit(1)
+                if [result for result in results if result["Status"] != "success"]:
+                    sys.exit(1)
+                sys.exit(0)
 
             # Check for required options
             if not volumeName:
@@ -1220,6 +1568,33 @@ if __name__ == '__main__':
             except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError):
                 sys.exit(1)
 
+        elif target in ("data-lif", "data-lifs", "lif", "lifs"):
+            svmName = None
+            clusterName = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hv:u:", ["cluster-name=","help", "svm="])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextListDataLifs, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextListDataLifs)
+                    sys.exit(0)
+                elif opt in ("-v", "--svm"):
+                    svmName = arg
+                elif opt in ("-u", "--cluster-name"):
+                    clusterName = arg
+
+            # List data LIFs
+            try:
+                list_data_lifs(cluster_name=clusterName, svm_name=svmName, print_output=True)
+            except (InvalidConfigError, APIConnectionError):
+                sys.exit(1)
+
         elif target in ("volume", "vol", "volumes", "vols"):
             includeSpaceUsageDetails = False
             svmName = None
@@ -1265,9 +1640,14 @@ if __name__ == '__main__':
             lifName = None 
             mountpoint = None
             readonly = False
+            mountOptions = None
+            lifPolicy = None
+            count = None
+            namesFile = None
+            maxWorkers = 8
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hv:n:l:m:u:", ["cluster-name=","help", "lif=","svm=", "name=", "mountpoint=", "readonly"])
+                opts, args = getopt.getopt(sys.argv[3:], "hv:n:l:m:u:xo:", ["cluster-name=","help", "lif=","svm=", "name=", "mountpoint=", "readonly", "options=", "lif-policy=", "count=", "names-file=", "max-workers="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextMountVolume, invalidOptArg=True)
@@ -1289,10 +1669,52 @@ if __name__ == '__main__':
                     mountpoint = arg
                 elif opt in ("-x", "--readonly"):
                     readonly = True
+                elif opt in ("-o", "--options"):
+                    mountOptions = arg
+                elif opt == "--lif-policy":
+                    lifPolicy = arg
+                elif opt == "--count":
+                    count = arg
+                elif opt == "--names-file":
+                    namesFile = arg
+                elif opt == "--max-workers":
+                    maxWorkers = arg
+
+            # Bulk mount
+            if count or namesFile:
+                if not mountpoint or (count and not volumeName) or (count and namesFile) or (namesFile and volumeName):
+                    handleInvalidCommand(helpText=helpTextMountVolume, invalidOptArg=True)
+                try:
+                    maxWorkers = int(maxWorkers)
+                    if count:
+                        volumeNames = [volumeName + "_" + str(i) for i in range(1, int(count) + 1)]
+                except ValueError:
+                    print("Error: --count and --max-workers must be integers.")
+                    handleInvalidCommand(helpText=helpTextMountVolume, invalidOptArg=True)
+                if namesFile:
+                    try:
+                        with open(os.path.expanduser(namesFile)) as file:
+                            volumeNames = [line.strip() for line in file if line.strip()]
+                    except OSError as err:
+                        print("Error: could not read names file: ", err)
+                        sys.exit(1)
+                lifNames = None
+                if lifName:
+                    lifNames = [lif.strip() for lif in lifName.split(",") if lif.strip()]
+
+                try:
+                    results = mount_volumes(volume_names=volumeNames, mountpoints=[os.path.join(mountpoint, name) for name in volumeNames],
+                                            cluster_name=clusterName, svm_name=svmName, lif_names=lifNames, readonly=readonly,
+                                            mount_options=mountOptions, lif_policy=lifPolicy, max_workers=maxWorkers, print_output=True)
+                except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
+                    sys.exit(1)
+                if [result for result in results if result["Status"] != "success"]:
+                    sys.exit(1)
+                sys.exit(0)
 
             # Mount volume
             try:
-                mount_volume(svm_name = svmName, cluster_name=clusterName, lif_name = lifName, volume_name=volumeName, mountpoint=mountpoint, readonly=readonly, print_output=True)
+                mount_volume(svm_name = svmName, cluster_name=clusterName, lif_name = lifName, volume_name=volumeName, mountpoint=mountpoint, readonly=readonly, mount_options=mountOptions, lif_policy=lifPolicy, print_output=True)
             except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
                 sys.exit(1)
 
@@ -1306,9 +1728,12 @@ if __name__ == '__main__':
         # Invoke desired action based on target
         if target in ("volume", "vol"):
             mountpoint = None
+            nested = False
+            mountpointsFile = None
+            maxWorkers = 8
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hm:", ["help", "mountpoint="])
+                opts, args = getopt.getopt(sys.argv[3:], "hm:", ["help", "mountpoint=", "nested", "mountpoints-file=", "max-workers="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextUnmountVolume, invalidOptArg=True)
@@ -1320,6 +1745,44 @@ if __name__ == '__main__':
                     sys.exit(0)
                 elif opt in ("-m", "--mountpoint"):
                     mountpoint = arg
+                elif opt == "--nested":
+                    nested = True
+                elif opt == "--mountpoints-file":
+                    mountpointsFile = arg
+                elif opt == "--max-workers":
+                    maxWorkers = arg
+
+            # Bulk unmount
+            if nested or mountpointsFile:
+                if (nested and not mountpoint) or (mountpointsFile and mountpoint):
+                    handleInvalidCommand(helpText=helpTextUnmountVolume, invalidOptArg=True)
+                try:
+                    maxWorkers = int(maxWorkers)
+                except ValueError:
+                    print("Error: --max-workers must be an integer.")
+                    handleInvalidCommand(helpText=helpTextUnmountVolume, invalidOptArg=True)
+                if nested:
+                    parentMountpoint = os.path.realpath(os.path.expanduser(mountpoint))
+                    mountpoints = sorted(localMountpoint for localMountpoint in traditional._read_local_mounts().sources_by_mountpoint
+                                         if os.path.dirname(localMountpoint) == parentMountpoint)
+                    if not mountpoints:
+                        print("Error: No volumes are mounted beneath '" + mountpoint + "'.")
+                        sys.exit(1)
+                else:
+                    try:
+                        with open(os.path.expanduser(mountpointsFile)) as file:
+                            mountpoints = [line.strip() for line in file if line.strip()]
+                    except OSError as err:
+                        print("Error: could not read mountpoints file: ", err)
+                        sys.exit(1)
+
+                try:
+                    results = unmount_volumes(mountpoints=mountpoints, max_workers=maxWorkers, print_output=True)
+                except (InvalidVolumeParameterError, MountOperationError):
+                    sys.exit(1)
+                if [result for result in results if result["Status"] != "success"]:
+                    sys.exit(1)
+                sys.exit(0)
 
             # Check for required options
             if not mountpoint:
@@ -1384,10 +1847,16 @@ if __name__ == '__main__':
             s3Bucket = None
             s3ObjectKeyPrefix = ""
             localDirectory = None
+            sync = False
+            delete = False
+            resume = False
+            verify = False
+            progress = False
+            listingShardPrefixes = None
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:", ["help", "bucket=", "key-prefix=", "directory="])
+                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:", ["help", "bucket=", "key-prefix=", "directory=", "sync", "delete", "resume", "verify", "listing-shards=", "listing-workers=", "max-retries=", "max-workers=", "multipart-threshold=", "multipart-chunksize=", "max-concurrency=", "max-io-queue=", "max-bandwidth=", "max-rps=", "progress"])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
@@ -1403,25 +1872,44 @@ if __name__ == '__main__':
                     s3ObjectKeyPrefix = arg
                 elif opt in ("-d", "--directory"):
                     localDirectory = arg
+                elif opt == "--sync":
+                    sync = True
+                elif opt == "--delete":
+                    delete = True
+                elif opt == "--resume":
+                    resume = True
+                elif opt == "--verify":
+                    verify = True
+                elif opt == "--progress":
+                    progress = True
+                elif opt == "--listing-shards":
+                    listingShardPrefixes = arg.split(",")
 
             # Check for required options
             if not s3Bucket or not localDirectory:
                 handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+            if delete and not sync:
+                print("Error: --delete is only supported in sync mode (--sync).")
+                handleInvalidCommand(helpText=helpTextPullFromS3Bucket, invalidOptArg=True)
+            s3TransferOptions = getS3TransferOptions(opts=opts, helpText=helpTextPullFromS3Bucket)
 
             # Push file to S3
             try:
-                pull_bucket_from_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, print_output=True)
+                report = pull_bucket_from_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, sync=sync, delete=delete, resume=resume, verify=verify, listing_shard_prefixes=listingShardPrefixes, progress_callback=printS3Progress if progress else None, print_output=True, **s3TransferOptions)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
+            if report["Failures"]:
+                sys.exit(1)
 
         elif target in ("object", "file"):
             s3Bucket = None
             s3ObjectKey = None
             localFile = None
+            verify = False
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hb:k:f:", ["help", "bucket=", "key=", "file=", "extra-args="])
+                opts, args = getopt.getopt(sys.argv[3:], "hb:k:f:", ["help", "bucket=", "key=", "file=", "extra-args=", "verify", "multipart-threshold=", "multipart-chunksize=", "max-concurrency=", "max-io-queue=", "max-bandwidth=", "max-rps="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextPullFromS3Object, invalidOptArg=True)
@@ -1437,14 +1925,97 @@ if __name__ == '__main__':
                     s3ObjectKey = arg
                 elif opt in ("-f", "--file"):
                     localFile = arg
+                elif opt == "--verify":
+                    verify = True
 
             # Check for required options
             if not s3Bucket or not s3ObjectKey:
                 handleInvalidCommand(helpText=helpTextPullFromS3Object, invalidOptArg=True)
+            s3TransferOptions = getS3TransferOptions(opts=opts, helpText=helpTextPullFromS3Object)
 
             # Push file to S3
             try:
-                pull_object_from_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, print_output=True)
+                pull_object_from_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, verify=verify, print_output=True, **s3TransferOptions)
+            except (InvalidConfigError, APIConnectionError):
+                sys.exit(1)
+
+        elif target in ("shards", "shard"):
+            s3Bucket = None
+            s3ObjectKeyPrefix = ""
+            localDirectory = None
+            verify = False
+            progress = False
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:", ["help", "bucket=", "key-prefix=", "directory=", "verify", "max-retries=", "max-workers=", "max-bandwidth=", "max-rps=", "progress"])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextPullFromS3Shards, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextPullFromS3Shards)
+                    sys.exit(0)
+                elif opt in ("-b", "--bucket"):
+                    s3Bucket = arg
+                elif opt in ("-p", "--key-prefix"):
+                    s3ObjectKeyPrefix = arg
+                elif opt in ("-d", "--directory"):
+                    localDirectory = arg
+                elif opt == "--verify":
+                    verify = True
+                elif opt == "--progress":
+                    progress = True
+
+            # Check for required options
+            if not s3Bucket or not localDirectory:
+                handleInvalidCommand(helpText=helpTextPullFromS3Shards, invalidOptArg=True)
+            s3TransferOptions = getS3TransferOptions(opts=opts, helpText=helpTextPullFromS3Shards)
+
+            # Pull shards from S3
+            try:
+                report = pull_shards_from_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, verify=verify, progress_callback=printS3Progress if progress else None, print_output=True, **s3TransferOptions)
+            except (InvalidConfigError, APIConnectionError):
+                sys.exit(1)
+            if report["Failures"]:
+                sys.exit(1)
+
+        elif target in ("shard-member", "member"):
+            s3Bucket = None
+            s3ObjectKeyPrefix = ""
+            memberName = None
+            localFile = None
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hb:p:m:f:", ["help", "bucket=", "key-prefix=", "member=", "file="])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextPullFromS3ShardMember, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextPullFromS3ShardMember)
+                    sys.exit(0)
+                elif opt in ("-b", "--bucket"):
+                    s3Bucket = arg
+                elif opt in ("-p", "--key-prefix"):
+                    s3ObjectKeyPrefix = arg
+                elif opt in ("-m", "--member"):
+                    memberName = arg
+                elif opt in ("-f", "--file"):
+                    localFile = arg
+
+            # Check for required options
+            if not s3Bucket or not memberName:
+                handleInvalidCommand(helpText=helpTextPullFromS3ShardMember, invalidOptArg=True)
+
+            # Pull shard member from S3
+            try:
+                pull_shard_member_from_s3(s3_bucket=s3Bucket, member_name=memberName, local_file=localFile, s3_object_key_prefix=s3ObjectKeyPrefix, print_output=True)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
 
@@ -1461,10 +2032,15 @@ if __name__ == '__main__':
             s3ObjectKeyPrefix = ""
             localDirectory = None
             s3ExtraArgs = None
+            sync = False
+            delete = False
+            resume = False
+            verify = False
+            progress = False
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:", ["help", "bucket=", "key-prefix=", "directory=", "extra-args="])
+                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:", ["help", "bucket=", "key-prefix=", "directory=", "extra-args=", "sync", "delete", "resume", "verify", "max-retries=", "max-workers=", "multipart-threshold=", "multipart-chunksize=", "max-concurrency=", "max-io-queue=", "max-bandwidth=", "max-rps=", "progress"])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
@@ -1482,26 +2058,43 @@ if __name__ == '__main__':
                     localDirectory = arg
                 elif opt in ("-e", "--extra-args"):
                     s3ExtraArgs = arg
+                elif opt == "--sync":
+                    sync = True
+                elif opt == "--delete":
+                    delete = True
+                elif opt == "--resume":
+                    resume = True
+                elif opt == "--verify":
+                    verify = True
+                elif opt == "--progress":
+                    progress = True
 
             # Check for required options
             if not s3Bucket or not localDirectory:
                 handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
+            if delete and not sync:
+                print("Error: --delete is only supported in sync mode (--sync).")
+                handleInvalidCommand(helpText=helpTextPushToS3Directory, invalidOptArg=True)
+            s3TransferOptions = getS3TransferOptions(opts=opts, helpText=helpTextPushToS3Directory)
 
             # Push file to S3
             try:
-                push_directory_to_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, s3_extra_args=s3ExtraArgs, print_output=True)
+                report = push_directory_to_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, s3_extra_args=s3ExtraArgs, sync=sync, delete=delete, resume=resume, verify=verify, progress_callback=printS3Progress if progress else None, print_output=True, **s3TransferOptions)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
+            if report["Failures"]:
+                sys.exit(1)
 
         elif target in ("file"):
             s3Bucket = None
             s3ObjectKey = None
             localFile = None
             s3ExtraArgs = None
+            verify = False
 
             # Get command line options
             try:
-                opts, args = getopt.getopt(sys.argv[3:], "hb:k:f:e:", ["help", "bucket=", "key=", "file=", "extra-args="])
+                opts, args = getopt.getopt(sys.argv[3:], "hb:k:f:e:", ["help", "bucket=", "key=", "file=", "extra-args=", "verify", "multipart-threshold=", "multipart-chunksize=", "max-concurrency=", "max-io-queue=", "max-bandwidth=", "max-rps="])
             except Exception as err:                
                 print(err)
                 handleInvalidCommand(helpText=helpTextPushToS3File, invalidOptArg=True)
@@ -1519,16 +2112,65 @@ if __name__ == '__main__':
                     localFile = arg
                 elif opt in ("-e", "--extra-args"):
                     s3ExtraArgs = arg
+                elif opt == "--verify":
+                    verify = True
 
             # Check for required options
             if not s3Bucket or not localFile:
                 handleInvalidCommand(helpText=helpTextPushToS3File, invalidOptArg=True)
+            s3TransferOptions = getS3TransferOptions(opts=opts, helpText=helpTextPushToS3File)
 
             # Push file to S3
             try:
-                push_file_to_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, s3_extra_args=s3ExtraArgs, print_output=True)
+                push_file_to_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, s3_extra_args=s3ExtraArgs, verify=verify, print_output=True, **s3TransferOptions)
+            except (InvalidConfigError, APIConnectionError):
+                sys.exit(1)
+
+        elif target in ("shards", "shard"):
+            s3Bucket = None
+            s3ObjectKeyPrefix = ""
+            localDirectory = None
+            s3ExtraArgs = None
+            verify = False
+            progress = False
+
+            # Get command line options
+            try:
+                opts, args = getopt.getopt(sys.argv[3:], "hb:p:d:e:", ["help", "bucket=", "key-prefix=", "directory=", "extra-args=", "verify", "shard-size=", "max-retries=", "max-workers=", "multipart-chunksize=", "max-bandwidth=", "max-rps=", "progress"])
+            except Exception as err:
+                print(err)
+                handleInvalidCommand(helpText=helpTextPushToS3Shards, invalidOptArg=True)
+
+            # Parse command line options
+            for opt, arg in opts:
+                if opt in ("-h", "--help"):
+                    print(helpTextPushToS3Shards)
+                    sys.exit(0)
+                elif opt in ("-b", "--bucket"):
+                    s3Bucket = arg
+                elif opt in ("-p", "--key-prefix"):
+                    s3ObjectKeyPrefix = arg
+                elif opt in ("-d", "--directory"):
+                    localDirectory = arg
+                elif opt in ("-e", "--extra-args"):
+                    s3ExtraArgs = arg
+                elif opt == "--verify":
+                    verify = True
+                elif opt == "--progress":
+                    progress = True
+
+            # Check for required options
+            if not s3Bucket or not localDirectory:
+                handleInvalidCommand(helpText=helpTextPushToS3Shards, invalidOptArg=True)
+            s3TransferOptions = getS3TransferOptions(opts=opts, helpText=helpTextPushToS3Shards)
+
+            # Push shards to S3
+            try:
+                report = push_directory_to_s3_as_shards(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, s3_extra_args=s3ExtraArgs, verify=verify, progress_callback=printS3Progress if progress else None, print_output=True, **s3TransferOptions)
             except (InvalidConfigError, APIConnectionError):
                 sys.exit(1)
+            if report["Failures"]:
+                sys.exit(1)
 
         else:
             handleInvalidCommand()
@@ -0,0 +1,5633 @@
+"""NetApp DataOps Toolkit for Traditional Environments import module.
+
+This module provides the public functions available to be imported directly
+by applications using the import method of utilizing the toolkit.
+"""
+
+from __future__ import annotations
+
+import base64
+import collections
+import functools
+import gzip
+import hashlib
+import importlib
+import itertools
+import json
+import math
+import os
+import queue
+import random
+import re
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import types
+import uuid
+import warnings
+import zlib
+import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+
+
+class _LazyModule(types.ModuleType):
+    """Stand-in for a module that imports the module the first time that one
+    of its attributes is accessed or set.
+
+    boto3, netapp_ontap, requests, tabulate and yaml account for most of the
+    time that it takes to import the toolkit, and most commands only use some
+    of them, so they are imported on first use instead of when the toolkit is
+    imported.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(importlib.import_module(self.__name__), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(importlib.import_module(self.__name__), name, value)
+
+
+boto3 = _LazyModule("boto3")
+boto3Exceptions = _LazyModule("boto3.exceptions")
+boto3Transfer = _LazyModule("boto3.s3.transfer")
+botocoreClient = _LazyModule("botocore.client")
+botocoreExceptions = _LazyModule("botocore.exceptions")
+s3transferUtils = _LazyModule("s3transfer.utils")
+netappConfig = _LazyModule("netapp_ontap.config")
+netappError = _LazyModule("netapp_ontap.error")
+netappHostConnection = _LazyModule("netapp_ontap.host_connection")
+netappResources = _LazyModule("netapp_ontap.resources")
+requests = _LazyModule("requests")
+tabulate = _LazyModule("tabulate")
+yaml = _LazyModule("yaml")
+
+
+__version__ = "2.4.0"
+
+
+# Number of records to request per page when retrieving collections from the ONTAP API
+_COLLECTION_PAGE_SIZE = 500
+
+# Snapshot fields that are retrieved as part of snapshot collection queries
+_SNAPSHOT_FIELDS = "name,create_time,uuid,snapmirror_label,owners"
+
+# Maximum number of values to combine into a single "a|b|c" query filter
+_QUERY_BATCH_SIZE = 50
+
+# ONTAP job states that indicate that a job will not make any further progress
+_JOB_TERMINAL_STATES = ("success", "failure", "cancelled", "expired")
+
+# State of a job that ONTAP no longer has a record of
+_JOB_UNKNOWN_STATE = "unknown"
+
+# Mount table of the current process; lists the source and mountpoint of each local mount
+_MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+# Policies for picking the data LIF that a volume is mounted through
+_DATA_LIF_POLICIES = ("round-robin", "client-hash", "local")
+
+
+# Using this decorator in lieu of using a dependency to manage deprecation
+def deprecated(func):
+    @functools.wraps(func)
+    def warned_func(*args, **kwargs):
+        warnings.warn("Function {} is deprecated.".format(func.__name__),
+                      category=DeprecationWarning,
+                      stacklevel=2)
+        return func(*args, **kwargs)
+    return warned_func
+
+
+class CloudSyncSyncOperationError(Exception) :
+    """Error that will be raised when a Cloud Sync sync operation fails"""
+    pass
+
+
+class ConnectionTypeError(Exception):
+    """Error that will be raised when an invalid connection type is given"""
+    pass
+
+
+class InvalidConfigError(Exception):
+    """Error that will be raised when the config file is invalid or missing"""
+    pass
+
+
+class InvalidSnapMirrorParameterError(Exception) :
+    """Error that will be raised when an invalid SnapMirror parameter is given"""
+    pass
+
+
+class InvalidSnapshotParameterError(Exception):
+    """Error that will be raised when an invalid snapshot parameter is given"""
+    pass
+
+
+class InvalidVolumeParameterError(Exception):
+    """Error that will be raised when an invalid volume parameter is given"""
+    pass
+
+
+class MountOperationError(Exception):
+    """Error that will be raised when a mount operation fails"""
+    pass
+
+
+class SnapMirrorSyncOperationError(Exception) :
+    """Error that will be raised when a SnapMirror sync operation fails"""
+    pass
+
+
+class APIConnectionError(Exception) :
+    '''Error that will be raised when an API connection cannot be established'''
+    pass
+
+
+class JobHandle:
+    """Handle to an ONTAP job that was started by a toolkit operation invoked with wait_until_complete=False.
+
+    The handle remembers the ONTAP connection that the job was started on, so
+    that it can be polled after the toolkit has connected to another cluster.
+    Many handles can be waited on together with wait_all().
+    """
+
+    def __init__(self, uuid: str, description: str = None, connection: netappHostConnection.HostConnection = None):
+        self.uuid = uuid
+        self.description = description
+        self.message = None
+        # An operation that completed synchronously does not have a job
+        self.state = "queued" if uuid else "success"
+        self._connection = connection if connection else netappConfig.CONNECTION
+
+    def __repr__(self) -> str:
+        return "JobHandle(uuid=%r, description=%r, state=%r)" % (self.uuid, self.description, self.state)
+
+    def done(self) -> bool:
+        # Poll job once, without blocking
+        if self.state not in _JOB_TERMINAL_STATES:
+            wait_all([self], timeout=0)
+        return self.state in _JOB_TERMINAL_STATES
+
+    def wait(self, timeout: float = 120, poll_interval: float = 1) -> str:
+        wait_all([self], timeout=timeout, poll_interval=poll_interval)
+        return self.state
+
+
+class _ONTAPConnectionPool:
+    """Process-wide, thread-safe pool of ONTAP API connections.
+
+    Connections are keyed by (hostname, username, verifySSLCert) and reused
+    across toolkit calls so that the underlying requests session, and the
+    keep-alive TCP/TLS connections that it holds, survive between calls.
+    The least recently used connection is evicted once the pool is full, and
+    connections that have been idle for longer than the idle timeout are
+    closed on the next lookup.
+    """
+
+    def __init__(self, max_size: int = 8, idle_timeout: float = 300):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._connections = collections.OrderedDict()
+        self._stats = {
+            "Connections Created": 0,
+            "Connections Reused": 0,
+            "Connections Evicted": 0,
+            "New Connection Requests": 0,
+            "New Connection Request Time": 0.0,
+            "Reused Connection Requests": 0,
+            "Reused Connection Request Time": 0.0
+        }
+
+    def get(self, hostname: str, username: str, password: str, verify: bool) -> netappHostConnection.HostConnection:
+        key = (hostname, username, verify)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+
+            entry = self._connections.get(key)
+            if entry and entry["password"] == password:
+                entry["lastUsed"] = now
+                self._connections.move_to_end(key)
+                self._stats["Connections Reused"] += 1
+                return entry["connection"]
+            elif entry:
+                # Credentials changed since the connection was pooled
+                self._close(self._connections.pop(key))
+
+            connection = netappHostConnection.HostConnection(host=hostname, username=username, password=password, verify=verify)
+            self._stats["Connections Created"] += 1
+            if self.max_size <= 0:
+                return connection
+
+            self._track_request_timing(connection)
+            self._connections[key] = {"connection": connection, "password": password, "lastUsed": now}
+            while len(self._connections) > self.max_size:
+                self._close(self._connections.popitem(last=False)[1])
+            return connection
+
+    def configure(self, max_size: int = None, idle_timeout: float = None):
+        with self._lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout
+            while len(self._connections) > max(self.max_size, 0):
+                self._close(self._connections.popitem(last=False)[1])
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["Pooled Connections"] = len(self._connections)
+        return stats
+
+    def _evict_idle(self, now: float):
+        for key in [key for key, entry in self._connections.items() if now - entry["lastUsed"] > self.idle_timeout]:
+            self._close(self._connections.pop(key))
+
+    def _close(self, entry: dict):
+        self._stats["Connections Evicted"] += 1
+        session = getattr(entry["connection"], "_request_session", None)
+        if session:
+            session.close()
+
+    def _track_request_timing(self, connection: netappHostConnection.HostConnection):
+        # A request that caused urllib3 to open a new connection paid for the
+        # TCP/TLS handshake; every other request reused a kept-alive connection.
+        session = connection.session
+        seenConnections = dict()
+
+        def record_timing(response, *args, **kwargs):
+            pool = getattr(response.raw, "_pool", None)
+            numConnections = getattr(pool, "num_connections", 0)
+            elapsed = response.elapsed.total_seconds()
+            with self._lock:
+                if numConnections > seenConnections.get(id(pool), 0):
+                    seenConnections[id(pool)] = numConnections
+                    self._stats["New Connection Requests"] += 1
+                    self._stats["New Connection Request Time"] += elapsed
+                else:
+                    self._stats["Reused Connection Requests"] += 1
+                    self._stats["Reused Connection Request Time"] += elapsed
+
+        session.hooks["response"].append(record_timing)
+
+
+_connectionPool = _ONTAPConnectionPool()
+
+# Parsed config files, keyed by config file path; an entry is used for as long as the mtime, inode and size
+# of the config file are unchanged
+_configCache = dict()
+
+
+class _S3TransferJournal:
+    """Checkpoint journal for a bulk S3 transfer.
+
+    Records each object that has been transferred, and each multipart upload
+    that is in progress, so that an interrupted transfer can be resumed
+    without transferring completed objects, or completed parts of large
+    objects, again. A single journal is shared by all of the threads that
+    take part in a transfer.
+    """
+
+    def __init__(self, path: str, commit_interval: int = 100):
+        self.path = path
+        self.commit_interval = commit_interval
+        self._lock = threading.Lock()
+        self._uncommittedChanges = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS completed (key TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, etag TEXT)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS multipart_uploads (key TEXT PRIMARY KEY, upload_id TEXT, size INTEGER, mtime_ns INTEGER, part_size INTEGER)")
+        self._db.commit()
+
+    def completed(self) -> dict:
+        # Return dict of (size, mtime_ns, etag) tuples, keyed by object key
+        with self._lock:
+            return {key: (size, mtimeNs, etag) for key, size, mtimeNs, etag in self._db.execute("SELECT key, size, mtime_ns, etag FROM completed")}
+
+    def get_completed(self, key: str) -> tuple:
+        # Return (size, mtime_ns, etag) tuple, or None if object has not been transferred
+        with self._lock:
+            return self._db.execute("SELECT size, mtime_ns, etag FROM completed WHERE key = ?", (key,)).fetchone()
+
+    def mark_completed(self, key: str, size: int, mtime_ns: int = None, etag: str = None):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO completed (key, size, mtime_ns, etag) VALUES (?, ?, ?, ?)", (key, size, mtime_ns, etag))
+            self._db.execute("DELETE FROM multipart_uploads WHERE key = ?", (key,))
+            self._uncommittedChanges += 1
+            if self._uncommittedChanges >= self.commit_interval:
+                self._db.commit()
+                self._uncommittedChanges = 0
+
+    def multipart_uploads(self) -> dict:
+        # Return dict of (upload_id, size, mtime_ns, part_size) tuples, keyed by object key
+        with self._lock:
+            return {row[0]: row[1:] for row in self._db.execute("SELECT key, upload_id, size, mtime_ns, part_size FROM multipart_uploads")}
+
+    def get_multipart_upload(self, key: str) -> tuple:
+        with self._lock:
+            return self._db.execute("SELECT upload_id, size, mtime_ns, part_size FROM multipart_uploads WHERE key = ?", (key,)).fetchone()
+
+    def start_multipart_upload(self, key: str, upload_id: str, size: int, mtime_ns: int, part_size: int):
+        # Commit immediately, so that the upload can be resumed even if the transfer is interrupted right away
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO multipart_uploads (key, upload_id, size, mtime_ns, part_size) VALUES (?, ?, ?, ?, ?)",
+                             (key, upload_id, size, mtime_ns, part_size))
+            self._db.commit()
+            self._uncommittedChanges = 0
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM completed")
+            self._db.execute("DELETE FROM multipart_uploads")
+            self._db.commit()
+            self._uncommittedChanges = 0
+
+    def close(self, remove: bool = False):
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+        if remove:
+            os.remove(self.path)
+
+# Config file keys for S3 transfer settings, keyed by the name of the corresponding function parameter
+_S3_TRANSFER_SETTINGS_CONFIG_KEYS = {
+    "max_workers": "s3MaxWorkers",
+    "multipart_threshold": "s3MultipartThreshold",
+    "multipart_chunksize": "s3MultipartChunksize",
+    "max_concurrency": "s3MaxConcurrency",
+    "max_io_queue": "s3MaxIOQueue"
+}
+
+# Config file keys for S3 bandwidth (bytes per second) and request rate (requests per second) limits, keyed by the name
+# of the corresponding function parameter, and for the time-of-day schedule of limits that apply in place of them
+_S3_THROTTLE_CONFIG_KEYS = {
+    "max_bandwidth": "s3MaxBandwidth",
+    "max_rps": "s3MaxRps"
+}
+_S3_THROTTLE_SCHEDULE_CONFIG_KEY = "s3ThrottleSchedule"
+
+# Keys of the limits in an entry of an S3 throttle schedule, keyed by the name of the corresponding function parameter
+_S3_THROTTLE_SCHEDULE_KEYS = {
+    "max_bandwidth": "maxBandwidth",
+    "max_rps": "maxRps"
+}
+
+# Interval, in seconds, at which the time-of-day schedule of S3 limits is re-evaluated
+_S3_THROTTLE_SCHEDULE_INTERVAL = 1
+
+# Total number of concurrent S3 requests that auto-tuned transfer settings aim for
+_S3_TRANSFER_AUTO_CONCURRENCY = 64
+
+# Maximum number of parts in an S3 multipart upload
+_S3_MAX_MULTIPART_PARTS = 10000
+
+# Directory in which S3 sync manifests are stored
+_S3_SYNC_MANIFEST_DIR = "~/.netapp_dataops/s3_sync"
+
+# Number of S3 sync manifest updates after which the manifest is committed
+_S3_SYNC_MANIFEST_COMMIT_INTERVAL = 1000
+
+# Directory in which S3 transfer journals are stored
+_S3_TRANSFER_JOURNAL_DIR = "~/.netapp_dataops/s3_journal"
+
+# S3 error codes that indicate a transient failure, in addition to any 5xx response; BadDigest means that an upload
+# was corrupted in transit
+_S3_TRANSIENT_ERROR_CODES = ("RequestTimeout", "RequestTimeTooSkewed", "SlowDown", "Throttling", "ThrottlingException",
+                             "RequestLimitExceeded", "InternalError", "ServiceUnavailable", "BadDigest")
+
+# Backoff, in seconds, before the first retry of a failed S3 object transfer, and maximum backoff between retries
+_S3_RETRY_BASE_BACKOFF = 1
+_S3_RETRY_MAX_BACKOFF = 30
+
+# Number of S3 listing pages (of up to 1000 objects each) to prefetch while objects are being transferred
+_S3_LISTING_PREFETCH_PAGES = 4
+
+# Maximum number of levels of common prefixes to descend into when discovering S3 listing shards
+_S3_LISTING_MAX_SPLIT_DEPTH = 3
+
+# Interval, in seconds, at which the progress of bulk S3 transfers is reported, and period, in seconds, over which the
+# instantaneous throughput in progress reports is measured
+_S3_PROGRESS_INTERVAL = 1
+_S3_PROGRESS_THROUGHPUT_WINDOW = 5
+
+# Number of per-object latencies to sample for the latency percentiles in S3 transfer reports
+_S3_LATENCY_SAMPLE_SIZE = 100000
+
+# Default target size of the tar shards that small files are packed into, and default number of shards to transfer
+# concurrently
+_S3_DEFAULT_SHARD_SIZE = 1024 ** 3
+_S3_SHARD_DEFAULT_MAX_WORKERS = 16
+
+# Keys of tar shards and of the shard index, relative to the key prefix
+_S3_SHARD_KEY_FORMAT = "shard-{:06d}.tar"
+_S3_SHARD_INDEX_KEY = "index.json.gz"
+
+# Parsed shard indexes, keyed by (endpoint, bucket, index key); an entry is used for as long as the ETag of the
+# index object is unchanged
+_shardIndexCache = dict()
+
+# Flexible checksum response fields, in order of preference, and the hash algorithms of those that can be computed
+# here; CRC32C and CRC64NVME checksums are validated by botocore, but cannot be computed without the AWS CRT. The
+# ETag of an object that is not encrypted with SSE-KMS or SSE-C is the MD5 of its data.
+_S3_CHECKSUM_FIELDS = ("ChecksumCRC64NVME", "ChecksumCRC32C", "ChecksumCRC32", "ChecksumSHA1", "ChecksumSHA256")
+_S3_CHECKSUM_ALGORITHMS = {"ETag": "md5", "ChecksumCRC32": "crc32", "ChecksumSHA1": "sha1", "ChecksumSHA256": "sha256"}
+
+# Whether S3 endpoints store flexible checksums, keyed by endpoint URL; verified uploads to an endpoint that is known
+# not to store them also send the MD5 of their data
+_s3FlexibleChecksumSupport = dict()
+
+
+class _S3BucketLister:
+    """Lists the objects in an S3 bucket in a background thread.
+
+    Listing pages are handed to the consumer through a bounded queue, so that
+    a few pages are prefetched while the objects from earlier pages are being
+    transferred, and listing pauses whenever the consumer falls behind. Memory
+    usage therefore does not depend on the number of objects in the bucket.
+
+    With more than one listing worker, or with explicit shard prefixes, the
+    keyspace is split into shards that are listed concurrently. Unless shard
+    prefixes are given, shards are discovered by listing with a delimiter and
+    descending into the resulting common prefixes until there are at least as
+    many shards as listing workers.
+    """
+
+    def __init__(self, s3, bucket: str, prefix: str = "", shard_prefixes: list = None, listing_workers: int = 1,
+                 delimiter: str = "/", prefetch_pages: int = _S3_LISTING_PREFETCH_PAGES):
+        self.s3 = s3
+        self.bucket = bucket
+        self.prefix = prefix
+        self.shard_prefixes = shard_prefixes
+        self.listing_workers = listing_workers
+        self.delimiter = delimiter
+        self._queue = queue.Queue(maxsize=prefetch_pages)
+        self._stopEvent = threading.Event()
+        self._thread = threading.Thread(target=self._list, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        # Unblock the listing threads if they are waiting for room in the queue
+        self._stopEvent.set()
+
+    def pages(self):
+        # Yield lists of (key, size, etag) tuples, one per listing page; a listing error is raised in the consumer
+        while True:
+            page = self._queue.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+
+    def _list(self):
+        try:
+            if self.listing_workers > 1 or self.shard_prefixes is not None:
+                self._list_shards()
+            else:
+                self._list_prefix(self.prefix)
+        except Exception as err:
+            # Hand error to consumer, then stop any shards that are still being listed
+            self._put(err)
+            self._stopEvent.set()
+            return
+        self._put(None)
+
+    def _list_prefix(self, prefix: str):
+        for page in self.s3.get_paginator("list_objects_v2").paginate(Bucket=self.bucket, Prefix=prefix):
+            if not self._put(self._get_page_objects(page)):
+                return
+
+    def _split_prefix(self, prefix: str) -> list:
+        # List the objects directly under prefix, and return the common prefixes under it, each of which is a shard
+        commonPrefixes = list()
+        for page in self.s3.get_paginator("list_objects_v2").paginate(Bucket=self.bucket, Prefix=prefix, Delimiter=self.delimiter):
+            pageObjects = self._get_page_objects(page)
+            if pageObjects and not self._put(pageObjects):
+                return []
+            commonPrefixes.extend(commonPrefix["Prefix"] for commonPrefix in page.get("CommonPrefixes", []))
+        return commonPrefixes
+
+    def _list_shards(self):
+        # Values are the depth of shards that are being split, or None for shards that are being listed
+        executor = ThreadPoolExecutor(max_workers=self.listing_workers)
+        try:
+            if self.shard_prefixes is not None:
+                futures = {executor.submit(self._list_prefix, self.prefix + shardPrefix): None for shardPrefix in self.shard_prefixes}
+            else:
+                futures = {executor.submit(self._split_prefix, self.prefix): 0}
+            while futures:
+                doneFutures, pendingFutures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in doneFutures:
+                    depth = futures.pop(future)
+                    result = future.result()
+                    if depth is None or self._stopEvent.is_set():
+                        continue
+                    for shardPrefix in result:
+                        if len(futures) < self.listing_workers and depth + 1 < _S3_LISTING_MAX_SPLIT_DEPTH:
+                            futures[executor.submit(self._split_prefix, shardPrefix)] = depth + 1
+                        else:
+                            futures[executor.submit(self._list_prefix, shardPrefix)] = None
+        finally:
+            executor.shutdown(wait=False)
+
+    def _get_page_objects(self, page: dict) -> list:
+        return [(obj["Key"], obj["Size"], obj.get("ETag")) for obj in page.get("Contents", [])]
+
+    def _put(self, item) -> bool:
+        while not self._stopEvent.is_set():
+            try:
+                self._queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+class _S3TransferStats:
+    """Accumulates the results of the object transfers that make up a bulk S3
+    transfer, for the report that the transfer returns.
+
+    Per-object latencies are kept in a fixed-size random sample (reservoir
+    sampling), so that memory usage does not grow with the number of objects.
+    The reported percentiles are exact for transfers of up to sample_size
+    objects.
+    """
+
+    def __init__(self, sample_size: int = _S3_LATENCY_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self._objectCount = 0
+        self._bytes = 0
+        self._retries = 0
+        self._failedObjects = list()
+        self._latencies = list()
+        self._verifiedCount = 0
+        self._unverifiedCount = 0
+        self._checksumMismatchCount = 0
+
+    def add(self, key: str, size: int, result: dict, verified: bool = None):
+        # Add result returned by _run_s3_transfer; verified is True if the object was verified, False if it could not
+        # be verified, and None if verification was not requested
+        self._retries += result["Retries"]
+        if result["Error"]:
+            self._failedObjects.append({"Key": key, "Error": result["Error"]})
+            if result.get("Checksum Mismatch"):
+                self._checksumMismatchCount += 1
+            return
+        self._objectCount += 1
+        self._bytes += size
+        if verified is True:
+            self._verifiedCount += 1
+        elif verified is False:
+            self._unverifiedCount += 1
+        if len(self._latencies) < self.sample_size:
+            self._latencies.append(result["Latency"])
+        else:
+            sampleIndex = random.randrange(self._objectCount)
+            if sampleIndex < self.sample_size:
+                self._latencies[sampleIndex] = result["Latency"]
+
+    def report(self, skipped_object_count: int, elapsed_time: float) -> dict:
+        latencies = sorted(self._latencies)
+
+        def percentile(percent: float) -> float:
+            # Nearest-rank percentile
+            if not latencies:
+                return None
+            return latencies[max(0, math.ceil(percent / 100 * len(latencies)) - 1)]
+
+        return {
+            "Objects": self._objectCount,
+            "Bytes": self._bytes,
+            "Skipped": skipped_object_count,
+            "Failures": len(self._failedObjects),
+            "Failed Objects": list(self._failedObjects),
+            "Retries": self._retries,
+            "Elapsed Time": elapsed_time,
+            "Throughput": self._bytes / elapsed_time if elapsed_time > 0 else 0.0,
+            "Latency P50": percentile(50),
+            "Latency P99": percentile(99),
+            "Verified": self._verifiedCount,
+            "Unverified": self._unverifiedCount,
+            "Checksum Mismatches": self._checksumMismatchCount
+        }
+
+
+class _S3TokenBucket:
+    """Token bucket that limits the rate at which all threads together
+    consume a quantity, such as bytes or requests.
+
+    The bucket holds up to one second's worth of tokens, so short bursts are
+    absorbed. A consumer that takes more tokens than are available puts the
+    bucket into debt and sleeps until the debt would have been paid off, so
+    amounts larger than the bucket are allowed and the rate is enforced on
+    average. A rate of None means that consumption is unlimited.
+    """
+
+    def __init__(self, rate: float = None):
+        self._lock = threading.Lock()
+        self._rate = None
+        self._tokens = 0.0
+        self._lastRefill = time.monotonic()
+        self.set_rate(rate)
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            if rate == self._rate:
+                return
+            self._refill()
+            if self._rate is None:
+                # Start out with a full bucket when a limit is first applied
+                self._tokens = float(rate or 0)
+            elif rate is not None:
+                self._tokens = min(self._tokens, float(rate))
+            self._rate = rate
+
+    def consume(self, amount: float):
+        with self._lock:
+            if self._rate is None:
+                return
+            self._refill()
+            self._tokens -= amount
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+
+    def _refill(self):
+        now = time.monotonic()
+        if self._rate is not None:
+            self._tokens = min(float(self._rate), self._tokens + (now - self._lastRefill) * self._rate)
+        self._lastRefill = now
+
+
+class _S3ThrottledBody:
+    """Streaming S3 response body wrapper that consumes a token from a
+    bandwidth token bucket for each byte that is read from it.
+
+    Reading stops while the bucket is in debt, which in turn throttles the
+    sender through TCP flow control. The content length is verified by the
+    wrapped body, which also provides any other attributes.
+    """
+
+    def __init__(self, body, bucket: _S3TokenBucket):
+        self._body = body
+        self._bucket = bucket
+
+    def __getattr__(self, name: str):
+        return getattr(self._body, name)
+
+    def read(self, amt: int = None) -> bytes:
+        chunk = self._body.read(amt)
+        self._bucket.consume(len(chunk))
+        return chunk
+
+    def readinto(self, b) -> int:
+        amountRead = self._body.readinto(b)
+        self._bucket.consume(amountRead)
+        return amountRead
+
+    def iter_chunks(self, chunk_size: int = 1024):
+        return iter(lambda: self.read(chunk_size), b"")
+
+
+class _S3Throttle:
+    """Limits the bandwidth and request rate of all requests that are made
+    with the S3 clients that it is registered with, across all threads.
+
+    Every HTTP request, including requests that botocore retries, consumes a
+    token from the request rate bucket, and the body of every upload request
+    consumes tokens from the bandwidth bucket when the request is sent. The
+    bodies of downloads consume tokens from the bandwidth bucket as they are
+    read. The schedule is a list of (start minute, end minute, limits) tuples,
+    in local time; the limits of the first window that contains the current
+    time of day apply in place of the default limits.
+    """
+
+    def __init__(self, max_bandwidth: int = None, max_rps: int = None, schedule: list = None):
+        self._defaultLimits = {"max_bandwidth": max_bandwidth, "max_rps": max_rps}
+        self._schedule = schedule or list()
+        self._bandwidth = _S3TokenBucket()
+        self._requests = _S3TokenBucket()
+        self._scheduleLock = threading.Lock()
+        self._nextScheduleCheck = 0
+        self._update_limits()
+
+    def register(self, s3):
+        s3.meta.events.register("before-send.s3", self._before_send)
+        # Download bodies only need to be wrapped if bandwidth is limited at any time of day
+        if self._defaultLimits["max_bandwidth"] is not None or any("max_bandwidth" in limits for start, end, limits in self._schedule):
+            s3.meta.events.register("after-call.s3.GetObject", self._after_get_object)
+
+    def _update_limits(self):
+        now = time.monotonic()
+        if now < self._nextScheduleCheck:
+            return
+        with self._scheduleLock:
+            if now < self._nextScheduleCheck:
+                return
+            self._nextScheduleCheck = now + _S3_THROTTLE_SCHEDULE_INTERVAL
+            localTime = time.localtime()
+            minute = localTime.tm_hour * 60 + localTime.tm_min
+            limits = self._defaultLimits
+            for start, end, windowLimits in self._schedule:
+                if (start <= minute < end) if start < end else (minute >= start or minute < end):
+                    limits = dict(self._defaultLimits, **windowLimits)
+                    break
+            self._bandwidth.set_rate(limits["max_bandwidth"])
+            self._requests.set_rate(limits["max_rps"])
+
+    def _before_send(self, request, **kwargs):
+        # Returning None lets botocore send the request
+        self._update_limits()
+        self._requests.consume(1)
+        contentLength = request.headers.get("Content-Length") or request.headers.get("X-Amz-Decoded-Content-Length")
+        if contentLength:
+            self._bandwidth.consume(int(contentLength))
+
+    def _after_get_object(self, parsed: dict, **kwargs):
+        if "Body" in parsed:
+            parsed["Body"] = _S3ThrottledBody(parsed["Body"], self._bandwidth)
+
+
+class _S3TransferProgress:
+    """Aggregates the progress of the object transfers that make up a bulk
+    S3 transfer across all threads, and reports it to a callback from a
+    background thread at a fixed interval.
+
+    Each attempt at transferring an object reports the bytes that it
+    transfers through a callback, which is passed to boto3 as a transfer
+    callback where boto3 manages the transfer. If an attempt fails, the bytes
+    that it reported are taken back, so that progress only counts data that
+    is still needed, while throughput counts every byte that was transferred.
+    When totals_final is False, objects are added to the totals as they are
+    found (e.g. while a bucket is being listed), and no ETA is reported until
+    finalize_totals is called.
+    """
+
+    def __init__(self, callback, total_objects: int = 0, total_bytes: int = 0, totals_final: bool = True,
+                 interval: float = _S3_PROGRESS_INTERVAL):
+        self.callback = callback
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._totalObjects = total_objects
+        self._totalBytes = total_bytes
+        self._totalsFinal = totals_final
+        self._objectCount = 0
+        self._failureCount = 0
+        self._bytes = 0
+        self._bytesTransferred = 0
+        self._startTime = time.monotonic()
+        self._samples = collections.deque()
+        self._stopEvent = threading.Event()
+        self._thread = None
+
+    def add_total(self, size: int):
+        with self._lock:
+            self._totalObjects += 1
+            self._totalBytes += size
+
+    def finalize_totals(self):
+        with self._lock:
+            self._totalsFinal = True
+
+    def attempt(self) -> tuple:
+        # Returns a callback that takes the number of bytes transferred by one attempt at transferring an object, and a
+        # function that takes back the bytes that were reported through it; boto3 reports negative amounts when it
+        # retries part of a transfer itself
+        attemptBytes = 0
+
+        def callback(bytes_transferred: int):
+            nonlocal attemptBytes
+            with self._lock:
+                attemptBytes += bytes_transferred
+                self._bytes += bytes_transferred
+                if bytes_transferred > 0:
+                    self._bytesTransferred += bytes_transferred
+
+        def rewind():
+            nonlocal attemptBytes
+            with self._lock:
+                self._bytes -= attemptBytes
+                attemptBytes = 0
+
+        return callback, rewind
+
+    def finish_object(self, failed: bool = False):
+        with self._lock:
+            if failed:
+                self._failureCount += 1
+            else:
+                self._objectCount += 1
+
+    def start(self):
+        self._startTime = time.monotonic()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        # Stop reporting, and send a final report
+        self._stopEvent.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.callback(self.report(complete=True))
+
+    def report(self, complete: bool = False) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            progress = {
+                "Objects": self._objectCount,
+                "Failures": self._failureCount,
+                "Total Objects": self._totalObjects,
+                "Bytes": self._bytes,
+                "Total Bytes": self._totalBytes,
+                "Totals Final": self._totalsFinal,
+                "Elapsed Time": now - self._startTime
+            }
+            bytesTransferred = self._bytesTransferred
+
+        # Measure instantaneous throughput over a sliding window of samples
+        self._samples.append((now, bytesTransferred))
+        while len(self._samples) > 2 and now - self._samples[1][0] >= _S3_PROGRESS_THROUGHPUT_WINDOW:
+            self._samples.popleft()
+        sampleTime, sampleBytes = self._samples[0]
+        progress["Throughput"] = (bytesTransferred - sampleBytes) / (now - sampleTime) if now > sampleTime else 0.0
+        progress["Average Throughput"] = bytesTransferred / progress["Elapsed Time"] if progress["Elapsed Time"] > 0 else 0.0
+        progress["ETA"] = None
+        if progress["Totals Final"] and progress["Throughput"] > 0:
+            progress["ETA"] = max(0, progress["Total Bytes"] - progress["Bytes"]) / progress["Throughput"]
+        progress["Complete"] = complete
+        return progress
+
+    def _run(self):
+        self._samples.append((self._startTime, 0))
+        while not self._stopEvent.wait(self.interval):
+            self.callback(self.report())
+
+
+class _S3ProgressReader:
+    """Read-only file object that reports the number of bytes read from the
+    wrapped file object to a progress callback."""
+
+    def __init__(self, fileobj, callback):
+        self.fileobj = fileobj
+        self.callback = callback
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.callback(len(data))
+        return data
+
+
+class _S3MultipartUploadStream:
+    """Write-only file object that streams everything written to it to an S3
+    object.
+
+    Data is buffered until a full part has been written, and each part is
+    uploaded as soon as it is complete, so that an object of any size can be
+    written without a temporary file while holding at most one part in
+    memory. An object that fits in a single part is uploaded with a single
+    PUT instead of a multipart upload.
+
+    With verify, a CRC32 checksum of each part is sent with the part, so that
+    S3 rejects a part that was corrupted in transit and stores the checksum
+    with the object, and the checksums that S3 returns for the parts and for
+    the completed object are checked. verified is then True if the object was
+    verified, or False if it could not be.
+
+    callback, if specified, is called with the size of each part once it has
+    been uploaded.
+    """
+
+    def __init__(self, s3, bucket: str, key: str, part_size: int, extra_args: dict = None, verify: bool = False, callback=None):
+        self.s3 = s3
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.extra_args = extra_args or dict()
+        self.verify = verify
+        self.callback = callback
+        self.bytes_written = 0
+        self.verified = None
+        self._buffer = bytearray()
+        self._uploadId = None
+        self._parts = list()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+        return len(data)
+
+    def close(self):
+        if self._uploadId is None:
+            body = bytes(self._buffer)
+            if self.verify:
+                checksums = _get_s3_upload_checksums(self.s3, body)
+                response = self.s3.put_object(Bucket=self.bucket, Key=self.key, Body=body, **checksums, **self.extra_args)
+                self.verified = _check_s3_upload_checksums(self.s3, response, body, checksums, self.key)
+            else:
+                self.s3.put_object(Bucket=self.bucket, Key=self.key, Body=body, **self.extra_args)
+            if self.callback:
+                self.callback(len(body))
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            response = self.s3.complete_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._uploadId, MultipartUpload={"Parts": self._parts})
+            if self.verify:
+                self.verified = self.verified is not False and _check_s3_multipart_upload_checksums(response, self._parts, self.key)
+        self._buffer = bytearray()
+
+    def abort(self):
+        # Abort multipart upload, if one was started, so that its parts do not continue to consume storage
+        self._buffer = bytearray()
+        if self._uploadId is not None:
+            try:
+                self.s3.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._uploadId)
+            except Exception:
+                pass
+
+    def _upload_part(self, data: bytes):
+        if self._uploadId is None:
+            checksumArgs = {"ChecksumAlgorithm": "CRC32"} if self.verify else dict()
+            self._uploadId = self.s3.create_multipart_upload(Bucket=self.bucket, Key=self.key, **checksumArgs, **self.extra_args)["UploadId"]
+        partNumber = len(self._parts) + 1
+        if self.verify:
+            checksums = _get_s3_upload_checksums(self.s3, data)
+            response = self.s3.upload_part(Bucket=self.bucket, Key=self.key, UploadId=self._uploadId, PartNumber=partNumber, Body=data, **checksums)
+            if not _check_s3_upload_checksums(self.s3, response, data, checksums, self.key + " (part " + str(partNumber) + ")"):
+                self.verified = False
+            self._parts.append(_get_s3_part_entry(partNumber, response))
+        else:
+            response = self.s3.upload_part(Bucket=self.bucket, Key=self.key, UploadId=self._uploadId, PartNumber=partNumber, Body=data)
+            self._parts.append({"PartNumber": partNumber, "ETag": response["ETag"]})
+        if self.callback:
+            self.callback(len(data))
+
+
+class _S3ChecksumMismatchError(Exception):
+    """Data that was transferred to or from S3 does not match the ETag of the S3 object."""
+
+
+class _S3StreamChecksum:
+    """Computes a checksum of an S3 object, in the form in which S3 returns
+    it, from the object's data as the data streams past, so that a download
+    can be verified in the same pass as the I/O.
+
+    field is the field of the S3 API response that the checksum is compared
+    with: 'ETag', or a flexible checksum field such as 'ChecksumCRC32'. The
+    checksum of an object that was uploaded with a multipart upload is the
+    checksum of the concatenated checksums of its parts, followed by '-' and
+    the number of parts; part_size must then be the size of every part but the
+    last.
+    """
+
+    def __init__(self, field: str = "ETag", part_size: int = None):
+        self.field = field
+        self.part_size = part_size
+        self._algorithm = _S3_CHECKSUM_ALGORITHMS[field]
+        self._state = self._new_state()
+        self._partBytes = 0
+        self._partDigests = list()
+
+    def update(self, data: bytes):
+        data = memoryview(data)
+        while data:
+            chunkSize = min(len(data), self.part_size - self._partBytes) if self.part_size else len(data)
+            self._update_state(data[:chunkSize])
+            self._partBytes += chunkSize
+            data = data[chunkSize:]
+            if self._partBytes == self.part_size:
+                self._partDigests.append(self._get_state_digest())
+                self._state = self._new_state()
+                self._partBytes = 0
+
+    def value(self) -> str:
+        partDigests = self._partDigests + [self._get_state_digest()] if self._partBytes or not self._partDigests else self._partDigests
+        return _format_s3_checksum(self.field, partDigests, multipart=bool(self.part_size))
+
+    def _new_state(self):
+        return 0 if self._algorithm == "crc32" else hashlib.new(self._algorithm)
+
+    def _update_state(self, data: memoryview):
+        if self._algorithm == "crc32":
+            self._state = zlib.crc32(data, self._state)
+        else:
+            self._state.update(data)
+
+    def _get_state_digest(self) -> bytes:
+        return self._state.to_bytes(4, "big") if self._algorithm == "crc32" else self._state.digest()
+
+
+class _S3ChecksumReader:
+    """Read-only file object that passes everything read from the wrapped
+    file object to an _S3StreamChecksum."""
+
+    def __init__(self, fileobj, checksum: _S3StreamChecksum):
+        self.fileobj = fileobj
+        self.checksum = checksum
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.checksum.update(data)
+        return data
+
+
+def _print_api_response(response: requests.Response):
+    print("API Response:")
+    print("Status Code: ", response.status_code)
+    print("Header: ", response.headers)
+    if response.text:
+        print("Body: ", response.text)
+
+
+def _construct_clone_dict(new_volume_name: str, source_svm: str, target_svm: str, source_volume, source_snapshot,
+                          export_policy: str, snapshot_policy: str, unix_uid: int, unix_gid: int, junction: str = None) -> dict:
+    # Construct the request body for a FlexClone; export policy and snapshot policy are set as part of the
+    # clone request, as opposed to being patched onto the clone after it has been created
+    newVolumeDict = {
+        "name": new_volume_name,
+        "svm": {"name": target_svm},
+        "nas": {
+            "path": junction if junction else "/"+new_volume_name,
+            "export_policy": {"name": export_policy}
+        },
+        "snapshot_policy": {"name": snapshot_policy},
+        "clone": {
+            "is_flexclone": True,
+            "parent_svm": {"name": source_svm},
+            "parent_volume": {
+                "name": source_volume.name,
+                "uuid": source_volume.uuid
+            }
+        }
+    }
+    if unix_uid != 0:
+        newVolumeDict["nas"]["uid"] = unix_uid
+    if unix_gid != 0:
+        newVolumeDict["nas"]["gid"] = unix_gid
+    if source_snapshot:
+        newVolumeDict["clone"]["parent_snapshot"] = {
+            "name": source_snapshot.name,
+            "uuid": source_snapshot.uuid
+        }
+
+    comment = 'PARENTSVM:'+source_svm+',PARENTVOL:'+source_volume.name+',CLONESVM:'+target_svm+',CLONENAME:'+new_volume_name
+    if source_snapshot: comment += ' SNAP:'+source_snapshot.name
+    comment += " netapp-dataops"
+    newVolumeDict["comment"] = comment
+    return newVolumeDict
+
+
+def _construct_export_policy_dict(export_policy: str, svm: str, export_hosts: str) -> dict:
+    # Construct the request body for an export policy that grants read-write access to each of the colon-separated
+    # hosts in export_hosts
+    return {
+        "name": export_policy,
+        "svm": {"name": svm},
+        "rules": [{"clients": [{"match": client}], "ro_rule": ["sys"], "rw_rule": ["sys"], "superuser": ["sys"]}
+                  for client in export_hosts.split(":")]
+    }
+
+
+class _LocalMounts:
+    """Index of the local mount table by mount source (e.g. the NFS mount
+    target of a volume), by the export path of NFS mount sources, and by
+    mountpoint.
+
+    The export path index matches a volume however its host part was chosen,
+    e.g. when it was mounted through a data LIF other than the one in the
+    config file. Where a source is mounted more than once, or mounts are
+    stacked on a mountpoint, the most recent mount wins.
+    """
+
+    def __init__(self, mounts: list):
+        self.mountpoints_by_source = dict()
+        self.mountpoints_by_export_path = dict()
+        self.sources_by_mountpoint = dict()
+        for source, mountpoint in mounts:
+            self.mountpoints_by_source[source] = mountpoint
+            self.sources_by_mountpoint[mountpoint] = source
+            # NFS mount sources are of the form 'host:/export/path'; the host may be a bracketed IPv6 address
+            separator = source.find(":/")
+            if separator > 0:
+                self.mountpoints_by_export_path[source[separator + 1:]] = mountpoint
+
+    def get_mountpoint(self, source: str, export_path: str = None) -> str:
+        # Prefer an exact match on the mount source, falling back to a match on the export path
+        mountpoint = self.mountpoints_by_source.get(source)
+        if mountpoint is None and export_path:
+            mountpoint = self.mountpoints_by_export_path.get(export_path)
+        return mountpoint
+
+
+def _unescape_mountinfo_field(field: str) -> str:
+    # The kernel escapes space, tab, newline and backslash in mountinfo fields as octal sequences (e.g. '\040')
+    return re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), field)
+
+
+def _read_local_mounts() -> _LocalMounts:
+    # Read the local mount table in a single pass; where /proc/self/mountinfo is not available (e.g. on macOS), fall
+    # back to parsing the output of the mount command
+    mounts = list()
+    try:
+        with open(_MOUNTINFO_PATH, errors="surrogateescape") as mountinfo:
+            for line in mountinfo:
+                # Fields are mount ID, parent ID, major:minor, root, mountpoint, mount options, any number of optional
+                # fields, '-', filesystem type, source and superblock options
+                fields = line.split()
+                try:
+                    separator = fields.index("-", 6)
+                    mounts.append((_unescape_mountinfo_field(fields[separator + 2]), _unescape_mountinfo_field(fields[4])))
+                except (ValueError, IndexError):
+                    continue
+    except FileNotFoundError:
+        for mount in subprocess.check_output(['mount']).decode().split("\n"):
+            mountDetails = mount.split(" ")
+            if len(mountDetails) > 2:
+                mounts.append((mountDetails[0], mountDetails[2]))
+    return _LocalMounts(mounts)
+
+
+def _build_nfs_mount_target(volumeExportPath: str, config: dict, svm: str) -> str:
+    # Construct the NFS mount target of a volume from its export path; volumes in an SVM other than the SVM in the
+    # config file are mounted via the SVM name, since the data LIF in the config file belongs to that SVM
+    if not volumeExportPath:
+        return None
+    if svm != config["svm"]:
+        return svm + ":" + volumeExportPath
+    return config["dataLif"] + ":" + volumeExportPath
+
+
+def _mount_nfs_target(nfsMountTarget: str, mountpoint: str, readonly: bool = False, mount_options: str = None):
+    # Create mountpoint (and any missing parent directories) and mount the NFS mount target at it; NFS options such as
+    # 'vers=4.1,nconnect=8,rsize=1048576,wsize=1048576,hard,timeo=600' are passed through to the mount command as-is
+    mountpoint = os.path.expanduser(mountpoint)
+    os.makedirs(mountpoint, exist_ok=True)
+
+    options = list()
+    if readonly:
+        options.append("ro")
+    if mount_options:
+        options.append(mount_options)
+
+    if options:
+        subprocess.check_call(['mount', '-o', ",".join(options), nfsMountTarget, mountpoint])
+    else:
+        subprocess.check_call(['mount', nfsMountTarget, mountpoint])
+
+
+class _DataLifCache:
+    """Process-wide, thread-safe cache of the NFS data LIFs of each SVM.
+
+    LIFs are keyed by (hostname, svm) and are re-discovered through the ONTAP
+    network interface API once the cached entry is older than the TTL. A
+    round-robin cursor is kept per set of LIFs that is rotated through; each
+    cursor starts at an offset derived from the client hostname, so that
+    clients that mount at the same time do not all start on the first LIF.
+    """
+
+    def __init__(self, ttl: float = 300):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = dict()
+        self._cursors = dict()
+
+    def get(self, hostname: str, svm: str, refresh: bool = False) -> list:
+        key = (hostname, svm)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and not refresh and time.monotonic() - entry["discovered"] <= self.ttl:
+                return entry["lifs"]
+
+        # Discover outside of the lock so that a slow API call does not hold up lookups for other SVMs
+        lifs = _discover_data_lifs(svm=svm)
+        with self._lock:
+            self._entries[key] = {"lifs": lifs, "discovered": time.monotonic()}
+        return lifs
+
+    def next_index(self, key: tuple) -> int:
+        with self._lock:
+            if key not in self._cursors:
+                self._cursors[key] = itertools.count(zlib.crc32(socket.gethostname().encode()))
+            return next(self._cursors[key])
+
+    def configure(self, ttl: float = None):
+        with self._lock:
+            if ttl is not None:
+                self.ttl = ttl
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_dataLifCache = _DataLifCache()
+
+
+def _discover_data_lifs(svm: str) -> list:
+    # Retrieve the NFS data LIFs of an SVM that are up, sorted by name so that every client sees them in the same order
+    lifs = list()
+    for interface in netappResources.IpInterface.get_collection(**{"svm.name": svm, "services": "data_nfs", "state": "up",
+                                                                     "fields": "name,ip.address,location.node.name,location.home_node.name"}):
+        location = getattr(interface, "location", None)
+        lifs.append({
+            "LIF Name": interface.name,
+            "IP Address": interface.ip.address,
+            "Current Node": location.node.name if hasattr(location, "node") else None,
+            "Home Node": location.home_node.name if hasattr(location, "home_node") else None
+        })
+    lifs.sort(key=lambda lif: lif["LIF Name"])
+    return lifs
+
+
+def _get_volume_nodes(volumes: list) -> dict:
+    # Map each volume to the set of nodes that host its aggregates; a FlexGroup can span aggregates on several nodes
+    volumeAggregates = dict()
+    for volume in volumes:
+        volumeAggregates[volume.name] = [aggregate.name for aggregate in getattr(volume, "aggregates", [])]
+
+    aggregateNames = sorted(set(itertools.chain.from_iterable(volumeAggregates.values())))
+    aggregateNodes = dict()
+    for i in range(0, len(aggregateNames), _QUERY_BATCH_SIZE):
+        batch = aggregateNames[i:i + _QUERY_BATCH_SIZE]
+        for aggregate in netappResources.Aggregate.get_collection(name="|".join(batch), fields="home_node.name"):
+            aggregateNodes[aggregate.name] = aggregate.home_node.name
+
+    return {volumeName: set(aggregateNodes[name] for name in names if name in aggregateNodes) for volumeName, names in volumeAggregates.items()}
+
+
+def _select_data_lif(lifs: list, lif_policy: str, hostname: str, svm: str, volume_name: str, volume_nodes: set = None) -> str:
+    # Pick the data LIF that a volume is mounted through; returns the IP address of the LIF
+    if lif_policy == "client-hash":
+        # The same client always mounts a given volume through the same LIF, while different clients (and the
+        # different volumes mounted by one client) are spread across the LIFs
+        return lifs[zlib.crc32((socket.gethostname() + ":" + volume_name).encode()) % len(lifs)]["IP Address"]
+    if lif_policy == "local":
+        # Prefer LIFs on the node that hosts the volume's aggregate, so that NFS traffic does not cross the cluster
+        # interconnect; fall back to all LIFs if none of them are currently on that node
+        localLifs = [lif for lif in lifs if lif["Current Node"] in (volume_nodes or ())]
+        if localLifs:
+            lifs = localLifs
+    return lifs[_dataLifCache.next_index(key=(hostname, svm) + tuple(lif["LIF Name"] for lif in lifs)) % len(lifs)]["IP Address"]
+
+
+def _select_data_lifs(volumes: list, config: dict, svm: str, lif_policy: str) -> dict:
+    # Pick a data LIF for each of the volumes according to the policy; returns an empty dict if the SVM has no NFS
+    # data LIFs that are up
+    lifs = _dataLifCache.get(hostname=config["hostname"], svm=svm)
+    if not lifs:
+        return dict()
+    volumeNodes = _get_volume_nodes(volumes) if lif_policy == "local" else dict()
+    return {volume.name: _select_data_lif(lifs=lifs, lif_policy=lif_policy, hostname=config["hostname"], svm=svm,
+                                          volume_name=volume.name, volume_nodes=volumeNodes.get(volume.name))
+            for volume in volumes}
+
+
+def _construct_volume_dict(volume, config: dict, svm: str, include_space_usage_details: bool = False, mounts: _LocalMounts = None) -> dict:
+    # Construct the dict that represents a volume in the list_volumes output; returns None for the SVM root volume
+
+    # Retrieve volume export path; handle case where volume is not exported
+    if hasattr(volume, "nas"):
+        volumeExportPath = volume.nas.path
+    else:
+        volumeExportPath = None
+
+    # Do not include SVM root volume
+    if volumeExportPath == "/":
+        return None
+
+    # Determine volume type
+    type = volume.style
+
+    # Construct NFS mount target
+    nfsMountTarget = _build_nfs_mount_target(volumeExportPath=volumeExportPath, config=config, svm=svm)
+
+    # Construct clone source
+    clone = "no"
+    cloneParentSvm = ""
+    cloneParentVolume = ""
+    cloneParentSnapshot = ""
+
+    try:
+        cloneParentSvm = volume.clone.parent_svm.name 
+        cloneParentVolume = volume.clone.parent_volume.name
+        cloneParentSnapshot = volume.clone.parent_snapshot.name
+        clone = "yes"
+    except:
+        pass
+
+    # Determine if FlexCache
+    if volume.flexcache_endpoint_type == "cache":
+        flexcache = "yes"
+    else:
+        flexcache = "no"
+
+    # Convert size in bytes to "pretty" size (size in KB, MB, GB, or TB)
+    prettySize = _convert_bytes_to_pretty_size(size_in_bytes=volume.size)
+    if include_space_usage_details :
+        try :
+            snapshotReserve = str(volume.space.snapshot.reserve_percent) + "%"
+            logicalCapacity = float(volume.space.size) * (1 - float(volume.space.snapshot.reserve_percent)/100)
+            prettyLogicalCapacity = _convert_bytes_to_pretty_size(size_in_bytes=logicalCapacity)
+            logicalUsage = float(volume.space.used)
+            prettyLogicalUsage = _convert_bytes_to_pretty_size(size_in_bytes=logicalUsage)
+        except :
+            snapshotReserve = "Unknown"
+            prettyLogicalCapacity = "Unknown"
+            prettyLogicalUsage = "Unknown"
+        try :
+            if type == "flexgroup" :
+                totalFootprint: float = 0.0
+                for constituentVolume in volume.constituents :
+                    totalFootprint += float(constituentVolume["space"]["total_footprint"])
+            else :
+                totalFootprint = float(volume.space.footprint) + float(volume.space.metadata)
+            prettyFootprint = _convert_bytes_to_pretty_size(size_in_bytes=totalFootprint)
+        except :
+            prettyFootprint = "Unknown"
+
+    # Construct dict containing volume details; optionally include local mountpoint
+    volumeDict = {
+        "Volume Name": volume.name,
+        "Size": prettySize
+    }
+    if include_space_usage_details :
+        volumeDict["Snap Reserve"] = snapshotReserve
+        volumeDict["Capacity"] = prettyLogicalCapacity
+        volumeDict["Usage"] = prettyLogicalUsage
+        volumeDict["Footprint"] = prettyFootprint
+    volumeDict["Type"] = volume.style
+    volumeDict["NFS Mount Target"] = nfsMountTarget
+    if mounts is not None:
+        volumeDict["Local Mountpoint"] = mounts.get_mountpoint(nfsMountTarget, export_path=volumeExportPath) or ""
+    volumeDict["FlexCache"] = flexcache
+    volumeDict["Clone"] = clone
+    volumeDict["Source SVM"] = cloneParentSvm
+    volumeDict["Source Volume"] = cloneParentVolume
+    volumeDict["Source Snapshot"] = cloneParentSnapshot
+
+    return volumeDict
+
+
+@functools.lru_cache(maxsize=16)
+def _decode_config_secret(secretBase64: str) -> str:
+    # Decode a base64-encoded secret from the config file; decoded secrets are cached by encoded value, so a
+    # secret is only decoded again after it has been changed in the config file
+    return base64.b64decode(secretBase64.encode("ascii")).decode("ascii")
+
+
+def _download_from_s3(s3, s3Bucket: str, s3ObjectKey: str, localFile: str, transferConfig: boto3Transfer.TransferConfig = None, verify: bool = False,
+                      callback=None, print_output: bool = False) -> bool:
+    # With verify, returns True if the download was verified, or False if it could not be verified; callback, if
+    # specified, is called with the number of bytes downloaded as the download progresses
+    if print_output:
+        print(
+            "Downloading object '" + s3ObjectKey + "' from bucket '" + s3Bucket + "' and saving as '" + localFile + "'.")
+
+    # Create directories that don't exist
+    if localFile.find(os.sep) != -1:
+        dirs = localFile.split(os.sep)
+        dirpath = os.sep.join(dirs[:len(dirs) - 1])
+        # Other download threads may create the same directories concurrently
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath, exist_ok=True)
+
+    # Download the file
+    verified = None
+    try:
+        if verify:
+            verified = _download_from_s3_verified(s3=s3, s3Bucket=s3Bucket, s3ObjectKey=s3ObjectKey, localFile=localFile,
+                                                  transferConfig=transferConfig or boto3Transfer.TransferConfig(), callback=callback)
+        else:
+            s3.download_file(Bucket=s3Bucket, Key=s3ObjectKey, Filename=localFile, Config=transferConfig, Callback=callback)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    if verified is False and print_output:
+        print("Warning: Download of object '" + s3ObjectKey + "' could not be verified.")
+    return verified
+
+
+def _download_from_s3_verified(s3, s3Bucket: str, s3ObjectKey: str, localFile: str, transferConfig: boto3Transfer.TransferConfig, callback=None) -> bool:
+    # Download object to a temporary file, and move the temporary file into place only once the data has been verified.
+    # If the object has a flexible checksum, botocore validates the checksum of each response while the response is
+    # being streamed; the parts of an object with a composite checksum (multipart upload) are downloaded in parallel by
+    # part number, since S3 returns the checksum of each part, and the part checksums are then checked against the
+    # composite checksum. Otherwise, the data is hashed as it is written and checked against the ETag. All requests are
+    # conditional on the ETag, so that an object that is overwritten during the download is not mixed with its
+    # previous version.
+    head = s3.head_object(Bucket=s3Bucket, Key=s3ObjectKey, ChecksumMode="ENABLED")
+    checksumField = next((field for field in _S3_CHECKSUM_FIELDS if head.get(field)), None)
+    if not checksumField and not _is_s3_etag_verifiable(head):
+        s3.download_file(Bucket=s3Bucket, Key=s3ObjectKey, Filename=localFile, Config=transferConfig, Callback=callback)
+        return False
+    partCount = None
+    if "-" in (head[checksumField] if checksumField else head["ETag"]):
+        partCount = s3.head_object(Bucket=s3Bucket, Key=s3ObjectKey, PartNumber=1, IfMatch=head["ETag"]).get("PartsCount", 1)
+
+    def download_part(partNumber: int = None) -> tuple:
+        # Returns the flexible checksum that S3 returned for the part, or the MD5 of the part
+        requestArgs = {"PartNumber": partNumber} if partNumber else dict()
+        if checksumField:
+            requestArgs["ChecksumMode"] = "ENABLED"
+        response = s3.get_object(Bucket=s3Bucket, Key=s3ObjectKey, IfMatch=head["ETag"], **requestArgs)
+        offset = int(response["ContentRange"].split(" ")[1].split("-")[0]) if partNumber else 0
+        md5 = None if checksumField else hashlib.md5()
+        try:
+            with open(tempFile, "r+b") as file:
+                file.seek(offset)
+                for chunk in iter(lambda: response["Body"].read(transferConfig.io_chunksize), b""):
+                    if md5:
+                        md5.update(chunk)
+                    file.write(chunk)
+                    if callback:
+                        callback(len(chunk))
+        except botocoreExceptions.FlexibleChecksumError as err:
+            raise _S3ChecksumMismatchError("Checksum mismatch for '" + s3ObjectKey + "': " + str(err)) from err
+        return response.get(checksumField) if checksumField else md5.digest()
+
+    tempFile = localFile + "." + "%08x" % random.getrandbits(32)
+    try:
+        with open(tempFile, "wb") as file:
+            file.truncate(head["ContentLength"])
+        if partCount:
+            with ThreadPoolExecutor(max_workers=transferConfig.max_request_concurrency) as executor:
+                partChecksums = list(executor.map(download_part, range(1, partCount + 1)))
+        else:
+            partChecksums = [download_part()]
+        verified = True
+        if not checksumField:
+            _check_s3_checksum(head, "ETag", _format_s3_checksum("ETag", partChecksums, multipart=bool(partCount)), s3ObjectKey)
+        elif not all(partChecksum and "-" not in partChecksum for partChecksum in partChecksums):
+            # S3 did not return a checksum for each part that botocore could validate
+            verified = False
+        elif partCount and checksumField in _S3_CHECKSUM_ALGORITHMS:
+            partDigests = [base64.b64decode(partChecksum) for partChecksum in partChecksums]
+            _check_s3_checksum(head, checksumField, _format_s3_checksum(checksumField, partDigests, multipart=True), s3ObjectKey)
+        os.replace(tempFile, localFile)
+    except Exception:
+        if os.path.exists(tempFile):
+            os.remove(tempFile)
+        raise
+    return verified
+
+
+def _get_cloud_central_access_token(refreshToken: str, print_output: bool = False) -> str:
+    # Define parameters for API call
+    url = "https://netapp-cloud-account.auth0.com/oauth/token"
+    headers = {
+        "Content-Type": "application/json"
+    }
+    data = {
+        "grant_type": "refresh_token",
+        "refresh_token": refreshToken,
+        "client_id": "Mu0V1ywgYteI6w1MbD15fKfVIUrNXGWC"
+    }
+
+    # Call API to optain access token
+    response = requests.post(url=url, headers=headers, data=json.dumps(data))
+
+    # Parse response to retrieve access token
+    try:
+        responseBody = json.loads(response.text)
+        accessToken = responseBody["access_token"]
+    except:
+        errorMessage = "Error obtaining access token from Cloud Sync API"
+        if print_output:
+            print("Error:", errorMessage)
+            _print_api_response(response)
+        raise APIConnectionError(errorMessage, response)
+
+    return accessToken
+
+def _get_cloud_sync_access_parameters(refreshToken: str, print_output: bool = False) -> (str, str):
+    try:
+        accessToken = _get_cloud_central_access_token(refreshToken=refreshToken, print_output=print_output)
+    except APIConnectionError:
+        raise
+
+    # Define parameters for API call
+    url = "https://cloudsync.netapp.com/api/accounts"
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": "Bearer " + accessToken
+    }
+
+    # Call API to obtain account ID
+    response = requests.get(url=url, headers=headers)
+
+    # Parse response to retrieve account ID
+    try:
+        responseBody = json.loads(response.text)
+        accountId = responseBody[0]["accountId"]
+    except:
+        errorMessage = "Error obtaining account ID from Cloud Sync API"
+        if print_output:
+            print("Error:", errorMessage)
+            _print_api_response(response)
+        raise APIConnectionError(errorMessage, response)
+
+    # Return access token and account ID
+    return accessToken, accountId
+
+
+def _find_latest_snapshot(volume_uuid: str, prefix: str):
+    # Retrieve only the newest snapshot whose name starts with prefix; a single API call regardless of snapshot count
+    snapshots = _get_snapshot_collection(volume_uuid, name_prefix=prefix, order_by="create_time desc", max_records=1)
+    return next(iter(snapshots), None)
+
+
+def _create_job_handle(response, description: str, print_output: bool = False) -> JobHandle:
+    jobHandle = JobHandle(uuid=_get_job_uuid(response), description=description)
+    if print_output:
+        if jobHandle.uuid:
+            print("Submitted job '" + jobHandle.uuid + "' to " + description + ".")
+        else:
+            print("Completed request to " + description + ".")
+    return jobHandle
+
+
+def _get_job_uuid(response) -> str:
+    # Retrieve the uuid of the ONTAP job that was started by a request submitted with poll=False
+    try:
+        if response.is_job:
+            return response.http_response.json()["job"]["uuid"]
+    except (KeyError, ValueError):
+        pass
+    return None
+
+
+def _get_snapshot_collection(volume_uuid: str, name: str = None, name_prefix: str = None, order_by: str = "create_time",
+                             max_records: int = None):
+    # Retrieve snapshots for a volume with all commonly used fields included in the collection query so that
+    # callers do not need to retrieve each snapshot individually; filtering and ordering are performed by ONTAP
+    query = {
+        "fields": _SNAPSHOT_FIELDS,
+        "order_by": order_by,
+        "max_records": max_records if max_records else _COLLECTION_PAGE_SIZE
+    }
+    if name:
+        query["name"] = name
+    elif name_prefix:
+        query["name"] = name_prefix + "*"
+    return netappResources.Snapshot.get_collection(volume_uuid, **query)
+
+
+def _get_snapshots_exceeding_retention(snapshots, snapshot_name_prefix: str, retention_count: int, retention_days: bool = False) -> list:
+    # Determine the names of the '<prefix>.<timestamp>' snapshots, ordered by create time, that fall outside of
+    # the retention count; when retention_days is set, the retention count is a number of days
+    if retention_days:
+        retention_date = datetime.datetime.today() - datetime.timedelta(days=retention_count)
+
+    last_snapshot_list = []
+    snapshot_list = []
+    for snapshot in snapshots:
+        if snapshot.name.startswith(snapshot_name_prefix+'.'):
+            if not retention_days:
+                snapshot_list.append(snapshot.name)
+                last_snapshot_list.append(snapshot.name)
+                if len(last_snapshot_list) > retention_count:
+                    last_snapshot_list.pop(0)
+            else:
+                rx = r'^{0}\.(.+)$'.format(snapshot_name_prefix)
+                matchObj = re.match(rx,snapshot.name)
+                if matchObj:
+                    snapshot_date = matchObj.group(1)
+                    snapshot_date_obj = datetime.datetime.strptime(snapshot_date, "%Y-%m-%d_%H%M%S")
+                    snapshot_list.append(snapshot.name)
+                    last_snapshot_list.append(snapshot.name)
+                    if snapshot_date_obj < retention_date:
+                        last_snapshot_list.pop(0)
+
+    return [snap for snap in snapshot_list if snap not in last_snapshot_list]
+
+
+def _get_volume_collection(svm: str, fields: str, fallback_fields: str = None):
+    # Retrieve volumes one page at a time, with the requested fields included in each page, so that
+    # listing volumes costs one API call per page as opposed to one API call per volume
+    volumes = netappResources.Volume.get_collection(svm=svm, fields=fields, max_records=_COLLECTION_PAGE_SIZE)
+    try:
+        firstVolume = next(volumes, None)
+    except netappError.NetAppRestError:
+        # Older ONTAP versions reject some fields (e.g. 'constituents'); retry with fallback fields
+        if not fallback_fields:
+            raise
+        volumes = netappResources.Volume.get_collection(svm=svm, fields=fallback_fields, max_records=_COLLECTION_PAGE_SIZE)
+        firstVolume = next(volumes, None)
+
+    if firstVolume is None:
+        return
+    yield firstVolume
+    yield from volumes
+
+
+def _instantiate_connection(config: dict, connectionType: str = "ONTAP", print_output: bool = False):
+    if connectionType == "ONTAP":
+        ## Connection details for ONTAP cluster
+        try:
+            ontapClusterMgmtHostname = config["hostname"]
+            ontapClusterAdminUsername = config["username"]
+            ontapClusterAdminPasswordBase64 = config["password"]
+            verifySSLCert = config["verifySSLCert"]
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Decode base64-encoded password
+        ontapClusterAdminPassword = _decode_config_secret(ontapClusterAdminPasswordBase64)
+
+        # Retrieve connection to ONTAP cluster from connection pool
+        connection = _connectionPool.get(
+            hostname=ontapClusterMgmtHostname,
+            username=ontapClusterAdminUsername,
+            password=ontapClusterAdminPassword,
+            verify=verifySSLCert
+        )
+        netappConfig.CONNECTION = connection
+        return connection
+
+    else:
+        raise ConnectionTypeError()
+
+
+def _instantiate_s3_client(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str, s3VerifySSLCert: bool, s3CACertBundle: str,
+                           max_pool_connections: int = 10, throttle: _S3Throttle = None, print_output: bool = False):
+    # Instantiate session
+    session = boto3.session.Session(aws_access_key_id=s3AccessKeyId, aws_secret_access_key=s3SecretAccessKey)
+    config = botocoreClient.Config(signature_version='s3v4', max_pool_connections=max_pool_connections)
+
+    # Instantiate low-level client; clients are thread-safe, so a single client (and its connection pool) can be
+    # shared by all of the threads that take part in a transfer
+    if s3VerifySSLCert:
+        if s3CACertBundle:
+            s3 = session.client(service_name='s3', endpoint_url=s3Endpoint, verify=s3CACertBundle, config=config)
+        else:
+            s3 = session.client(service_name='s3', endpoint_url=s3Endpoint, config=config)
+    else:
+        s3 = session.client(service_name='s3', endpoint_url=s3Endpoint, verify=False, config=config)
+
+    # Limit bandwidth and request rate of all requests made with client, if requested
+    if throttle:
+        throttle.register(s3)
+
+    return s3
+
+
+def _print_invalid_config_error() :
+    print("Error: Missing or invalid config file. Run `netapp_dataops_cli.py config` to create config file.")
+
+
+def _retrieve_config(configDirPath: str = "~/.netapp_dataops", configFilename: str = "config.json",
+                   print_output: bool = False) -> types.MappingProxyType:
+    configDirPath = os.path.expanduser(configDirPath)
+    configFilePath = os.path.join(configDirPath, configFilename)
+    try:
+        # Return cached config if config file has not changed since it was last read
+        configFileStat = os.stat(configFilePath)
+        configFileVersion = (configFileStat.st_mtime_ns, configFileStat.st_ino, configFileStat.st_size)
+        cachedConfig = _configCache.get(configFilePath)
+        if cachedConfig and cachedConfig[0] == configFileVersion:
+            return cachedConfig[1]
+
+        with open(configFilePath, 'r') as configFile:
+            # Read connection details from config file; read into read-only mapping so that the cached config
+            # cannot be modified by callers
+            config = types.MappingProxyType(json.load(configFile))
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+    _configCache[configFilePath] = (configFileVersion, config)
+    return config
+
+
+def _retrieve_cloud_central_refresh_token(print_output: bool = False) -> str:
+    # Retrieve refresh token from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        refreshTokenBase64 = config["cloudCentralRefreshToken"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    # Decode base64-encoded refresh token
+    refreshToken = _decode_config_secret(refreshTokenBase64)
+
+    return refreshToken
+
+
+def _retrieve_s3_access_details(print_output: bool = False) -> (str, str, str, bool, str):
+    # Retrieve refresh token from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        s3Endpoint = config["s3Endpoint"]
+        s3AccessKeyId = config["s3AccessKeyId"]
+        s3SecretAccessKeyBase64 = config["s3SecretAccessKey"]
+        s3VerifySSLCert = config["s3VerifySSLCert"]
+        s3CACertBundle = config["s3CACertBundle"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    # Decode base64-encoded secret access key
+    s3SecretAccessKey = _decode_config_secret(s3SecretAccessKeyBase64)
+
+    return s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle
+
+
+def _retrieve_s3_transfer_settings(max_workers: int = None, multipart_threshold: int = None, multipart_chunksize: int = None,
+                                   max_concurrency: int = None, max_io_queue: int = None, print_output: bool = False) -> dict:
+    transferSettings = {
+        "max_workers": max_workers,
+        "multipart_threshold": multipart_threshold,
+        "multipart_chunksize": multipart_chunksize,
+        "max_concurrency": max_concurrency,
+        "max_io_queue": max_io_queue
+    }
+
+    # Retrieve settings that were not specified by the caller from config file; settings that are not present in
+    # the config file either are left unset so that they can be auto-tuned
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        for setting, configKey in _S3_TRANSFER_SETTINGS_CONFIG_KEYS.items():
+            if transferSettings[setting] is None and config.get(configKey) is not None:
+                transferSettings[setting] = int(config[configKey])
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    return transferSettings
+
+
+def _parse_s3_throttle_schedule(schedule: list) -> list:
+    # Convert entries of the form {"start": "HH:MM", "end": "HH:MM", "maxBandwidth": ..., "maxRps": ...} into
+    # (start minute, end minute, limits) tuples; a window that ends at or before the time that it starts spans midnight
+    windows = list()
+    for entry in schedule:
+        start, end = (datetime.datetime.strptime(entry[key], "%H:%M") for key in ("start", "end"))
+        limits = dict()
+        for setting, scheduleKey in _S3_THROTTLE_SCHEDULE_KEYS.items():
+            if entry.get(scheduleKey) is not None:
+                limits[setting] = int(entry[scheduleKey])
+                if limits[setting] <= 0:
+                    raise ValueError("Limit '" + scheduleKey + "' must be greater than 0.")
+        windows.append((start.hour * 60 + start.minute, end.hour * 60 + end.minute, limits))
+    return windows
+
+
+def _retrieve_s3_throttle(max_bandwidth: int = None, max_rps: int = None, throttle_schedule: list = None,
+                          print_output: bool = False) -> _S3Throttle:
+    limits = {
+        "max_bandwidth": max_bandwidth,
+        "max_rps": max_rps
+    }
+    callerSettings = [setting for setting, limit in limits.items() if limit is not None]
+    for setting in callerSettings:
+        if limits[setting] <= 0:
+            if print_output:
+                print("Error: " + setting + " must be greater than 0.")
+            raise ValueError(setting + " must be greater than 0.")
+    try:
+        schedule = _parse_s3_throttle_schedule(throttle_schedule) if throttle_schedule is not None else None
+    except (KeyError, TypeError, ValueError) as err:
+        if print_output:
+            print("Error: Invalid throttle schedule: ", err)
+        raise ValueError("Invalid throttle schedule: " + str(err))
+
+    # Retrieve limits that were not specified by the caller, and the schedule if it was not specified by the caller,
+    # from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        for setting, configKey in _S3_THROTTLE_CONFIG_KEYS.items():
+            if limits[setting] is None and config.get(configKey) is not None:
+                limits[setting] = int(config[configKey])
+                if limits[setting] <= 0:
+                    raise ValueError()
+        if schedule is None:
+            schedule = _parse_s3_throttle_schedule(config.get(_S3_THROTTLE_SCHEDULE_CONFIG_KEY) or list())
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    # Limits that were specified by the caller apply at all times of day
+    for start, end, windowLimits in schedule:
+        for setting in callerSettings:
+            windowLimits.pop(setting, None)
+    schedule = [window for window in schedule if window[2]]
+
+    if limits["max_bandwidth"] is None and limits["max_rps"] is None and not schedule:
+        return None
+    return _S3Throttle(max_bandwidth=limits["max_bandwidth"], max_rps=limits["max_rps"], schedule=schedule)
+
+
+def _build_s3_transfer_config(transferSettings: dict, fileSizes: list) -> (int, boto3Transfer.TransferConfig):
+    transferSettings = dict(transferSettings)
+
+    # Auto-tune settings that were not specified, based on the number and size of the files being transferred
+    if None in transferSettings.values():
+        defaultTransferConfig = boto3Transfer.TransferConfig()
+        fileCount = max(1, len(fileSizes))
+        largestFileSize = max(fileSizes, default=0)
+        averageFileSize = sum(fileSizes) // fileCount
+
+        # Use larger parts for very large files in order to reduce the number of requests, and never exceed the S3
+        # limit on the number of parts in a multipart upload
+        if transferSettings["multipart_chunksize"] is None:
+            if largestFileSize < 1024 ** 3:
+                multipartChunksize = defaultTransferConfig.multipart_chunksize
+            else:
+                multipartChunksize = 64 * 1024 ** 2
+            transferSettings["multipart_chunksize"] = max(multipartChunksize, -(-largestFileSize // _S3_MAX_MULTIPART_PARTS))
+        if transferSettings["multipart_threshold"] is None:
+            transferSettings["multipart_threshold"] = transferSettings["multipart_chunksize"]
+
+        # Transfer many files at once when most files fit in a single request, and transfer fewer files with more
+        # parts in flight per file otherwise; either way, keep the total number of concurrent requests near the target
+        if transferSettings["max_workers"] is None:
+            if transferSettings["max_concurrency"] is not None:
+                maxWorkers = _S3_TRANSFER_AUTO_CONCURRENCY // transferSettings["max_concurrency"]
+            elif averageFileSize < transferSettings["multipart_threshold"]:
+                maxWorkers = _S3_TRANSFER_AUTO_CONCURRENCY
+            else:
+                maxWorkers = _S3_TRANSFER_AUTO_CONCURRENCY // 16
+            transferSettings["max_workers"] = max(1, min(maxWorkers, fileCount))
+        if transferSettings["max_concurrency"] is None:
+            transferSettings["max_concurrency"] = max(1, _S3_TRANSFER_AUTO_CONCURRENCY // transferSettings["max_workers"])
+        if transferSettings["max_io_queue"] is None:
+            transferSettings["max_io_queue"] = defaultTransferConfig.max_io_queue
+
+    transferConfig = boto3Transfer.TransferConfig(multipart_threshold=transferSettings["multipart_threshold"],
+                                    multipart_chunksize=transferSettings["multipart_chunksize"],
+                                    max_concurrency=transferSettings["max_concurrency"],
+                                    max_io_queue=transferSettings["max_io_queue"])
+    return transferSettings["max_workers"], transferConfig
+
+
+def _get_s3_max_pool_connections(transferSettings: dict) -> int:
+    # Size connection pool for the largest number of concurrent requests that the transfer settings can result in
+    # once any unset settings have been auto-tuned
+    maxWorkers = transferSettings["max_workers"] or 1
+    maxConcurrency = transferSettings["max_concurrency"] or 1
+    return max(_S3_TRANSFER_AUTO_CONCURRENCY, maxWorkers * maxConcurrency)
+
+
+def _get_s3_transfer_state_path(stateDirPath: str, direction: str, s3Endpoint: str, s3Bucket: str, s3ObjectKeyPrefix: str,
+                                localDirectory: str) -> str:
+    # Each combination of direction, bucket, key prefix and local directory has its own state file
+    transferId = json.dumps([direction, s3Endpoint, s3Bucket, s3ObjectKeyPrefix, os.path.abspath(localDirectory)])
+    stateDirPath = os.path.expanduser(stateDirPath)
+    os.makedirs(stateDirPath, exist_ok=True)
+    return os.path.join(stateDirPath, hashlib.sha256(transferId.encode("utf-8")).hexdigest()[:32] + ".sqlite")
+
+
+class _S3SyncManifest(sqlite3.Connection):
+    """Connection to an S3 sync manifest that counts the updates made since the last commit."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._uncommittedChanges = 0
+
+    def commit(self):
+        super().commit()
+        self._uncommittedChanges = 0
+
+
+def _open_s3_sync_manifest(direction: str, s3Endpoint: str, s3Bucket: str, s3ObjectKeyPrefix: str, localDirectory: str) -> _S3SyncManifest:
+    # The manifest records the state of each object/file as of the last time that it was successfully synced
+    manifestPath = _get_s3_transfer_state_path(stateDirPath=_S3_SYNC_MANIFEST_DIR, direction=direction, s3Endpoint=s3Endpoint,
+                                               s3Bucket=s3Bucket, s3ObjectKeyPrefix=s3ObjectKeyPrefix, localDirectory=localDirectory)
+    manifest = sqlite3.connect(manifestPath, factory=_S3SyncManifest)
+    manifest.execute("CREATE TABLE IF NOT EXISTS objects (key TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, etag TEXT)")
+    return manifest
+
+
+def _read_s3_sync_manifest(manifest: sqlite3.Connection) -> dict:
+    # Return dict of (size, mtime_ns, etag) tuples, keyed by object key
+    manifestEntries = dict()
+    for key, size, mtimeNs, etag in manifest.execute("SELECT key, size, mtime_ns, etag FROM objects"):
+        manifestEntries[key] = (size, mtimeNs, etag)
+    return manifestEntries
+
+
+def _get_s3_sync_manifest_entry(manifest: sqlite3.Connection, key: str) -> tuple:
+    # Return (size, mtime_ns, etag) tuple, or None if object is not in manifest
+    return manifest.execute("SELECT size, mtime_ns, etag FROM objects WHERE key = ?", (key,)).fetchone()
+
+
+def _update_s3_sync_manifest(manifest: _S3SyncManifest, key: str, size: int = None, mtimeNs: int = None, etag: str = None):
+    # Record synced object in manifest, or remove deleted object from manifest if size is not specified
+    if size is None:
+        manifest.execute("DELETE FROM objects WHERE key = ?", (key,))
+    else:
+        manifest.execute("INSERT OR REPLACE INTO objects (key, size, mtime_ns, etag) VALUES (?, ?, ?, ?)", (key, size, mtimeNs, etag))
+
+    # Periodically commit, so that progress is not lost if the transfer is interrupted
+    manifest._uncommittedChanges += 1
+    if manifest._uncommittedChanges >= _S3_SYNC_MANIFEST_COMMIT_INTERVAL:
+        manifest.commit()
+
+
+def _open_s3_transfer_journal(s3, direction: str, s3Endpoint: str, s3Bucket: str, s3ObjectKeyPrefix: str, localDirectory: str,
+                              resume: bool = False, print_output: bool = False) -> _S3TransferJournal:
+    journal = _S3TransferJournal(_get_s3_transfer_state_path(stateDirPath=_S3_TRANSFER_JOURNAL_DIR, direction=direction, s3Endpoint=s3Endpoint,
+                                                             s3Bucket=s3Bucket, s3ObjectKeyPrefix=s3ObjectKeyPrefix, localDirectory=localDirectory))
+
+    # Unless resuming, abort any multipart uploads that were left behind by an interrupted transfer, so that their
+    # parts do not continue to consume storage, and start over
+    if not resume:
+        for key, (uploadId, size, mtimeNs, partSize) in journal.multipart_uploads().items():
+            try:
+                s3.abort_multipart_upload(Bucket=s3Bucket, Key=key, UploadId=uploadId)
+            except Exception as err:
+                if print_output:
+                    print("Warning: Failed to abort incomplete multipart upload of object '" + key + "': ", err)
+        journal.clear()
+
+    return journal
+
+
+def _compute_s3_checksum(field: str, data: bytes) -> bytes:
+    # Digest of data for the checksum that is returned in the given S3 API response field
+    algorithm = _S3_CHECKSUM_ALGORITHMS[field]
+    if algorithm == "crc32":
+        return zlib.crc32(data).to_bytes(4, "big")
+    return hashlib.new(algorithm, data).digest()
+
+
+def _format_s3_checksum(field: str, partDigests: list, multipart: bool) -> str:
+    # Format checksum as S3 returns it, ETags as hex and flexible checksums as base64; the checksum of a multipart
+    # upload is the checksum of the concatenated checksums of its parts, followed by '-' and the number of parts
+    digest = _compute_s3_checksum(field, b"".join(partDigests)) if multipart else partDigests[0]
+    checksum = digest.hex() if field == "ETag" else base64.b64encode(digest).decode("utf-8")
+    return checksum + "-" + str(len(partDigests)) if multipart else checksum
+
+
+def _is_s3_etag_verifiable(response: dict) -> bool:
+    # The ETag of an object that is encrypted with SSE-KMS or SSE-C is not derived from the MD5 of its data
+    if response.get("ServerSideEncryption") in ("aws:kms", "aws:kms:dsse") or response.get("SSECustomerAlgorithm"):
+        return False
+    return re.fullmatch(r"[0-9a-f]{32}(-[0-9]+)?", response.get("ETag", "").strip('"')) is not None
+
+
+def _check_s3_checksum(response: dict, field: str, expectedChecksum: str, description: str) -> bool:
+    # Compare a checksum in an S3 API response with the checksum computed from the transferred data; returns False if
+    # the checksum is an ETag that cannot be verified
+    if field == "ETag" and not _is_s3_etag_verifiable(response):
+        return False
+    checksum = response[field].strip('"')
+    if checksum != expectedChecksum:
+        raise _S3ChecksumMismatchError("Checksum mismatch for '" + description + "': " + field + " is '" + checksum + "', but data has checksum '" + expectedChecksum + "'.")
+    return True
+
+
+def _get_s3_upload_checksums(s3, body: bytes) -> dict:
+    # Checksum arguments for a verified PUT or part upload: a CRC32 checksum, which S3 validates the body against and
+    # stores with the object, and, if the endpoint is known not to support flexible checksums, an MD5, which S3
+    # validates the body against instead. botocore does not compute a checksum of its own for a request that already
+    # has one.
+    checksums = {"ChecksumCRC32": base64.b64encode(_compute_s3_checksum("ChecksumCRC32", body)).decode("utf-8")}
+    if _s3FlexibleChecksumSupport.get(s3.meta.endpoint_url) is False:
+        checksums["ContentMD5"] = base64.b64encode(_compute_s3_checksum("ETag", body)).decode("utf-8")
+    return checksums
+
+
+def _check_s3_upload_checksums(s3, response: dict, body: bytes, checksums: dict, description: str) -> bool:
+    # Check the response to a verified PUT or part upload. An endpoint that does not return the CRC32 checksum that was
+    # sent does not support flexible checksums, so the ETag is checked against the MD5 of the body instead; the body
+    # is still in memory, so this does not read the data again. Returns False if the upload cannot be verified.
+    if response.get("ChecksumCRC32"):
+        _s3FlexibleChecksumSupport[s3.meta.endpoint_url] = True
+        return _check_s3_checksum(response, "ChecksumCRC32", checksums["ChecksumCRC32"], description)
+    _s3FlexibleChecksumSupport.setdefault(s3.meta.endpoint_url, False)
+    if "ContentMD5" in checksums:
+        return _check_s3_checksum(response, "ETag", base64.b64decode(checksums["ContentMD5"]).hex(), description)
+    return _check_s3_checksum(response, "ETag", _compute_s3_checksum("ETag", body).hex(), description)
+
+
+def _get_s3_part_entry(partNumber: int, response: dict) -> dict:
+    # Part entry for CompleteMultipartUpload, from the response to UploadPart or from ListParts
+    part = {"PartNumber": partNumber, "ETag": response["ETag"]}
+    if response.get("ChecksumCRC32"):
+        part["ChecksumCRC32"] = response["ChecksumCRC32"]
+    return part
+
+
+def _check_s3_multipart_upload_checksums(response: dict, parts: list, description: str) -> bool:
+    # Check the checksum of a completed multipart upload against the checksums of its parts, which were checked as the
+    # parts were uploaded (or, for parts uploaded before a resume, were computed by S3); returns False if the upload
+    # cannot be verified
+    if response.get("ChecksumCRC32") and all(part.get("ChecksumCRC32") for part in parts):
+        partDigests = [base64.b64decode(part["ChecksumCRC32"]) for part in parts]
+        return _check_s3_checksum(response, "ChecksumCRC32", _format_s3_checksum("ChecksumCRC32", partDigests, multipart=True), description)
+    if not all(_is_s3_etag_verifiable(part) for part in parts):
+        return False
+    partDigests = [bytes.fromhex(part["ETag"].strip('"')) for part in parts]
+    return _check_s3_checksum(response, "ETag", _format_s3_checksum("ETag", partDigests, multipart=True), description)
+
+
+def _is_transient_s3_error(err: Exception) -> bool:
+    # Follow the chain of wrapped errors; the toolkit wraps S3 errors in APIConnectionError, and boto3 wraps client
+    # errors in S3UploadFailedError and exhausted retries in RetriesExceededError; data that was corrupted in
+    # transit is transferred again
+    seenErrors = set()
+    while err is not None and id(err) not in seenErrors:
+        seenErrors.add(id(err))
+        if isinstance(err, _S3ChecksumMismatchError):
+            return True
+        if isinstance(err, (botocoreExceptions.ConnectionError, botocoreExceptions.HTTPClientError, botocoreExceptions.IncompleteReadError, ConnectionError, TimeoutError)):
+            return True
+        if isinstance(err, botocoreExceptions.ClientError):
+            errorCode = err.response.get("Error", {}).get("Code")
+            statusCode = err.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+            return statusCode >= 500 or errorCode in _S3_TRANSIENT_ERROR_CODES
+        if isinstance(err, boto3Exceptions.RetriesExceededError):
+            err = err.last_exception
+        elif isinstance(err, APIConnectionError) and err.args and isinstance(err.args[0], BaseException):
+            err = err.args[0]
+        else:
+            err = err.__cause__ or err.__context__
+    return False
+
+
+def _run_s3_transfer(transfer, max_retries: int, progress: _S3TransferProgress = None, **kwargs) -> dict:
+    # Run an object transfer, retrying transient failures with exponential backoff and full jitter; errors are
+    # returned instead of raised, so that the caller can report every failure of a bulk transfer. With progress, each
+    # attempt reports the bytes that it transfers through a progress callback.
+    startTime = time.monotonic()
+    retries = 0
+    while True:
+        callback, rewind = progress.attempt() if progress else (None, None)
+        try:
+            result = transfer(callback=callback, **kwargs)
+            if progress:
+                progress.finish_object()
+            return {"Retries": retries, "Latency": time.monotonic() - startTime, "Error": None, "Result": result}
+        except Exception as err:
+            if progress:
+                rewind()
+            if retries >= max_retries or not _is_transient_s3_error(err):
+                if progress:
+                    progress.finish_object(failed=True)
+                if isinstance(err, APIConnectionError) and err.args:
+                    err = err.args[0]
+                return {"Retries": retries, "Latency": time.monotonic() - startTime, "Error": str(err), "Result": None,
+                        "Checksum Mismatch": isinstance(err, _S3ChecksumMismatchError)}
+            retries += 1
+            backoff = random.uniform(0, min(_S3_RETRY_MAX_BACKOFF, _S3_RETRY_BASE_BACKOFF * 2 ** retries))
+            if kwargs.get("print_output"):
+                print("Warning: Transient S3 API error, retrying in " + str(round(backoff, 1)) + " seconds (retry " + str(retries) + " of " + str(max_retries) + "): ", err)
+            time.sleep(backoff)
+
+
+def _print_s3_transfer_report(report: dict):
+    print("Transferred " + str(report["Objects"]) + " object(s) (" + _convert_bytes_to_pretty_size(report["Bytes"]) + ") in "
+          + str(round(report["Elapsed Time"], 2)) + " seconds (" + _convert_bytes_to_pretty_size(report["Throughput"]) + "/s); skipped "
+          + str(report["Skipped"]) + ", retried " + str(report["Retries"]) + ", failed " + str(report["Failures"]) + ".")
+    if report["Latency P50"] is not None:
+        print("Per-object latency: p50 " + str(round(report["Latency P50"], 3)) + " seconds, p99 " + str(round(report["Latency P99"], 3)) + " seconds.")
+    if report["Verified"] or report["Unverified"] or report["Checksum Mismatches"]:
+        print("Verified " + str(report["Verified"]) + " object(s); " + str(report["Unverified"]) + " object(s) could not be verified; "
+              + str(report["Checksum Mismatches"]) + " checksum mismatch(es).")
+    for failedObject in report["Failed Objects"]:
+        print("Error: Failed to transfer object '" + failedObject["Key"] + "': ", failedObject["Error"])
+
+
+def _snapshot_policy_exists(snapshot_policy: str, svm: str) -> bool:
+    # Check for a cluster-scoped snapshot policy or a snapshot policy owned by the svm
+    snapshotPoliciesDetails = netappResources.SnapshotPolicy.get_collection(**{"name": snapshot_policy})
+    for snapshotPolicyDetails in snapshotPoliciesDetails:
+        if str(snapshotPolicyDetails.name) == snapshot_policy:
+            try:
+                if str(snapshotPolicyDetails.svm.name) == svm:
+                    return True
+            except:
+                return True
+    return False
+
+
+def _create_consistency_group_snapshot(volume_names: list, svm: str, snapshot_name: str, snapmirror_label: str = None,
+                                       poll_timeout: float = 600, print_output: bool = False) -> list:
+    # Snapshot many volumes at a single point in time by adding them to a temporary consistency group, taking a
+    # snapshot of the group and deleting the group again; deleting a consistency group keeps its volumes and snapshots.
+    # Raises NetAppRestError if the group cannot be created (e.g. ONTAP older than 9.10, or a volume that is already
+    # a member of another consistency group)
+    consistencyGroupName = "netapp_dataops_" + uuid.uuid4().hex[:12]
+    consistencyGroup = netappResources.ConsistencyGroup.from_dict({
+        "name": consistencyGroupName,
+        "svm": {"name": svm},
+        "volumes": [{"name": volume_name, "provisioning_options": {"action": "add"}} for volume_name in volume_names]
+    })
+    try:
+        consistencyGroup.post(poll=True, poll_interval=1, poll_timeout=poll_timeout)
+        if not getattr(consistencyGroup, "uuid", None):
+            consistencyGroup = netappResources.ConsistencyGroup.find(**{"name": consistencyGroupName, "svm.name": svm})
+            if not consistencyGroup:
+                raise netappError.NetAppRestError("Consistency group '" + consistencyGroupName + "' was not found after it was created.")
+
+        snapshotDict = {"name": snapshot_name, "consistency_type": "crash"}
+        if snapmirror_label:
+            snapshotDict["snapmirror_label"] = snapmirror_label
+        snapshot = netappResources.ConsistencyGroupSnapshot(consistencyGroup.uuid, **snapshotDict)
+        snapshot.post(poll=True, poll_interval=1, poll_timeout=poll_timeout)
+    finally:
+        # The group may have been created even if the create job failed or timed out; look it up by name if its uuid is
+        # not known, so that its volumes are not left as members of it
+        try:
+            if not getattr(consistencyGroup, "uuid", None):
+                consistencyGroup = netappResources.ConsistencyGroup.find(**{"name": consistencyGroupName, "svm.name": svm})
+            if consistencyGroup:
+                consistencyGroup.delete(poll=True, poll_interval=1, poll_timeout=poll_timeout)
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Warning: Could not delete temporary consistency group '" + consistencyGroupName + "': ", err)
+
+    return [{"Volume Name": volume_name, "Snapshot Name": snapshot_name, "Method": "consistency group", "Status": "success", "Total Time": None, "Error": None}
+            for volume_name in volume_names]
+
+
+def _wait_for_jobs(job_uuids: list, timeout: float = 120, poll_interval: float = 1) -> dict:
+    # Poll many ONTAP jobs together, retrieving the state of up to _QUERY_BATCH_SIZE jobs per API call,
+    # until every job has reached a terminal state or the timeout has elapsed
+    jobs = {jobUUID: {"state": "queued", "message": None, "endTime": None} for jobUUID in job_uuids}
+    pending = list(jobs.keys())
+    deadline = time.monotonic() + timeout
+    while pending:
+        for i in range(0, len(pending), _QUERY_BATCH_SIZE):
+            batch = pending[i:i + _QUERY_BATCH_SIZE]
+            returned = set()
+            for job in netappResources.Job.get_collection(uuid="|".join(batch), fields="state,message"):
+                returned.add(job.uuid)
+                jobs[job.uuid]["state"] = job.state
+                jobs[job.uuid]["message"] = getattr(job, "message", None)
+                if job.state in _JOB_TERMINAL_STATES:
+                    jobs[job.uuid]["endTime"] = time.monotonic()
+
+            # ONTAP removes the records of completed jobs after a while, so a job that is not returned may have either
+            # succeeded or failed; its state is reported as unknown, and it is not polled any further
+            for jobUUID in batch:
+                if jobUUID not in returned:
+                    jobs[jobUUID]["state"] = _JOB_UNKNOWN_STATE
+                    jobs[jobUUID]["message"] = "Job " + jobUUID + " was not found; it may have been removed after it completed."
+
+        pending = [jobUUID for jobUUID in pending if jobs[jobUUID]["state"] not in _JOB_TERMINAL_STATES + (_JOB_UNKNOWN_STATE,)]
+        if pending:
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+
+    return jobs
+
+
+def _upload_to_s3(s3, s3Bucket: str, localFile: str, s3ObjectKey: str, s3ExtraArgs: str = None, transferConfig: boto3Transfer.TransferConfig = None,
+                  journal: _S3TransferJournal = None, verify: bool = False, callback=None, print_output: bool = False) -> bool:
+    # Upload file; with verify, returns True if the upload was verified, or False if it could not be verified; callback,
+    # if specified, is called with the number of bytes uploaded as the upload progresses
+    if print_output:
+        print("Uploading file '" + localFile + "' to bucket '" + s3Bucket + "' and applying key '" + s3ObjectKey + "'.")
+
+    verified = None
+    try:
+        # Large files that are part of a journaled transfer are uploaded using a multipart upload that is recorded
+        # in the journal, so that the upload can be resumed if the transfer is interrupted; verified uploads hash each
+        # part as it is read, so they do not use upload_file either
+        if (journal or verify) and os.path.getsize(localFile) >= (transferConfig or boto3Transfer.TransferConfig()).multipart_threshold:
+            verified = _multipart_upload_to_s3(s3=s3, s3Bucket=s3Bucket, localFile=localFile, s3ObjectKey=s3ObjectKey,
+                                               s3ExtraArgs=json.loads(s3ExtraArgs) if s3ExtraArgs else dict(),
+                                               transferConfig=transferConfig or boto3Transfer.TransferConfig(), journal=journal, verify=verify,
+                                               callback=callback, print_output=print_output)
+        elif verify:
+            with open(localFile, "rb") as file:
+                body = file.read()
+            checksums = _get_s3_upload_checksums(s3, body)
+            response = s3.put_object(Bucket=s3Bucket, Key=s3ObjectKey, Body=body, **checksums, **(json.loads(s3ExtraArgs) if s3ExtraArgs else dict()))
+            verified = _check_s3_upload_checksums(s3, response, body, checksums, s3ObjectKey)
+            if callback:
+                callback(len(body))
+        elif s3ExtraArgs:
+            s3.upload_file(Filename=localFile, Bucket=s3Bucket, Key=s3ObjectKey, ExtraArgs=json.loads(s3ExtraArgs), Config=transferConfig, Callback=callback)
+        else:
+            s3.upload_file(Filename=localFile, Bucket=s3Bucket, Key=s3ObjectKey, Config=transferConfig, Callback=callback)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    if verified is False and print_output:
+        print("Warning: Upload of file '" + localFile + "' to object '" + s3ObjectKey + "' could not be verified.")
+    return verified
+
+
+def _multipart_upload_to_s3(s3, s3Bucket: str, localFile: str, s3ObjectKey: str, s3ExtraArgs: dict, transferConfig: boto3Transfer.TransferConfig,
+                            journal: _S3TransferJournal = None, verify: bool = False, callback=None, print_output: bool = False) -> bool:
+    # With verify, a checksum of each part is computed as the part is read and sent with the part, so that S3 rejects a
+    # corrupted part, and the checksums that S3 returns for the parts and for the completed object are checked
+    localFileStat = os.stat(localFile)
+    uploadId = None
+    uploadedParts = dict()
+
+    # Resume multipart upload that was started by an interrupted transfer, if the file has not changed since
+    multipartUpload = journal.get_multipart_upload(s3ObjectKey) if journal else None
+    if multipartUpload and multipartUpload[1:3] == (localFileStat.st_size, localFileStat.st_mtime_ns):
+        uploadId, size, mtimeNs, partSize = multipartUpload
+        try:
+            for page in s3.get_paginator("list_parts").paginate(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=uploadId):
+                for part in page.get("Parts", []):
+                    uploadedParts[part["PartNumber"]] = _get_s3_part_entry(part["PartNumber"], part) if verify else {"PartNumber": part["PartNumber"], "ETag": part["ETag"]}
+            if print_output:
+                print("Resuming multipart upload of file '" + localFile + "' (" + str(len(uploadedParts)) + " part(s) already uploaded).")
+        except s3.exceptions.NoSuchUpload:
+            uploadId = None
+            uploadedParts = dict()
+
+    # Start new multipart upload and record it in journal
+    if not uploadId:
+        partSize = s3transferUtils.ChunksizeAdjuster().adjust_chunksize(transferConfig.multipart_chunksize, localFileStat.st_size)
+        checksumArgs = {"ChecksumAlgorithm": "CRC32"} if verify else dict()
+        uploadId = s3.create_multipart_upload(Bucket=s3Bucket, Key=s3ObjectKey, **checksumArgs, **s3ExtraArgs)["UploadId"]
+        if journal:
+            journal.start_multipart_upload(key=s3ObjectKey, upload_id=uploadId, size=localFileStat.st_size,
+                                           mtime_ns=localFileStat.st_mtime_ns, part_size=partSize)
+
+    def upload_part(partNumber: int) -> dict:
+        with open(localFile, "rb") as file:
+            file.seek((partNumber - 1) * partSize)
+            body = file.read(partSize)
+        if not verify:
+            partEntry = {"PartNumber": partNumber, "ETag": s3.upload_part(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=uploadId, PartNumber=partNumber, Body=body)["ETag"]}
+        else:
+            checksums = _get_s3_upload_checksums(s3, body)
+            response = s3.upload_part(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=uploadId, PartNumber=partNumber, Body=body, **checksums)
+            _check_s3_upload_checksums(s3, response, body, checksums, s3ObjectKey + " (part " + str(partNumber) + ")")
+            partEntry = _get_s3_part_entry(partNumber, response)
+        if callback:
+            callback(len(body))
+        return partEntry
+
+    # Upload remaining parts in parallel; parts that were uploaded by an interrupted transfer count as progress
+    partCount = max(1, -(-localFileStat.st_size // partSize))
+    if callback and uploadedParts:
+        callback(sum(min(partSize, localFileStat.st_size - (partNumber - 1) * partSize) for partNumber in uploadedParts if partNumber <= partCount))
+    with ThreadPoolExecutor(max_workers=transferConfig.max_request_concurrency) as executor:
+        futures = {partNumber: executor.submit(upload_part, partNumber) for partNumber in range(1, partCount + 1) if partNumber not in uploadedParts}
+        for partNumber, future in futures.items():
+            uploadedParts[partNumber] = future.result()
+
+    parts = [uploadedParts[partNumber] for partNumber in range(1, partCount + 1)]
+    response = s3.complete_multipart_upload(Bucket=s3Bucket, Key=s3ObjectKey, UploadId=uploadId, MultipartUpload={"Parts": parts})
+    if verify:
+        return _check_s3_multipart_upload_checksums(response, parts, s3ObjectKey)
+    return None
+
+
+def _get_tar_member_size(memberName: str, fileSize: int) -> int:
+    # Size of a tar member, including its header and the pax header that carries its sub-second mtime (and, for long
+    # member names, its name)
+    headerSize = tarfile.BLOCKSIZE * (2 + -(-(len(memberName.encode("utf-8")) + 64) // tarfile.BLOCKSIZE))
+    return headerSize + -(-fileSize // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+
+
+def _plan_tar_shards(files: list, shardSize: int) -> list:
+    # Group (localFile, memberName, fileSize) tuples into shards of approximately shardSize bytes each; returns a list
+    # of (files, estimated shard size) tuples
+    shards = list()
+    shardFiles = list()
+    estimatedShardSize = 0
+    for localFile, memberName, fileSize in files:
+        memberSize = _get_tar_member_size(memberName, fileSize)
+        if shardFiles and estimatedShardSize + memberSize > shardSize:
+            shards.append((shardFiles, estimatedShardSize))
+            shardFiles = list()
+            estimatedShardSize = 0
+        shardFiles.append((localFile, memberName, fileSize))
+        estimatedShardSize += memberSize
+    if shardFiles:
+        shards.append((shardFiles, estimatedShardSize))
+    return shards
+
+
+def _push_tar_shard_to_s3(s3, s3Bucket: str, s3ObjectKey: str, files: list, partSize: int, s3ExtraArgs: dict = None,
+                          verify: bool = False, callback=None, print_output: bool = False) -> tuple:
+    # Stream files into a tar shard that is uploaded while it is being written; returns the number of bytes in the
+    # shard, a list of (member name, data offset, size) tuples for the index, and, with verify, whether the shard was
+    # verified; callback, if specified, is called with the size of each part of the shard once it has been uploaded
+    if print_output:
+        print("Uploading shard '" + s3ObjectKey + "' (" + str(len(files)) + " file(s)) to bucket '" + s3Bucket + "'.")
+
+    stream = _S3MultipartUploadStream(s3, bucket=s3Bucket, key=s3ObjectKey, part_size=partSize, extra_args=s3ExtraArgs, verify=verify,
+                                      callback=callback)
+    members = list()
+    try:
+        with tarfile.open(fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+            for localFile, memberName, fileSize in files:
+                tarInfo = tar.gettarinfo(name=localFile, arcname=memberName)
+                with open(localFile, "rb") as file:
+                    tar.addfile(tarInfo, file)
+                members.append((memberName, tar.offset - -(-tarInfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE, tarInfo.size))
+        stream.close()
+    except Exception as err:
+        stream.abort()
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    return stream.bytes_written, members, stream.verified
+
+
+def _get_local_path_for_tar_member(localDirectory: str, memberName: str) -> str:
+    # Refuse to extract members to a path outside of the local directory
+    localDirectory = os.path.abspath(localDirectory)
+    localFile = os.path.normpath(os.path.join(localDirectory, memberName))
+    if os.path.isabs(memberName) or not localFile.startswith(localDirectory + os.sep):
+        raise ValueError("Shard member '" + memberName + "' would be extracted outside of directory '" + localDirectory + "'.")
+    return localFile
+
+
+def _pull_tar_shard_from_s3(s3, s3Bucket: str, s3ObjectKey: str, localDirectory: str, verify: bool = False, callback=None,
+                            print_output: bool = False) -> tuple:
+    # Stream tar shard from S3 and extract each member as it arrives; returns the number of files extracted and, with
+    # verify, whether the shard was verified; callback, if specified, is called with the number of bytes read from the
+    # shard as it is extracted. A full-object flexible checksum is validated by botocore as the shard is
+    # streamed; a composite checksum or ETag is computed from the stream as it is extracted, which works because
+    # shards are uploaded in equal-sized parts, so the part size of a multipart shard is the size of its first part.
+    if print_output:
+        print("Downloading shard '" + s3ObjectKey + "' from bucket '" + s3Bucket + "' and extracting to '" + localDirectory + "'.")
+
+    fileCount = 0
+    verified = None
+    try:
+        response = s3.get_object(Bucket=s3Bucket, Key=s3ObjectKey, **({"ChecksumMode": "ENABLED"} if verify else dict()))
+        body = response["Body"]
+        checksumField = next((field for field in _S3_CHECKSUM_FIELDS if response.get(field)), None) if verify else None
+        fullObjectChecksum = checksumField is not None and "-" not in response[checksumField]
+        checksum = None
+        if verify and not fullObjectChecksum:
+            if checksumField not in _S3_CHECKSUM_ALGORITHMS:
+                checksumField = "ETag"
+            if checksumField != "ETag" or _is_s3_etag_verifiable(response):
+                partSize = None
+                if "-" in response[checksumField]:
+                    partSize = s3.head_object(Bucket=s3Bucket, Key=s3ObjectKey, PartNumber=1, IfMatch=response["ETag"])["ContentLength"]
+                checksum = _S3StreamChecksum(field=checksumField, part_size=partSize)
+                body = _S3ChecksumReader(body, checksum)
+        if callback:
+            body = _S3ProgressReader(body, callback)
+        try:
+            with tarfile.open(fileobj=body, mode="r|") as tar:
+                for member in tar:
+                    localFile = _get_local_path_for_tar_member(localDirectory, member.name)
+                    if member.isdir():
+                        os.makedirs(localFile, exist_ok=True)
+                        continue
+                    if not member.isfile():
+                        if print_output:
+                            print("Warning: Skipping shard member '" + member.name + "', which is not a regular file.")
+                        continue
+                    os.makedirs(os.path.dirname(localFile), exist_ok=True)
+                    with open(localFile, "wb") as file:
+                        shutil.copyfileobj(tar.extractfile(member), file)
+                    os.utime(localFile, (member.mtime, member.mtime))
+                    fileCount += 1
+        except tarfile.TarError:
+            # A corrupted shard is reported as a checksum mismatch, so that it is downloaded again
+            if verify:
+                while body.read(1024 ** 2):
+                    pass
+                if checksum:
+                    _check_s3_checksum(response, checksum.field, checksum.value(), s3ObjectKey)
+            raise
+        if verify:
+            # Read the padding that follows the end of the archive, so that the whole shard is checked
+            while body.read(1024 ** 2):
+                pass
+            verified = _check_s3_checksum(response, checksum.field, checksum.value(), s3ObjectKey) if checksum else fullObjectChecksum
+    except botocoreExceptions.FlexibleChecksumError as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(_S3ChecksumMismatchError("Checksum mismatch for '" + s3ObjectKey + "': " + str(err)))
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    return fileCount, verified
+
+
+def _write_s3_shard_index(s3, s3Bucket: str, s3ObjectKeyPrefix: str, shards: list, members: list):
+    # Index lists each shard as [key, size], and each member as [member name, shard number, data offset, size]; keys
+    # are relative to the key prefix, so that a set of shards can be copied to a different prefix
+    index = {"format": "tar", "shards": shards, "members": members}
+    s3.put_object(Bucket=s3Bucket, Key=s3ObjectKeyPrefix + _S3_SHARD_INDEX_KEY, ContentType="application/gzip",
+                  Body=gzip.compress(json.dumps(index, separators=(",", ":")).encode("utf-8")))
+
+
+def _read_s3_shard_index(s3, s3Endpoint: str, s3Bucket: str, s3ObjectKeyPrefix: str) -> dict:
+    # Retrieve shard index, reusing the cached index if the index object has not changed; member entries are returned
+    # in a dict, keyed by member name
+    indexKey = s3ObjectKeyPrefix + _S3_SHARD_INDEX_KEY
+    cacheKey = (s3Endpoint, s3Bucket, indexKey)
+    etag = s3.head_object(Bucket=s3Bucket, Key=indexKey)["ETag"]
+    cachedIndex = _shardIndexCache.get(cacheKey)
+    if cachedIndex and cachedIndex[0] == etag:
+        return cachedIndex[1]
+
+    response = s3.get_object(Bucket=s3Bucket, Key=indexKey)
+    index = json.loads(gzip.decompress(response["Body"].read()))
+    index["members"] = {memberName: (shardNumber, offset, size) for memberName, shardNumber, offset, size in index["members"]}
+    _shardIndexCache[cacheKey] = (response.get("ETag", etag), index)
+    return index
+
+
+def _convert_bytes_to_pretty_size(size_in_bytes: str, num_decimal_points: int = 2) -> str :
+    # Convert size in bytes to "pretty" size (size in KB, MB, GB, or TB)
+    prettySize = float(size_in_bytes) / 1024
+    if prettySize >= 1024:
+        prettySize = float(prettySize) / 1024
+        if prettySize >= 1024:
+            prettySize = float(prettySize) / 1024
+            if prettySize >= 1024:
+                prettySize = float(prettySize) / 1024
+                prettySize = round(prettySize, 2)
+                prettySize = str(prettySize) + "TB"
+            else:
+                prettySize = round(prettySize, 2)
+                prettySize = str(prettySize) + "GB"
+        else:
+            prettySize = round(prettySize, 2)
+            prettySize = str(prettySize) + "MB"
+    else:
+        prettySize = round(prettySize, 2)
+        prettySize = str(prettySize) + "KB"
+
+    return prettySize
+
+
+#
+# Public importable functions specific to the traditional package
+#
+
+
+def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: str = None, source_snapshot_name: str = None,
+                 source_svm: str = None, target_svm: str = None, export_hosts: str = None, export_policy: str = None, split: bool = False, 
+                 unix_uid: str = None, unix_gid: str = None, mountpoint: str = None, junction: str= None, readonly: bool = False,
+                 snapshot_policy: str = None, refresh: bool = False, svm_dr_unprotect: bool = False, wait_until_complete: bool = True,
+                 print_output: bool = False):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+    
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve values from config file if not passed into function
+        try:            
+            sourcesvm = config["svm"]
+            if source_svm: 
+                sourcesvm = source_svm 
+            
+            targetsvm = sourcesvm
+            if target_svm:
+                targetsvm = target_svm 
+
+            if not unix_uid:
+                unix_uid = config["defaultUnixUID"]
+            if not unix_gid:
+                unix_gid = config["defaultUnixGID"]
+
+        except Exception as e:
+            if print_output:
+                print(e)
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Check unix uid for validity
+        try:
+            unix_uid = int(unix_uid)
+        except:
+            if print_output:
+                print("Error: Invalid unix uid specified. Value be an integer. Example: '0' for root user.")
+            raise InvalidVolumeParameterError("unixUID")
+
+        # Check unix gid for validity
+        try:
+            unix_gid = int(unix_gid)
+        except:
+            if print_output:
+                print("Error: Invalid unix gid specified. Value must be an integer. Example: '0' for root group.")
+            raise InvalidVolumeParameterError("unixGID")
+
+        # Steps that operate on the new clone cannot be performed without waiting for the clone to be created
+        if not wait_until_complete and (split or mountpoint or svm_dr_unprotect):
+            if print_output:
+                print("Error: split, mountpoint and svm_dr_unprotect cannot be used when wait_until_complete is False.")
+            raise InvalidVolumeParameterError("wait_until_complete")
+
+        #check if clone volume already exists 
+        try:
+            currentVolume = netappResources.Volume.find(name=new_volume_name, svm=targetsvm)        
+            if currentVolume and not refresh:
+                if print_output:
+                    print("Error: clone:"+new_volume_name+" already exists.")
+                raise InvalidVolumeParameterError("name") 
+            
+            #for refresh we want to keep the existing policy
+            if currentVolume and refresh and not export_policy and not export_hosts:
+                export_policy = currentVolume.nas.export_policy.name
+
+            # if refresh and not provided new snapshot_policy
+            if currentVolume and refresh and not snapshot_policy:                
+                snapshot_policy = currentVolume.snapshot_policy.name
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+        
+        #delete existing clone when refresh
+        try:
+            if currentVolume and refresh:
+                if "CLONENAME:" in currentVolume.comment:
+                    delete_volume(volume_name=new_volume_name, cluster_name=cluster_name, svm_name=target_svm, delete_mirror=True, print_output=True)
+                else:
+                    if print_output:
+                        print("Error: refresh clone is only supported when existing clone created using the tool (based on volume comment)")
+                    raise InvalidVolumeParameterError("name")                
+        except:
+            print("Error: could not delete previous clone")
+            raise InvalidVolumeParameterError("name")       
+        
+        try:
+            if not snapshot_policy :                
+                snapshot_policy = config["defaultSnapshotPolicy"]
+        except:
+            print("Error: default snapshot policy could not be found in config file")
+            raise InvalidVolumeParameterError("name")   
+
+        # check export policies; a custom export policy is only created for export_hosts if no export policy was specified
+        createExportPolicy = False
+        try:
+            if not export_policy and not export_hosts:
+                export_policy = config["defaultExportPolicy"]
+            elif export_policy:
+                currentExportPolicy = netappResources.ExportPolicy.find(name=export_policy, svm=targetsvm)
+                if not currentExportPolicy:
+                    if print_output:
+                        print("Error: export policy:"+export_policy+" dones not exists.")
+                    raise InvalidVolumeParameterError("name")
+            elif export_hosts:
+                export_policy = "netapp_dataops_"+new_volume_name
+                createExportPolicy = True
+                currentExportPolicy = netappResources.ExportPolicy.find(name=export_policy, svm=targetsvm)
+                if currentExportPolicy:
+                    currentExportPolicy.delete()
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        #exists check if snapshot-policy 
+        try:
+            if not _snapshot_policy_exists(snapshot_policy=snapshot_policy, svm=targetsvm):
+                if print_output:
+                    print("Error: snapshot-policy:"+snapshot_policy+" could not be found")
+                raise InvalidVolumeParameterError("snapshot_policy")                
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)            
+
+        # Create volume
+        if print_output:
+            print("Creating clone volume '" + targetsvm+':'+new_volume_name + "' from source volume '" + sourcesvm+':'+source_volume_name + "'.")
+
+        try:
+            # Retrieve source volume
+            sourceVolume = netappResources.Volume.find(name=source_volume_name, svm=sourcesvm)
+            if not sourceVolume:
+                if print_output:
+                    print("Error: Invalid source volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            # Create option to choose junction path.
+            if junction:
+                junction=junction
+            else:
+                junction = "/"+new_volume_name
+           
+
+            # Construct dict representing new volume
+            newVolumeDict = {
+                "name": new_volume_name,
+                "svm": {"name": targetsvm},
+                "nas": {
+                    "path": junction
+                },
+                "clone": {
+                    "is_flexclone": True,
+                    "parent_svm": {
+                        #"name": sourceVolume.svm.name,
+                        "name": sourcesvm,
+                        #"uuid": sourceVolume.svm.uuid
+                    },
+                    "parent_volume": {
+                        "name": sourceVolume.name,
+                        "uuid": sourceVolume.uuid
+                    }
+                }
+            }
+            
+            if unix_uid != 0:
+                newVolumeDict["nas"]["uid"] = unix_uid
+            else:
+                if print_output:
+                    print("Warning: Cannot apply uid of '0' when creating clone; uid of source volume will be retained.")
+            if unix_gid != 0:
+                newVolumeDict["nas"]["gid"] = unix_gid
+            else:
+                if print_output:
+                    print("Warning: Cannot apply gid of '0' when creating clone; gid of source volume will be retained.")
+
+            # Add source snapshot details to volume dict if specified
+            if source_snapshot_name and not source_snapshot_name.endswith("*"):
+                # Retrieve source snapshot
+                sourceSnapshot = netappResources.Snapshot.find(sourceVolume.uuid, name=source_snapshot_name)
+                if not sourceSnapshot:
+                    if print_output:
+                        print("Error: Invalid source snapshot name.")
+                    raise InvalidSnapshotParameterError("name")
+              
+
+                # Append source snapshot details to volume dict
+                newVolumeDict["clone"]["parent_snapshot"] = {
+                    "name": sourceSnapshot.name,
+                    "uuid": sourceSnapshot.uuid
+                }
+            
+            if source_snapshot_name and source_snapshot_name.endswith("*"):
+                source_snapshot_prefix = source_snapshot_name[:-1]
+
+                # Retrieve latest source snapshot matching prefix 
+                latest_source_snapshot = _find_latest_snapshot(sourceVolume.uuid, source_snapshot_prefix)
+                if not latest_source_snapshot:
+                    if print_output:
+                        print("Error: Could not find snapshot prefixed by '"+source_snapshot_prefix+"'.")
+                    raise InvalidSnapshotParameterError("name")
+                # Append source snapshot details to volume dict
+                newVolumeDict["clone"]["parent_snapshot"] = {
+                    "name": latest_source_snapshot.name,
+                    "uuid": latest_source_snapshot.uuid
+                }
+                print("Snapshot '" + latest_source_snapshot.name+ "' will be used to create the clone.")   
+
+            # set clone volume commnet parameter 
+            comment = 'PARENTSVM:'+sourcesvm+',PARENTVOL:'+newVolumeDict["clone"]["parent_volume"]["name"]+',CLONESVM:'+targetsvm+',CLONENAME:'+newVolumeDict["name"]
+            if source_snapshot_name: comment += ' SNAP:'+newVolumeDict["clone"]["parent_snapshot"]["name"] 
+            comment += " netapp-dataops"
+            
+            newVolumeDict["comment"] = comment
+
+            if not wait_until_complete:
+                # Export policy and snapshot policy are applied as part of the clone request, as opposed to being
+                # patched onto the clone once it has been created
+                newVolumeDict["nas"]["export_policy"] = {"name": export_policy}
+                newVolumeDict["snapshot_policy"] = {"name": snapshot_policy}
+
+                # The custom export policy must therefore exist before the clone request is submitted; it is deleted
+                # again if the clone request is rejected
+                if createExportPolicy:
+                    if print_output:
+                        print("Creating export-policy:"+export_policy)
+                    newExportPolicy = netappResources.ExportPolicy.from_dict(_construct_export_policy_dict(export_policy, targetsvm, export_hosts))
+                    newExportPolicy.post(poll=True, poll_timeout=120)
+                try:
+                    response = netappResources.Volume.from_dict(newVolumeDict).post(poll=False)
+                except netappError.NetAppRestError:
+                    if createExportPolicy:
+                        try:
+                            newExportPolicy = netappResources.ExportPolicy.find(name=export_policy, svm=targetsvm)
+                            if newExportPolicy:
+                                newExportPolicy.delete()
+                        except netappError.NetAppRestError as err:
+                            if print_output:
+                                print("Warning: Could not delete export-policy:"+export_policy+": ", err)
+                    raise
+                return _create_job_handle(response, description="clone volume '"+targetsvm+':'+new_volume_name+"'", print_output=print_output)
+
+            # Create new volume clone 
+            newVolume = netappResources.Volume.from_dict(newVolumeDict)
+            newVolume.post(poll=True, poll_timeout=120)
+            if print_output:
+                print("Clone volume created successfully.")
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        if svm_dr_unprotect:
+            try:
+                if print_output:
+                    print("Disabling svm-dr protection")                 
+                response = netappResources.CLI().execute("volume modify",vserver=targetsvm,volume=new_volume_name,body={"vserver_dr_protection": "unprotected"})
+            except netappError.NetAppRestError as err:
+                if "volume is not part of a Vserver DR configuration" in str(err):
+                    if print_output:
+                        print("Warning: could not disable svm-dr-protection since volume is not protected using svm-dr")                    
+                else:
+                    if print_output:
+                        print("Error: ONTAP Rest API Error: ", err)                    
+                    raise APIConnectionError(err)                
+
+        #create custom export policy if needed 
+        if createExportPolicy:
+            try:            
+                if print_output:
+                    print("Creating export-policy:"+export_policy)                  
+                newExportPolicy = netappResources.ExportPolicy.from_dict(_construct_export_policy_dict(export_policy, targetsvm, export_hosts))
+                newExportPolicy.post(poll=True, poll_timeout=120)
+              
+            except netappError.NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)
+
+        #set export policy and snapshot policy 
+        try:
+            if print_output:
+                print("Setting export-policy:"+export_policy+ " snapshot-policy:"+snapshot_policy) 
+            volumeDetails = netappResources.Volume.find(name=new_volume_name, svm=targetsvm)   
+            updatedVolumeDetails = netappResources.Volume(uuid=volumeDetails.uuid)
+            updatedVolumeDetails.nas = {"export_policy": {"name": export_policy}}
+            updatedVolumeDetails.snapshot_policy = {"name": snapshot_policy}
+            updatedVolumeDetails.patch(poll=True, poll_timeout=120) 
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)              
+
+        #split clone 
+        try:
+            if split: 
+                if print_output:
+                    print("Splitting clone") 
+                volumeDetails = netappResources.Volume.find(name=new_volume_name, svm=targetsvm)                    
+                #get volume details 
+                updatedVolumeDetails = netappResources.Volume(uuid=volumeDetails.uuid)        
+                updatedVolumeDetails.clone = {"split_initiated": True}
+                updatedVolumeDetails.patch()   
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)            
+
+        # Optionally mount newly created volume
+        if mountpoint:
+            try:
+                mount_volume(volume_name=new_volume_name, svm_name=targetsvm, mountpoint=mountpoint, readonly=readonly, print_output=True)
+            except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
+                if print_output:
+                    print("Error: Error mounting clone volume.")
+                raise
+
+    else:
+        raise ConnectionTypeError()
+
+
+def clone_volumes_bulk(new_volume_names: list, source_volume_name: str, source_snapshot_name: str = None, cluster_name: str = None,
+                       source_svm: str = None, target_svm: str = None, export_policy: str = None, snapshot_policy: str = None,
+                       unix_uid: str = None, unix_gid: str = None, max_workers: int = 8, poll_timeout: float = 600,
+                       print_output: bool = False) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve values from config file if not passed into function
+        try:
+            sourcesvm = config["svm"]
+            if source_svm:
+                sourcesvm = source_svm
+
+            targetsvm = sourcesvm
+            if target_svm:
+                targetsvm = target_svm
+
+            if not unix_uid:
+                unix_uid = config["defaultUnixUID"]
+            if not unix_gid:
+                unix_gid = config["defaultUnixGID"]
+            if not export_policy:
+                export_policy = config["defaultExportPolicy"]
+            if not snapshot_policy:
+                snapshot_policy = config["defaultSnapshotPolicy"]
+        except Exception as e:
+            if print_output:
+                print(e)
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Check unix uid and gid for validity
+        try:
+            unix_uid = int(unix_uid)
+        except:
+            if print_output:
+                print("Error: Invalid unix uid specified. Value be an integer. Example: '0' for root user.")
+            raise InvalidVolumeParameterError("unixUID")
+        try:
+            unix_gid = int(unix_gid)
+        except:
+            if print_output:
+                print("Error: Invalid unix gid specified. Value must be an integer. Example: '0' for root group.")
+            raise InvalidVolumeParameterError("unixGID")
+
+        # Check list of clone names for validity
+        if not new_volume_names or len(set(new_volume_names)) != len(new_volume_names):
+            if print_output:
+                print("Error: A list of unique clone volume names must be specified.")
+            raise InvalidVolumeParameterError("name")
+
+        # Look up everything that is shared between the clones once, before any clone is submitted
+        try:
+            # Check if any of the clone volumes already exist
+            existingVolumeNames = list()
+            for i in range(0, len(new_volume_names), _QUERY_BATCH_SIZE):
+                batch = new_volume_names[i:i + _QUERY_BATCH_SIZE]
+                for volume in netappResources.Volume.get_collection(svm=targetsvm, name="|".join(batch), fields="name"):
+                    existingVolumeNames.append(volume.name)
+            if existingVolumeNames:
+                if print_output:
+                    print("Error: clone(s):" + ",".join(existingVolumeNames) + " already exist.")
+                raise InvalidVolumeParameterError("name")
+
+            # Check export policy and snapshot policy
+            if not netappResources.ExportPolicy.find(name=export_policy, svm=targetsvm):
+                if print_output:
+                    print("Error: export policy:"+export_policy+" dones not exists.")
+                raise InvalidVolumeParameterError("export_policy")
+            if not _snapshot_policy_exists(snapshot_policy=snapshot_policy, svm=targetsvm):
+                if print_output:
+                    print("Error: snapshot-policy:"+snapshot_policy+" could not be found")
+                raise InvalidVolumeParameterError("snapshot_policy")
+
+            # Retrieve source volume
+            sourceVolume = netappResources.Volume.find(name=source_volume_name, svm=sourcesvm)
+            if not sourceVolume:
+                if print_output:
+                    print("Error: Invalid source volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            # Retrieve source snapshot; a trailing '*' selects the latest snapshot matching the prefix
+            sourceSnapshot = None
+            if source_snapshot_name and source_snapshot_name.endswith("*"):
+                source_snapshot_prefix = source_snapshot_name[:-1]
+                sourceSnapshot = _find_latest_snapshot(sourceVolume.uuid, source_snapshot_prefix)
+                if not sourceSnapshot:
+                    if print_output:
+                        print("Error: Could not find snapshot prefixed by '"+source_snapshot_prefix+"'.")
+                    raise InvalidSnapshotParameterError("name")
+                if print_output:
+                    print("Snapshot '" + sourceSnapshot.name + "' will be used to create the clones.")
+            elif source_snapshot_name:
+                sourceSnapshot = netappResources.Snapshot.find(sourceVolume.uuid, name=source_snapshot_name)
+                if not sourceSnapshot:
+                    if print_output:
+                        print("Error: Invalid source snapshot name.")
+                    raise InvalidSnapshotParameterError("name")
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        if print_output:
+            print("Creating " + str(len(new_volume_names)) + " clone volumes in svm '" + targetsvm + "' from source volume '" + sourcesvm+':'+source_volume_name + "'.")
+            if unix_uid == 0:
+                print("Warning: Cannot apply uid of '0' when creating clone; uid of source volume will be retained.")
+            if unix_gid == 0:
+                print("Warning: Cannot apply gid of '0' when creating clone; gid of source volume will be retained.")
+
+        startTime = time.monotonic()
+
+        def submit_clone(new_volume_name: str) -> dict:
+            result = {"Volume Name": new_volume_name, "Status": "submitted", "Job UUID": None, "Submit Time": None, "Total Time": None, "Error": None}
+            try:
+                newVolumeDict = _construct_clone_dict(new_volume_name=new_volume_name, source_svm=sourcesvm, target_svm=targetsvm,
+                                                     source_volume=sourceVolume, source_snapshot=sourceSnapshot, export_policy=export_policy,
+                                                     snapshot_policy=snapshot_policy, unix_uid=unix_uid, unix_gid=unix_gid)
+                response = netappResources.Volume.from_dict(newVolumeDict).post(poll=False)
+                result["Job UUID"] = _get_job_uuid(response)
+                if not result["Job UUID"]:
+                    result["Status"] = "success"
+            except netappError.NetAppRestError as err:
+                result["Status"] = "failure"
+                result["Error"] = str(err)
+            result["Submit Time"] = round(time.monotonic() - startTime, 3)
+            if not result["Job UUID"]:
+                result["Total Time"] = result["Submit Time"]
+            return result
+
+        # Submit clone requests concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(new_volume_names)))) as executor:
+            results = list(executor.map(submit_clone, new_volume_names))
+
+        # Poll all clone jobs together
+        jobUUIDs = [result["Job UUID"] for result in results if result["Job UUID"]]
+        try:
+            jobs = _wait_for_jobs(jobUUIDs, timeout=poll_timeout)
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        for result in results:
+            job = jobs.get(result["Job UUID"])
+            if not job:
+                continue
+            if job["state"] == "success":
+                result["Status"] = "success"
+            elif job["state"] in _JOB_TERMINAL_STATES:
+                result["Status"] = "failure"
+                result["Error"] = job["message"]
+            elif job["state"] == _JOB_UNKNOWN_STATE:
+                result["Status"] = "unknown"
+                result["Error"] = job["message"]
+            else:
+                result["Status"] = "timeout"
+                result["Error"] = "Job did not complete within " + str(poll_timeout) + " seconds."
+            if job["endTime"]:
+                result["Total Time"] = round(job["endTime"] - startTime, 3)
+
+        if print_output:
+            print(tabulate.tabulate([result.values() for result in results], headers=list(results[0].keys())))
+            failedCount = len([result for result in results if result["Status"] != "success"])
+            if failedCount:
+                print("Error: " + str(failedCount) + " of " + str(len(results)) + " clone volumes could not be created.")
+            else:
+                print("Clone volumes created successfully.")
+
+        return results
+
+    else:
+        raise ConnectionTypeError()
+
+
+def configure_connection_pool(max_size: int = None, idle_timeout: float = None):
+    # Apply new limits to the process-wide ONTAP connection pool; a max_size of 0 disables pooling
+    _connectionPool.configure(max_size=max_size, idle_timeout=idle_timeout)
+
+
+def configure_data_lif_cache(ttl: float = None, clear: bool = False):
+    # Apply a new TTL (in seconds) to the process-wide data LIF cache; clear discards all cached LIFs
+    _dataLifCache.configure(ttl=ttl)
+    if clear:
+        _dataLifCache.clear()
+
+
+def create_snapshot(volume_name: str, cluster_name: str = None, svm_name: str = None, snapshot_name: str = None, retention_count: int = 0, retention_days: bool = False, snapmirror_label: str = None,
+                    wait_until_complete: bool = True, print_output: bool = False):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        if not snapshot_name:
+            snapshot_name = "netapp_dataops"
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name 
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Snapshots exceeding the retention count cannot be determined until the new snapshot has been created
+        if not wait_until_complete and int(retention_count) > 0:
+            if print_output:
+                print("Error: retention_count cannot be used when wait_until_complete is False.")
+            raise InvalidSnapshotParameterError("wait_until_complete")
+
+        snapshot_name_original = snapshot_name
+        # Set snapshot name if not passed into function or retention provided 
+        if not snapshot_name or int(retention_count) > 0:
+            timestamp = '.'+datetime.datetime.today().strftime("%Y-%m-%d_%H%M%S")
+            snapshot_name += timestamp
+
+        if print_output:
+            print("Creating snapshot '" + snapshot_name + "'.")
+
+        try:
+            # Retrieve volume
+            volume = netappResources.Volume.find(name=volume_name, svm=svm)
+            if not volume:
+                if print_output:
+                    print("Error: Invalid volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            # create snapshot dict 
+            snapshotDict = {
+                'name': snapshot_name,
+                'volume': volume.to_dict()
+            }
+            if snapmirror_label:
+                if print_output:
+                    print("Setting snapmirror label as:"+snapmirror_label)                
+                snapshotDict['snapmirror_label'] = snapmirror_label
+
+            # Create snapshot
+            snapshot = netappResources.Snapshot.from_dict(snapshotDict)
+            response = snapshot.post(poll=wait_until_complete)
+            if not wait_until_complete:
+                return _create_job_handle(response, description="create snapshot '"+snapshot_name+"'", print_output=print_output)
+
+            if print_output:
+                print("Snapshot created successfully.")
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        #delete snapshots exceeding retention count if provided
+        retention_count = int(retention_count)  
+        if retention_count > 0:
+            try:  
+                # Retrieve all source snapshot from last to 1st 
+                # Retrieve volume
+                volume = netappResources.Volume.find(name=volume_name, svm=svm)
+                if not volume:
+                    if print_output:
+                        print("Error: Invalid volume name.")
+                    raise InvalidVolumeParameterError("name")    
+
+                snapshots = _get_snapshot_collection(volume.uuid, name_prefix=snapshot_name_original+'.')
+                expiredSnapshots = _get_snapshots_exceeding_retention(snapshots, snapshot_name_prefix=snapshot_name_original,
+                                                                      retention_count=retention_count, retention_days=retention_days)
+
+                #delete snapshots not in retention 
+                for snap in expiredSnapshots:
+                    delete_snapshot(volume_name=volume_name, svm_name = svm, snapshot_name=snap, skip_owned=True, print_output=True)
+
+            except netappError.NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)                                   
+    else:
+        raise ConnectionTypeError()
+
+
+def create_snapshots(volume_names: list, cluster_name: str = None, svm_name: str = None, snapshot_name: str = None, snapmirror_label: str = None,
+                     consistent: bool = True, max_workers: int = 8, poll_timeout: float = 600, print_output: bool = False) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Check list of volume names for validity
+        if not volume_names or len(set(volume_names)) != len(volume_names):
+            if print_output:
+                print("Error: A list of unique volume names must be specified.")
+            raise InvalidVolumeParameterError("name")
+
+        # Set snapshot name if not passed into function
+        if not snapshot_name:
+            snapshot_name = "netapp_dataops" + '.' + datetime.datetime.today().strftime("%Y-%m-%d_%H%M%S")
+
+        # Retrieve all volumes in batches
+        volumes = dict()
+        try:
+            for i in range(0, len(volume_names), _QUERY_BATCH_SIZE):
+                batch = volume_names[i:i + _QUERY_BATCH_SIZE]
+                for volume in netappResources.Volume.get_collection(svm=svm, name="|".join(batch), fields="name,uuid"):
+                    volumes[volume.name] = volume
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+        invalidVolumeNames = [volume_name for volume_name in volume_names if volume_name not in volumes]
+        if invalidVolumeNames:
+            if print_output:
+                print("Error: Invalid volume name(s) specified: " + ",".join(invalidVolumeNames) + ".")
+            raise InvalidVolumeParameterError("name")
+
+        if print_output:
+            if consistent:
+                print("Creating consistent snapshot '" + snapshot_name + "' of " + str(len(volume_names)) + " volumes in svm '" + svm + "'.")
+            else:
+                print("Creating snapshot '" + snapshot_name + "' of " + str(len(volume_names)) + " volumes in svm '" + svm + "'.")
+
+        startTime = time.monotonic()
+        results = None
+
+        # A single snapshot of a temporary consistency group is a crash-consistent point in time across all volumes;
+        # a snapshot of a single volume is consistent on its own
+        if consistent and len(volume_names) > 1:
+            try:
+                results = _create_consistency_group_snapshot(volume_names=volume_names, svm=svm, snapshot_name=snapshot_name,
+                                                             snapmirror_label=snapmirror_label, poll_timeout=poll_timeout,
+                                                             print_output=print_output)
+            except netappError.NetAppRestError as err:
+                if print_output:
+                    print("Warning: Could not create a consistency group snapshot; snapshotting the volumes in parallel instead: ", err)
+            if results:
+                for result in results:
+                    result["Total Time"] = round(time.monotonic() - startTime, 3)
+
+        if not results:
+            def submit_snapshot(volume_name: str) -> dict:
+                result = {"Volume Name": volume_name, "Snapshot Name": snapshot_name, "Method": "parallel", "Status": "submitted", "Job UUID": None, "Total Time": None, "Error": None}
+                try:
+                    snapshotDict = {
+                        'name': snapshot_name,
+                        'volume': {'uuid': volumes[volume_name].uuid, 'name': volume_name}
+                    }
+                    if snapmirror_label:
+                        snapshotDict['snapmirror_label'] = snapmirror_label
+                    response = netappResources.Snapshot.from_dict(snapshotDict).post(poll=False)
+                    result["Job UUID"] = _get_job_uuid(response)
+                    if not result["Job UUID"]:
+                        result["Status"] = "success"
+                except netappError.NetAppRestError as err:
+                    result["Status"] = "failure"
+                    result["Error"] = str(err)
+                result["Total Time"] = round(time.monotonic() - startTime, 3)
+                return result
+
+            # Submit snapshot requests concurrently
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(volume_names)))) as executor:
+                results = list(executor.map(submit_snapshot, volume_names))
+
+            # Poll all snapshot jobs together
+            jobUUIDs = [result["Job UUID"] for result in results if result["Job UUID"]]
+            try:
+                jobs = _wait_for_jobs(jobUUIDs, timeout=poll_timeout)
+            except netappError.NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)
+
+            for result in results:
+                job = jobs.get(result.pop("Job UUID"))
+                if not job:
+                    continue
+                if job["state"] == "success":
+                    result["Status"] = "success"
+                elif job["state"] in _JOB_TERMINAL_STATES:
+                    result["Status"] = "failure"
+                    result["Error"] = job["message"]
+                elif job["state"] == _JOB_UNKNOWN_STATE:
+                    result["Status"] = "unknown"
+                    result["Error"] = job["message"]
+                else:
+                    result["Status"] = "timeout"
+                    result["Error"] = "Job did not complete within " + str(poll_timeout) + " seconds."
+                if job["endTime"]:
+                    result["Total Time"] = round(job["endTime"] - startTime, 3)
+
+        if print_output:
+            print(tabulate.tabulate([result.values() for result in results], headers=list(results[0].keys())))
+            failedCount = len([result for result in results if result["Status"] != "success"])
+            if failedCount:
+                print("Error: " + str(failedCount) + " of " + str(len(results)) + " snapshots could not be created.")
+            else:
+                print("Snapshots created successfully in " + str(round(time.monotonic() - startTime, 3)) + " seconds.")
+
+        return results
+
+    else:
+        raise ConnectionTypeError()
+
+
+def create_volume(volume_name: str, volume_size: str, guarantee_space: bool = False, cluster_name: str = None, svm_name: str = None,
+                  volume_type: str = "flexvol", unix_permissions: str = "0777",
+                  unix_uid: str = "0", unix_gid: str = "0", export_policy: str = "default",
+                  snapshot_policy: str = None, aggregate: str = None, mountpoint: str = None, junction: str = None, readonly: bool = False,
+                  print_output: bool = False, tiering_policy: str = None, vol_dp: bool = False, wait_until_complete: bool = True):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve values from config file if not passed into function
+        try:
+            svm = config["svm"]
+            if svm_name: 
+                svm = svm_name 
+            if not volume_type :
+                volume_type = config["defaultVolumeType"]
+            if not unix_permissions :
+                unix_permissions = config["defaultUnixPermissions"]
+            if not unix_uid :
+                unix_uid = config["defaultUnixUID"]
+            if not unix_gid :
+                unix_gid = config["defaultUnixGID"]
+            if not export_policy :
+                export_policy = config["defaultExportPolicy"]
+            if not snapshot_policy :
+                snapshot_policy = config["defaultSnapshotPolicy"]
+            if not aggregate and volume_type == 'flexvol' :
+                aggregate = config["defaultAggregate"]
+        except:
+            if print_output :
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Check volume type for validity
+        if volume_type not in ("flexvol", "flexgroup"):
+            if print_output:
+                print("Error: Invalid volume type specified. Acceptable values are 'flexvol' and 'flexgroup'.")
+            raise InvalidVolumeParameterError("size")
+
+        # Check unix permissions for validity
+        if not re.search("^0[0-7]{3}", unix_permissions):
+            if print_output:
+                print("Error: Invalid unix permissions specified. Acceptable values are '0777', '0755', '0744', etc.")
+            raise InvalidVolumeParameterError("unixPermissions")
+
+        # Check unix uid for validity
+        try:
+            unix_uid = int(unix_uid)
+        except:
+            if print_output :
+                print("Error: Invalid unix uid specified. Value be an integer. Example: '0' for root user.")
+            raise InvalidVolumeParameterError("unixUID")
+
+        # Check unix gid for validity
+        try:
+            unix_gid = int(unix_gid)
+        except:
+            if print_output:
+                print("Error: Invalid unix gid specified. Value must be an integer. Example: '0' for root group.")
+            raise InvalidVolumeParameterError("unixGID")
+
+        # Convert volume size to Bytes
+        if re.search("^[0-9]+MB$", volume_size):
+            # Convert from MB to Bytes
+            volumeSizeBytes = int(volume_size[:len(volume_size)-2]) * 1024**2
+        elif re.search("^[0-9]+GB$", volume_size):
+            # Convert from GB to Bytes
+            volumeSizeBytes = int(volume_size[:len(volume_size)-2]) * 1024**3
+        elif re.search("^[0-9]+TB$", volume_size):
+            # Convert from TB to Bytes
+            volumeSizeBytes = int(volume_size[:len(volume_size)-2]) * 1024**4
+        else :
+            if print_output:
+                print("Error: Invalid volume size specified. Acceptable values are '1024MB', '100GB', '10TB', etc.")
+            raise InvalidVolumeParameterError("size")
+
+        # Create option to choose junction path.
+        if junction:
+            junction=junction
+        else:
+            junction = "/"+volume_name
+
+
+        #check tiering policy        
+        if not tiering_policy in ['none','auto','snapshot-only','all', None]:
+            if print_output:
+                print("Error: tiering policy can be: none,auto,snapshot-only or all")
+            raise InvalidVolumeParameterError("tieringPolicy")     
+
+        #vol dp type 
+        if vol_dp:
+            # Create dict representing volume of type dp
+            volumeDict = {
+                "name": volume_name,
+                "comment": "netapp-dataops",
+                "svm": {"name": svm},
+                "size": volumeSizeBytes,
+                "style": volume_type,
+                "type": 'dp'
+            }
+        else:
+            # Create dict representing volume
+            volumeDict = {
+                "name": volume_name,
+                "comment": "netapp-dataops",
+                "svm": {"name": svm},
+                "size": volumeSizeBytes,
+                "style": volume_type,
+                "nas": {
+                    "path": junction,
+                    "export_policy": {"name": export_policy},
+                    "security_style": "unix",
+                    "unix_permissions": unix_permissions,
+                    "uid": unix_uid,
+                    "gid": unix_gid
+                },
+                "snapshot_policy": {"name": snapshot_policy},          
+            }
+
+        # Set space guarantee field
+        if guarantee_space:
+            volumeDict["guarantee"] = {"type": "volume"}
+        else:
+            volumeDict["guarantee"] = {"type": "none"}
+
+        # If flexvol -> set aggregate field
+        if volume_type == "flexvol":
+            volumeDict["aggregates"] = [{'name': aggregate}]
+        else:
+            if aggregate:
+                volumeDict["aggregates"] = []
+                for aggr in aggregate.split(','):
+                    volumeDict["aggregates"].append({'name': aggr}) 
+        #if tiering policy provided 
+        if tiering_policy:
+            volumeDict['tiering'] = {'policy': tiering_policy}
+
+        # The new volume cannot be mounted without waiting for it to be created
+        if not wait_until_complete and mountpoint:
+            if print_output:
+                print("Error: mountpoint cannot be used when wait_until_complete is False.")
+            raise InvalidVolumeParameterError("wait_until_complete")
+
+        # Create volume
+        if print_output:
+            print("Creating volume '" + volume_name + "' on svm '" + svm + "'")
+        try:
+            volume = netappResources.Volume.from_dict(volumeDict)
+            response = volume.post(poll=wait_until_complete)
+            if not wait_until_complete:
+                return _create_job_handle(response, description="create volume '"+svm+':'+volume_name+"'", print_output=print_output)
+            if print_output:
+                print("Volume created successfully.")
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Optionally mount newly created volume
+        if mountpoint:
+            try:
+                mount_volume(volume_name=volume_name, svm_name=svm, mountpoint=mountpoint, readonly=readonly, print_output=True)
+            except (InvalidConfigError, APIConnectionError, InvalidVolumeParameterError, MountOperationError):
+                if print_output:
+                    print("Error: Error mounting volume.")
+                raise
+
+    else:
+        raise ConnectionTypeError()
+
+
+def delete_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = None, svm_name: str = None, skip_owned: bool = False, print_output: bool = False):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+            if svm_name: 
+                svm = svm_name 
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        if print_output:
+            print("Deleting snapshot '" + snapshot_name + "'.")
+
+        try:
+            # Retrieve volume
+            volume = netappResources.Volume.find(name=volume_name, svm=svm)
+            if not volume:
+                if print_output:
+                    print("Error: Invalid volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            # Retrieve snapshot, including owners
+            snapshot = next(iter(_get_snapshot_collection(volume.uuid, name=snapshot_name)), None)
+
+            if not snapshot:
+                if print_output:
+                    print("Error: Invalid snapshot name.")
+                raise InvalidSnapshotParameterError("name")
+            
+            if hasattr(snapshot,'owners'):
+                   
+                if not skip_owned:
+                    if print_output:
+                        print('Error: Snapshot cannot be deleted since it has owners:'+','.join(snapshot.owners))
+                    raise InvalidSnapshotParameterError("name")
+                else:
+                    if print_output:
+                        print('Warning: Snapshot cannot be deleted since it has owners:'+','.join(snapshot.owners))
+                    return
+
+            # Delete snapshot
+            snapshot.delete(poll=True)
+
+            if print_output:
+                print("Snapshot deleted successfully.")
+
+        except netappError.NetAppRestError as err :
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+    else:
+        raise ConnectionTypeError()
+
+
+def delete_volume(volume_name: str, cluster_name: str = None, svm_name: str = None, delete_mirror: bool = False, 
+                delete_non_clone: bool = False, wait_until_complete: bool = True, print_output: bool = False):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name
+        except:
+            if print_output :
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        try:
+            # Retrieve volume
+            volume = netappResources.Volume.find(name=volume_name, svm=svm)
+            if not volume:
+                if print_output:
+                    print("Error: Invalid volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            if not "CLONENAME:" in volume.comment and not delete_non_clone:
+                if print_output:
+                    print("Error: volume is not a clone created by this tool. add --delete-non-clone to delete it")
+                raise InvalidVolumeParameterError("delete-non-clone")                
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+
+        if delete_mirror:
+            #check if this volume has snapmirror destination relationship
+            uuid = None
+            try:
+                snapmirror_relationship = netappResources.SnapmirrorRelationship.get_collection(**{"destination.path": svm+":"+volume_name})
+                for rel in snapmirror_relationship:
+                    # Retrieve relationship details
+                    rel.get()
+                    uuid = rel.uuid
+            except netappError.NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)                
+
+            if uuid: 
+                if print_output:
+                    print("Deleting snapmirror relationship: "+svm+":"+volume_name)                
+                try:
+                    deleteRelation = netappResources.SnapmirrorRelationship(uuid=uuid)
+                    deleteRelation.delete(poll=True, poll_timeout=120)
+                except netappError.NetAppRestError as err:
+                    if print_output:
+                        print("Error: ONTAP Rest API Error: ", err)                  
+
+            #check if this volume has snapmirror destination relationship
+            uuid = None
+            try:
+                snapmirror_relationship = netappResources.SnapmirrorRelationship.get_collection(list_destinations_only=True,**{"source.path": svm+":"+volume_name})
+                for rel in snapmirror_relationship:
+                    # Retrieve relationship details
+                    rel.get(list_destinations_only=True)
+                    uuid = rel.uuid
+                    if print_output:
+                        print("release relationship: "+rel.source.path+" -> "+rel.destination.path)   
+                    deleteRelation = netappResources.SnapmirrorRelationship(uuid=uuid)
+                    deleteRelation.delete(poll=True, poll_timeout=120,source_only=True)
+            except netappError.NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)                         
+
+        try:
+            if print_output:
+                print("Deleting volume '" + svm+':'+volume_name + "'.")
+            # Delete volume
+            response = volume.delete(poll=wait_until_complete)
+            if not wait_until_complete:
+                return _create_job_handle(response, description="delete volume '"+svm+':'+volume_name+"'", print_output=print_output)
+
+            if print_output:
+                print("Volume deleted successfully.")
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                if "You must delete the SnapMirror relationships before" in str(err):
+                    print("Error: volume is snapmirror destination. add --delete-mirror to delete snapmirror relationship before deleting the volume")                
+                elif "the source endpoint of one or more SnapMirror relationships" in str(err):
+                    print("Error: volume is snapmirror source. add --delete-mirror to release snapmirror relationship before deleting the volume")                
+                else:
+                    print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+    else:
+        raise ConnectionTypeError()
+
+
+def find_latest_snapshot(volume_name: str, prefix: str, cluster_name: str = None, svm_name: str = None, print_output: bool = False) -> dict:
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Accept prefix in the same 'prefix*' form that clone_volume accepts
+        if prefix.endswith("*"):
+            prefix = prefix[:-1]
+
+        try:
+            # Retrieve volume
+            volume = netappResources.Volume.find(name=volume_name, svm=svm)
+            if not volume:
+                if print_output:
+                    print("Error: Invalid volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            # Retrieve latest snapshot matching prefix
+            snapshot = _find_latest_snapshot(volume.uuid, prefix)
+            if not snapshot:
+                if print_output:
+                    print("Error: Could not find snapshot prefixed by '" + prefix + "'.")
+                raise InvalidSnapshotParameterError("name")
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Construct dict of snapshot details
+        snapshotDict = {"Snapshot Name": snapshot.name, "Create Time": snapshot.create_time}
+
+        if print_output:
+            print("Latest snapshot prefixed by '" + prefix + "': " + snapshot.name + " (" + str(snapshot.create_time) + ")")
+
+        return snapshotDict
+
+    else:
+        raise ConnectionTypeError()
+
+
+def get_connection_pool_stats(print_output: bool = False) -> dict:
+    # Retrieve counters and request timings for the ONTAP connection pool
+    stats = _connectionPool.stats()
+
+    # Print connection pool stats
+    if print_output:
+        print(tabulate.tabulate(stats.items(), headers=["Metric", "Value"]))
+
+    return stats
+
+
+def list_cloud_sync_relationships(print_output: bool = False) -> list():
+    # Step 1: Obtain access token and account ID for accessing Cloud Sync API
+
+    # Retrieve refresh token
+    try:
+        refreshToken = _retrieve_cloud_central_refresh_token(print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Obtain access token and account ID
+    try:
+        accessToken, accountId = _get_cloud_sync_access_parameters(refreshToken=refreshToken, print_output=print_output)
+    except APIConnectionError:
+        raise
+
+    # Step 2: Retrieve list of relationships
+
+    # Define parameters for API call
+    url = "https://cloudsync.netapp.com/api/relationships-v2"
+    headers = {
+        "Accept": "application/json",
+        "x-account-id": accountId,
+        "Authorization": "Bearer " + accessToken
+    }
+
+    # Call API to retrieve list of relationships
+    response = requests.get(url = url, headers = headers)
+
+    # Check for API response status code of 200; if not 200, raise error
+    if response.status_code != 200:
+        errorMessage = "Error calling Cloud Sync API to retrieve list of relationships."
+        if print_output:
+            print("Error:", errorMessage)
+            _print_api_response(response)
+        raise APIConnectionError(errorMessage, response)
+
+    # Constrict list of relationships
+    relationships = json.loads(response.text)
+    relationshipsList = list()
+    for relationship in relationships:
+        relationshipDetails = dict()
+        relationshipDetails["id"] = relationship["id"]
+        relationshipDetails["source"] = relationship["source"]
+        relationshipDetails["target"] = relationship["target"]
+        relationshipsList.append(relationshipDetails)
+
+    # Print list of relationships
+    if print_output:
+        print(yaml.dump(relationshipsList))
+
+    return relationshipsList
+
+
+def list_snap_mirror_relationships(print_output: bool = False, cluster_name: str = None) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        try:
+            # Retrieve all relationships for which destination is on current cluster
+            destinationRelationships = netappResources.SnapmirrorRelationship.get_collection()
+
+            # Do not retrieve relationships for which source is on current cluster
+            # Note: Uncomment below line to retrieve all relationships for which source is on current cluster, then add sourceRelationships to for loop
+            # sourceRelationships = netappResources.SnapmirrorRelationship.get_collection(list_destinations_only=True)
+
+            # Construct list of relationships
+            relationshipsList = list()
+            for relationship in destinationRelationships:
+                # Retrieve relationship details
+                try:
+                    relationship.get()
+                except netappError.NetAppRestError as err:
+                    relationship.get(list_destinations_only=True)
+
+                # Set cluster value
+                if hasattr(relationship.source, "cluster"):
+                    sourceCluster = relationship.source.cluster.name
+                else:
+                    sourceCluster = "user's cluster"
+                if hasattr(relationship.destination, "cluster"):
+                    destinationCluster = relationship.destination.cluster.name
+                else:
+                    destinationCluster = "user's cluster"
+
+                # Set transfer state value
+                if hasattr(relationship, "transfer"):
+                    transferState = relationship.transfer.state
+                else:
+                    transferState = None
+
+                # Set healthy value
+                if hasattr(relationship, "healthy"):
+                    healthy = relationship.healthy
+                else:
+                    healthy = "unknown"
+
+                # Construct dict containing relationship details
+                relationshipDict = {
+                    "UUID": relationship.uuid,
+                    "Type": relationship.policy.type,
+                    "Healthy": healthy,
+                    "Current Transfer Status": transferState,
+                    "Source Cluster": sourceCluster,
+                    "Source SVM": relationship.source.svm.name,
+                    "Source Volume": relationship.source.path.split(":")[1],
+                    "Dest Cluster": destinationCluster,
+                    "Dest SVM": relationship.destination.svm.name,
+                    "Dest Volume": relationship.destination.path.split(":")[1]
+                }
+
+                # Append dict to list of relationships
+                relationshipsList.append(relationshipDict)
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Print list of relationships
+        if print_output:
+            print(tabulate.tabulate(relationshipsList, headers="keys"))
+
+        return relationshipsList
+
+    else:
+        raise ConnectionTypeError()
+
+
+def list_snapshots(volume_name: str, cluster_name: str = None, svm_name: str = None, print_output: bool = False) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+    
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Retrieve snapshots
+        try:
+            # Retrieve volume
+            volume = netappResources.Volume.find(name=volume_name, svm=svm)
+            if not volume:
+                if print_output:
+                    print("Error: Invalid volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            # Construct list of snapshots
+            snapshotsList = list()
+            for snapshot in _get_snapshot_collection(volume.uuid):
+                # Construct dict of snapshot details
+                snapshotDict = {"Snapshot Name": snapshot.name, "Create Time": snapshot.create_time}
+
+                # Append dict to list of snapshots
+                snapshotsList.append(snapshotDict)
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Print list of snapshots
+        if print_output:
+            print(tabulate.tabulate(snapshotsList, headers="keys"))
+
+        return snapshotsList
+
+    else:
+        raise ConnectionTypeError()
+
+
+def list_data_lifs(cluster_name: str = None, svm_name: str = None, refresh: bool = False, print_output: bool = False) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+        svm = config["svm"]
+        if svm_name:
+            svm = svm_name
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve NFS data LIFs from the cache, discovering them if they are not cached or the cached entry has expired
+        try:
+            lifs = _dataLifCache.get(hostname=config["hostname"], svm=svm, refresh=refresh)
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Return copies so that callers cannot modify the cached entries
+        lifsList = [dict(lif) for lif in lifs]
+
+        # Print list of LIFs
+        if print_output:
+            if lifsList:
+                print(tabulate.tabulate(lifsList, headers="keys"))
+            else:
+                print("No NFS data LIFs are up in svm '" + svm + "'.")
+
+        return lifsList
+
+    else:
+        raise ConnectionTypeError()
+
+
+def list_volumes(check_local_mounts: bool = False, include_space_usage_details: bool = False, print_output: bool = False, cluster_name: str = None, svm_name: str = None) -> list():
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output :
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        try:
+            svmname=config["svm"]
+            if svm_name:
+                svmname = svm_name 
+
+            # Retrieve all volumes for SVM; required fields are retrieved as part of the collection query
+            volumeFields = "nas.path,size,style,clone,flexcache_endpoint_type"
+            fallbackVolumeFields = None
+            if include_space_usage_details :
+                fallbackVolumeFields = volumeFields + ",space"
+                volumeFields += ",space,constituents"
+            volumes = _get_volume_collection(svm=svmname, fields=volumeFields, fallback_fields=fallbackVolumeFields)
+
+            # Retrieve local mounts if desired
+            mounts = None
+            if check_local_mounts :
+                mounts = _read_local_mounts()
+
+            # Construct list of volumes as pages are retrieved; do not include SVM root volume
+            volumesList = list()
+            for volume in volumes:
+                volumeDict = _construct_volume_dict(volume=volume, config=config, svm=svmname,
+                                                    include_space_usage_details=include_space_usage_details, mounts=mounts)
+                if volumeDict:
+                    volumesList.append(volumeDict)
+
+        except netappError.NetAppRestError as err:
+            if print_output :
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        # Print list of volumes
+        if print_output:
+            print(tabulate.tabulate(volumesList, headers="keys"))
+
+        return volumesList
+
+    else:
+        raise ConnectionTypeError()
+
+
+def mount_volume(volume_name: str, mountpoint: str, cluster_name: str = None, svm_name: str = None, lif_name: str = None, readonly: bool = False, mount_options: str = None,
+                 lif_policy: str = None, print_output: bool = False):
+    nfsMountTarget = None
+    
+    svm = None
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+        svm = config["svm"]
+        if svm_name:
+            svm = svm_name
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType != "ONTAP":
+        raise ConnectionTypeError()
+
+    if lif_policy and lif_policy not in _DATA_LIF_POLICIES:
+        if print_output:
+            print("Error: Invalid lif policy specified. Must be one of: " + ", ".join(_DATA_LIF_POLICIES) + ".")
+        raise InvalidVolumeParameterError("lif_policy")
+
+    # Check that nothing is currently mounted at specified mountpoint
+    mountedSource = _read_local_mounts().sources_by_mountpoint.get(os.path.realpath(os.path.expanduser(mountpoint)))
+    if mountedSource:
+        if print_output:
+            print("Error: '" + mountedSource + "' is already mounted at '" + mountpoint + "'.")
+        raise MountOperationError("Another volume mounted at mountpoint")
+
+    # Retrieve NFS mount target for volume; only the export path of the volume is retrieved, so that the time that
+    # this takes does not depend on the number of volumes in the SVM
+    try:
+        _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+    except InvalidConfigError:
+        if print_output:
+            print("Error: Error retrieving NFS mount target for volume.")
+        raise
+    try:
+        volume = netappResources.Volume.find(name=volume_name, svm=svm, fields="nas.path,aggregates.name" if lif_policy == "local" else "nas.path")
+    except netappError.NetAppRestError as err:
+        if print_output:
+            print("Error: ONTAP Rest API Error: ", err)
+        raise APIConnectionError(err)
+    if volume and hasattr(volume, "nas") and hasattr(volume.nas, "path") and volume.nas.path != "/":
+        nfsMountTarget = _build_nfs_mount_target(volumeExportPath=volume.nas.path, config=config, svm=svm)
+
+    # Raise error if invalid volume name was entered
+    if not nfsMountTarget:
+        if print_output:
+            print("Error: Invalid volume name specified.")
+        raise InvalidVolumeParameterError("name")
+
+    # Pick a data LIF by policy, unless a LIF was specified
+    if lif_policy and not lif_name:
+        try:
+            lif_name = _select_data_lifs(volumes=[volume], config=config, svm=svm, lif_policy=lif_policy).get(volume.name)
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+        if not lif_name and print_output:
+            print("Warning: No NFS data LIFs are up in svm '" + svm + "'; the default NFS mount target will be used.")
+    
+    try:
+        if lif_name:
+            nfsMountTarget = lif_name+':'+nfsMountTarget.split(':')[1]
+    except:
+        if print_output:
+            print("Error: Error retrieving NFS mount target for volume.")
+        raise
+
+    # Print message describing action to be understaken
+    if print_output:
+        if readonly:
+            print("Mounting volume '" + svm+':'+volume_name + "' as '"+nfsMountTarget+"' at '" + mountpoint + "' as read-only.")
+        else:
+            print("Mounting volume '" + svm+':'+volume_name + "' as '"+nfsMountTarget+"' at '" + mountpoint + "'.")
+
+    # Mount volume
+    try:
+        _mount_nfs_target(nfsMountTarget=nfsMountTarget, mountpoint=mountpoint, readonly=readonly, mount_options=mount_options)
+        if print_output:
+            print("Volume mounted successfully.")
+    except (subprocess.CalledProcessError, OSError) as err:
+        if print_output:
+            print("Error: Error running mount command: ", err)
+        raise MountOperationError(err)
+
+
+def mount_volumes(volume_names: list, mountpoints: list, cluster_name: str = None, svm_name: str = None, lif_names: list = None,
+                  readonly: bool = False, mount_options: str = None, lif_policy: str = None, max_workers: int = 8,
+                  print_output: bool = False) -> list():
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+        svm = config["svm"]
+        if svm_name:
+            svm = svm_name
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType != "ONTAP":
+        raise ConnectionTypeError()
+
+    # Check list of volume names and mountpoints for validity
+    if not volume_names or len(set(volume_names)) != len(volume_names):
+        if print_output:
+            print("Error: A list of unique volume names must be specified.")
+        raise InvalidVolumeParameterError("name")
+    if not mountpoints or len(mountpoints) != len(volume_names) or len(set(mountpoints)) != len(mountpoints):
+        if print_output:
+            print("Error: A unique mountpoint must be specified for each volume.")
+        raise InvalidVolumeParameterError("mountpoint")
+    if lif_policy and lif_policy not in _DATA_LIF_POLICIES:
+        if print_output:
+            print("Error: Invalid lif policy specified. Must be one of: " + ", ".join(_DATA_LIF_POLICIES) + ".")
+        raise InvalidVolumeParameterError("lif_policy")
+
+    # Check that nothing is currently mounted at any of the specified mountpoints
+    mounts = _read_local_mounts()
+    mountedMountpoints = [mountpoint for mountpoint in mountpoints if os.path.realpath(os.path.expanduser(mountpoint)) in mounts.sources_by_mountpoint]
+    if mountedMountpoints:
+        if print_output:
+            print("Error: Another volume is already mounted at mountpoint(s): " + ",".join(mountedMountpoints) + ".")
+        raise MountOperationError("Another volume mounted at mountpoint")
+
+    # Retrieve the export paths of all volumes in batches, before any volume is mounted
+    try:
+        _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+    except InvalidConfigError:
+        if print_output:
+            print("Error: Error retrieving NFS mount target for volume.")
+        raise
+    volumes = list()
+    volumeExportPaths = dict()
+    policyLifNames = dict()
+    try:
+        for i in range(0, len(volume_names), _QUERY_BATCH_SIZE):
+            batch = volume_names[i:i + _QUERY_BATCH_SIZE]
+            for volume in netappResources.Volume.get_collection(svm=svm, name="|".join(batch), fields="nas.path,aggregates.name" if lif_policy == "local" else "nas.path"):
+                if hasattr(volume, "nas") and hasattr(volume.nas, "path") and volume.nas.path != "/":
+                    volumes.append(volume)
+                    volumeExportPaths[volume.name] = volume.nas.path
+
+        # Pick a data LIF for each volume by policy, unless a list of LIFs was specified
+        if lif_policy and not lif_names and volumes:
+            policyLifNames = _select_data_lifs(volumes=volumes, config=config, svm=svm, lif_policy=lif_policy)
+            if not policyLifNames and print_output:
+                print("Warning: No NFS data LIFs are up in svm '" + svm + "'; the default NFS mount targets will be used.")
+    except netappError.NetAppRestError as err:
+        if print_output:
+            print("Error: ONTAP Rest API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Raise error if any invalid volume names were entered
+    invalidVolumeNames = [volume_name for volume_name in volume_names if volume_name not in volumeExportPaths]
+    if invalidVolumeNames:
+        if print_output:
+            print("Error: Invalid volume name(s) specified: " + ",".join(invalidVolumeNames) + ".")
+        raise InvalidVolumeParameterError("name")
+
+    # Spread mounts across the specified data LIFs round-robin
+    nfsMountTargets = list()
+    for index, volume_name in enumerate(volume_names):
+        if lif_names:
+            nfsMountTargets.append(lif_names[index % len(lif_names)] + ":" + volumeExportPaths[volume_name])
+        elif volume_name in policyLifNames:
+            nfsMountTargets.append(policyLifNames[volume_name] + ":" + volumeExportPaths[volume_name])
+        else:
+            nfsMountTargets.append(_build_nfs_mount_target(volumeExportPath=volumeExportPaths[volume_name], config=config, svm=svm))
+
+    if print_output:
+        if readonly:
+            print("Mounting " + str(len(volume_names)) + " volumes in svm '" + svm + "' as read-only.")
+        else:
+            print("Mounting " + str(len(volume_names)) + " volumes in svm '" + svm + "'.")
+
+    startTime = time.monotonic()
+
+    def mount(volume_name: str, mountpoint: str, nfsMountTarget: str) -> dict:
+        result = {"Volume Name": volume_name, "NFS Mount Target": nfsMountTarget, "Mountpoint": mountpoint, "Status": "success", "Mount Time": None, "Error": None}
+        try:
+            _mount_nfs_target(nfsMountTarget=nfsMountTarget, mountpoint=mountpoint, readonly=readonly, mount_options=mount_options)
+        except (subprocess.CalledProcessError, OSError) as err:
+            result["Status"] = "failure"
+            result["Error"] = str(err)
+        result["Mount Time"] = round(time.monotonic() - startTime, 3)
+        return result
+
+    # Mount volumes concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(volume_names)))) as executor:
+        results = list(executor.map(mount, volume_names, mountpoints, nfsMountTargets))
+
+    if print_output:
+        print(tabulate.tabulate([result.values() for result in results], headers=list(results[0].keys())))
+        failedCount = len([result for result in results if result["Status"] != "success"])
+        if failedCount:
+            print("Error: " + str(failedCount) + " of " + str(len(results)) + " volumes could not be mounted.")
+        else:
+            print("Volumes mounted successfully.")
+
+    return results
+
+
+# Function to unmount volume
+def unmount_volume(mountpoint: str, print_output: bool = False):
+    # Print message describing action to be understaken
+    if print_output:
+        print("Unmounting volume at '" + mountpoint + "'.")
+
+    # Un-mount volume
+    try:
+        subprocess.check_call(['umount', mountpoint])
+        if print_output:
+            print("Volume unmounted successfully.")
+    except subprocess.CalledProcessError as err:
+        if print_output:
+            print("Error: Error running unmount command: ", err)
+        raise MountOperationError(err)
+
+
+def unmount_volumes(mountpoints: list, max_workers: int = 8, print_output: bool = False) -> list():
+    # Check list of mountpoints for validity
+    if not mountpoints or len(set(mountpoints)) != len(mountpoints):
+        if print_output:
+            print("Error: A list of unique mountpoints must be specified.")
+        raise InvalidVolumeParameterError("mountpoint")
+
+    if print_output:
+        print("Unmounting " + str(len(mountpoints)) + " volumes.")
+
+    startTime = time.monotonic()
+
+    def unmount(mountpoint: str) -> dict:
+        result = {"Mountpoint": mountpoint, "Status": "success", "Unmount Time": None, "Error": None}
+        try:
+            subprocess.check_call(['umount', mountpoint])
+        except subprocess.CalledProcessError as err:
+            result["Status"] = "failure"
+            result["Error"] = str(err)
+        result["Unmount Time"] = round(time.monotonic() - startTime, 3)
+        return result
+
+    # Unmount volumes concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(mountpoints)))) as executor:
+        results = list(executor.map(unmount, mountpoints))
+
+    if print_output:
+        print(tabulate.tabulate([result.values() for result in results], headers=list(results[0].keys())))
+        failedCount = len([result for result in results if result["Status"] != "success"])
+        if failedCount:
+            print("Error: " + str(failedCount) + " of " + str(len(results)) + " volumes could not be unmounted.")
+        else:
+            print("Volumes unmounted successfully.")
+
+    return results
+
+
+def prepopulate_flex_cache(volume_name: str, paths: list, print_output: bool = False):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        if print_output:
+            print("FlexCache '" + volume_name + "' - Prepopulating paths: ", paths)
+
+        try:
+            # Retrieve FlexCache
+            flexcache = netappResources.Flexcache.find(name=volume_name, svm=svm)
+            if not flexcache:
+                if print_output:
+                    print("Error: Invalid volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            # Prepopulate FlexCache
+            flexcache.prepopulate = {"dir_paths": paths}
+            flexcache.patch()
+
+            if print_output:
+                print("FlexCache prepopulated successfully.")
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+    else:
+        raise ConnectionTypeError()
+
+
+def pull_bucket_from_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "", sync: bool = False,
+                        delete: bool = False, resume: bool = False, verify: bool = False, max_retries: int = 3, listing_workers: int = 1,
+                        listing_shard_prefixes: list = None, max_workers: int = None, multipart_threshold: int = None,
+                        multipart_chunksize: int = None, max_concurrency: int = None, max_io_queue: int = None,
+                        max_bandwidth: int = None, max_rps: int = None,
+                        throttle_schedule: list = None, progress_callback: callable = None,
+                        print_output: bool = False) -> dict:
+    startTime = time.monotonic()
+
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferSettings = _retrieve_s3_transfer_settings(max_workers=max_workers, multipart_threshold=multipart_threshold,
+                                                          multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                                          max_io_queue=max_io_queue, print_output=print_output)
+        throttle = _retrieve_s3_throttle(max_bandwidth=max_bandwidth, max_rps=max_rps, throttle_schedule=throttle_schedule, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Add slash to end of local directory path if not present
+    if not local_directory.endswith(os.sep):
+        local_directory += os.sep
+
+    # Instantiate S3 client to be shared by all listing and download threads
+    try:
+        s3 = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle,
+                                    max_pool_connections=_get_s3_max_pool_connections(transferSettings) + listing_workers, throttle=throttle, print_output=print_output)
+
+        # Open transfer journal; when resuming, objects that were pulled by the interrupted transfer are skipped
+        journal = _open_s3_transfer_journal(s3, direction="pull", s3Endpoint=s3Endpoint, s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix,
+                                            localDirectory=local_directory, resume=resume, print_output=print_output)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    # In sync mode, objects that have not changed, either in the bucket or locally, since they were last pulled are skipped
+    if sync:
+        manifest = _open_s3_sync_manifest(direction="pull", s3Endpoint=s3Endpoint, s3Bucket=s3_bucket,
+                                          s3ObjectKeyPrefix=s3_object_key_prefix, localDirectory=local_directory)
+
+    # List objects in the background, prefetching a bounded number of listing pages while objects are being
+    # downloaded, so that memory usage stays flat regardless of the number of objects in the bucket; in sharded
+    # listing mode, shards of the keyspace are listed concurrently and all feed the same download pipeline
+    lister = _S3BucketLister(s3, bucket=s3_bucket, prefix=s3_object_key_prefix, shard_prefixes=listing_shard_prefixes,
+                             listing_workers=listing_workers)
+    lister.start()
+    pages = lister.pages()
+    try:
+        firstPage = next(pages, [])
+    except Exception as err:
+        lister.stop()
+        journal.close()
+        if sync:
+            manifest.close()
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    # Determine transfer settings, auto-tuning any settings that were not specified based on the objects in the first
+    # listing page
+    maxWorkers, transferConfig = _build_s3_transfer_config(transferSettings=transferSettings, fileSizes=[size for key, size, etag in firstPage])
+
+    # Keys of all listed objects are only retained if they are needed in order to delete local files
+    keys = set()
+    unchangedObjectCount = 0
+    alreadyPulledObjectCount = 0
+
+    def skipObject(key: str, size: int, etag: str) -> bool:
+        nonlocal unchangedObjectCount, alreadyPulledObjectCount
+        if sync:
+            manifestEntry = _get_s3_sync_manifest_entry(manifest, key)
+            if manifestEntry and manifestEntry[0] == size and manifestEntry[2] == etag:
+                try:
+                    localFileStat = os.stat(local_directory + key)
+                    if localFileStat.st_size == size and localFileStat.st_mtime_ns == manifestEntry[1]:
+                        unchangedObjectCount += 1
+                        return True
+                except OSError:
+                    pass
+        if resume:
+            completedObject = journal.get_completed(key)
+            if completedObject and completedObject[0] == size and completedObject[2] == etag and os.path.isfile(local_directory + key):
+                alreadyPulledObjectCount += 1
+                return True
+        return False
+
+    # With a progress callback, progress is reported in place of a message for each object; objects are added to the
+    # progress totals as they are listed
+    progress = _S3TransferProgress(progress_callback, totals_final=False) if progress_callback else None
+    objectOutput = print_output and not progress
+
+    # Record successfully pulled objects in journal and sync manifest
+    stats = _S3TransferStats()
+
+    def recordResults(doneFutures: set):
+        for future in doneFutures:
+            key, size, etag = futures.pop(future)
+            result = future.result()
+            stats.add(key=key, size=size, result=result, verified=result["Result"])
+            if not result["Error"]:
+                journal.mark_completed(key=key, size=size, etag=etag)
+                if sync:
+                    localFileStat = os.stat(local_directory + key)
+                    _update_s3_sync_manifest(manifest, key=key, size=size, mtimeNs=localFileStat.st_mtime_ns, etag=etag)
+
+    # Multithread the download operation, retrying transient failures; the number of downloads that have been
+    # submitted but have not completed is bounded, which in turn applies backpressure to the listing thread
+    maxPendingDownloads = maxWorkers * 2
+    listingError = None
+    futures = dict()
+    if progress:
+        progress.start()
+    try:
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            try:
+                for page in itertools.chain([firstPage], pages):
+                    for key, size, etag in page:
+                        if delete:
+                            keys.add(key)
+                        if skipObject(key=key, size=size, etag=etag):
+                            continue
+                        if len(futures) >= maxPendingDownloads:
+                            doneFutures, pendingFutures = wait(futures, return_when=FIRST_COMPLETED)
+                            recordResults(doneFutures)
+                        if progress:
+                            progress.add_total(size)
+                        future = executor.submit(_run_s3_transfer, _download_from_s3, max_retries=max_retries, progress=progress, s3=s3, s3Bucket=s3_bucket,
+                                                 s3ObjectKey=key, localFile=local_directory+key, transferConfig=transferConfig, verify=verify,
+                                                 print_output=objectOutput)
+                        futures[future] = (key, size, etag)
+                if progress:
+                    progress.finalize_totals()
+            except Exception as err:
+                listingError = err
+            finally:
+                lister.stop()
+                recordResults(set(as_completed(futures)))
+    finally:
+        if progress:
+            progress.stop()
+
+    report = stats.report(skipped_object_count=unchangedObjectCount + alreadyPulledObjectCount, elapsed_time=time.monotonic() - startTime)
+    if print_output:
+        if sync:
+            print("Skipped " + str(unchangedObjectCount) + " unchanged object(s).")
+        if resume:
+            print("Resumed transfer; skipped " + str(alreadyPulledObjectCount) + " object(s) that were already pulled.")
+
+    # Keep journal if any objects failed, so that the transfer can be resumed
+    journal.close(remove=(report["Failures"] == 0 and listingError is None))
+
+    # If listing failed, the objects that were listed before the failure have been pulled
+    if listingError is not None:
+        if sync:
+            manifest.commit()
+            manifest.close()
+        if print_output:
+            print("Error: S3 API error: ", listingError)
+        raise APIConnectionError(listingError)
+
+    # In sync mode, delete local files that are not present in the bucket, if requested; when listing was limited to
+    # shard prefixes, only files under those prefixes are considered
+    if sync and delete:
+        if listing_shard_prefixes is not None:
+            listedPrefixes = tuple(s3_object_key_prefix + shardPrefix for shardPrefix in listing_shard_prefixes)
+        else:
+            listedPrefixes = (s3_object_key_prefix,)
+        for dirpath, dirnames, filenames in os.walk(local_directory):
+            # Exclude hidden files and directories
+            filenames = [filename for filename in filenames if not filename[0] == '.']
+            dirnames[:] = [dirname for dirname in dirnames if not dirname[0] == '.']
+
+            for filename in filenames:
+                localFile = os.path.join(dirpath, filename)
+                key = localFile[len(local_directory):]
+                if key.startswith(listedPrefixes) and key not in keys:
+                    if print_output:
+                        print("Deleting local file '" + localFile + "', which is not present in bucket '" + s3_bucket + "'.")
+                    os.remove(localFile)
+                    _update_s3_sync_manifest(manifest, key=key)
+
+    if sync:
+        manifest.commit()
+        manifest.close()
+
+    if print_output:
+        _print_s3_transfer_report(report)
+    if report["Failures"]:
+        if print_output:
+            print("Error: Failed to download " + str(report["Failures"]) + " object(s).")
+    else:
+        print("Download complete.")
+
+    return report
+
+
+def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = None, verify: bool = False,
+                        multipart_threshold: int = None, multipart_chunksize: int = None, max_concurrency: int = None,
+                        max_io_queue: int = None, max_bandwidth: int = None, max_rps: int = None,
+                        throttle_schedule: list = None, print_output: bool = False):
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferSettings = _retrieve_s3_transfer_settings(max_workers=1, multipart_threshold=multipart_threshold,
+                                                          multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                                          max_io_queue=max_io_queue, print_output=print_output)
+        throttle = _retrieve_s3_throttle(max_bandwidth=max_bandwidth, max_rps=max_rps, throttle_schedule=throttle_schedule, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Set S3 object key
+    if not local_file:
+        local_file = s3_object_key
+
+    # Instantiate S3 client
+    try:
+        s3 = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle,
+                                    max_pool_connections=_get_s3_max_pool_connections(transferSettings), throttle=throttle, print_output=print_output)
+
+        # Retrieve object size if it is needed in order to auto-tune transfer settings
+        objectSizes = list()
+        if None in transferSettings.values():
+            objectSizes.append(s3.head_object(Bucket=s3_bucket, Key=s3_object_key)["ContentLength"])
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    # Determine transfer settings, auto-tuning any settings that were not specified
+    maxWorkers, transferConfig = _build_s3_transfer_config(transferSettings=transferSettings, fileSizes=objectSizes)
+
+    # Download file
+    try:
+        _download_from_s3(s3=s3, s3Bucket=s3_bucket, s3ObjectKey=s3_object_key, localFile=local_file, transferConfig=transferConfig,
+                          verify=verify, print_output=print_output)
+    except APIConnectionError:
+        raise
+
+    print("Download complete.")
+
+
+def pull_shard_member_from_s3(s3_bucket: str, member_name: str, local_file: str = None, s3_object_key_prefix: str = "",
+                              print_output: bool = False):
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        throttle = _retrieve_s3_throttle(print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Set local filepath
+    if not local_file:
+        local_file = member_name
+
+    # Look up member in shard index
+    try:
+        s3 = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle, throttle=throttle, print_output=print_output)
+        index = _read_s3_shard_index(s3, s3Endpoint=s3Endpoint, s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+    if member_name not in index["members"]:
+        if print_output:
+            print("Error: Member '" + member_name + "' not found in shard index.")
+        raise APIConnectionError("Member '" + member_name + "' not found in shard index.")
+    shardNumber, offset, size = index["members"][member_name]
+    shardKey = s3_object_key_prefix + index["shards"][shardNumber][0]
+
+    if print_output:
+        print("Downloading member '" + member_name + "' of shard '" + shardKey + "' from bucket '" + s3_bucket + "' and saving as '" + local_file + "'.")
+
+    # Create directories that don't exist
+    localDirectory = os.path.dirname(local_file)
+    if localDirectory:
+        os.makedirs(localDirectory, exist_ok=True)
+
+    # Download member by byte range
+    try:
+        with open(local_file, "wb") as file:
+            if size > 0:
+                body = s3.get_object(Bucket=s3_bucket, Key=shardKey, Range="bytes=" + str(offset) + "-" + str(offset + size - 1))["Body"]
+                shutil.copyfileobj(body, file)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    print("Download complete.")
+
+
+def pull_shards_from_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "", verify: bool = False,
+                        max_retries: int = 3, max_workers: int = None, max_bandwidth: int = None, max_rps: int = None,
+                        throttle_schedule: list = None, progress_callback: callable = None,
+                        print_output: bool = False) -> dict:
+    startTime = time.monotonic()
+
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferSettings = _retrieve_s3_transfer_settings(max_workers=max_workers, print_output=print_output)
+        throttle = _retrieve_s3_throttle(max_bandwidth=max_bandwidth, max_rps=max_rps, throttle_schedule=throttle_schedule, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Retrieve list of shards from shard index
+    try:
+        s3 = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle,
+                                    max_pool_connections=max(_S3_TRANSFER_AUTO_CONCURRENCY, transferSettings["max_workers"] or 1), throttle=throttle, print_output=print_output)
+        shards = _read_s3_shard_index(s3, s3Endpoint=s3Endpoint, s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix)["shards"]
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    # Multithread the download operation; each shard is extracted while it is being downloaded
+    maxWorkers = transferSettings["max_workers"] or max(1, min(len(shards), _S3_SHARD_DEFAULT_MAX_WORKERS))
+    stats = _S3TransferStats()
+    fileCount = 0
+    progress = _S3TransferProgress(progress_callback, total_objects=len(shards), total_bytes=sum(shardSize for shardKey, shardSize in shards)) if progress_callback else None
+    objectOutput = print_output and not progress
+    if progress:
+        progress.start()
+    try:
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            futures = dict()
+            for shardKey, shardSize in shards:
+                future = executor.submit(_run_s3_transfer, _pull_tar_shard_from_s3, max_retries=max_retries, progress=progress, s3=s3, s3Bucket=s3_bucket,
+                                         s3ObjectKey=s3_object_key_prefix + shardKey, localDirectory=local_directory, verify=verify, print_output=objectOutput)
+                futures[future] = (s3_object_key_prefix + shardKey, shardSize)
+            for future in as_completed(futures):
+                shardKey, shardSize = futures[future]
+                result = future.result()
+                if result["Error"]:
+                    stats.add(key=shardKey, size=shardSize, result=result)
+                else:
+                    shardFileCount, verified = result["Result"]
+                    stats.add(key=shardKey, size=shardSize, result=result, verified=verified)
+                    fileCount += shardFileCount
+    finally:
+        if progress:
+            progress.stop()
+    report = stats.report(skipped_object_count=0, elapsed_time=time.monotonic() - startTime)
+    report["Files"] = fileCount
+
+    if print_output:
+        _print_s3_transfer_report(report)
+    if report["Failures"]:
+        if print_output:
+            print("Error: Failed to download " + str(report["Failures"]) + " shard(s).")
+    else:
+        print("Download complete.")
+
+    return report
+
+
+def push_directory_to_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "",
+                         s3_extra_args: str = None, sync: bool = False, delete: bool = False, resume: bool = False,
+                         verify: bool = False, max_retries: int = 3, max_workers: int = None, multipart_threshold: int = None,
+                         multipart_chunksize: int = None, max_concurrency: int = None, max_io_queue: int = None,
+                         max_bandwidth: int = None, max_rps: int = None,
+                         throttle_schedule: list = None, progress_callback: callable = None,
+                         print_output: bool = False) -> dict:
+    startTime = time.monotonic()
+
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferSettings = _retrieve_s3_transfer_settings(max_workers=max_workers, multipart_threshold=multipart_threshold,
+                                                          multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                                          max_io_queue=max_io_queue, print_output=print_output)
+        throttle = _retrieve_s3_throttle(max_bandwidth=max_bandwidth, max_rps=max_rps, throttle_schedule=throttle_schedule, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Loop through all files in directory
+    files = list()
+    for dirpath, dirnames, filenames in os.walk(local_directory):
+        # Exclude hidden files and directories
+        filenames = [filename for filename in filenames if not filename[0] == '.']
+        dirnames[:] = [dirname for dirname in dirnames if not dirname[0] == '.']
+
+        for filename in filenames:
+            # Build filepath
+            if local_directory.endswith(os.sep):
+                dirpathBeginIndex = len(local_directory)
+            else:
+                dirpathBeginIndex = len(local_directory) + 1
+
+            subdirpath = dirpath[dirpathBeginIndex:]
+
+            if subdirpath:
+                filepath = subdirpath + os.sep + filename
+            else:
+                filepath = filename
+
+            # Set S3 object details
+            s3ObjectKey = s3_object_key_prefix + filepath
+            localFile = dirpath + os.sep + filename
+            try:
+                localFileStat = os.stat(localFile)
+                files.append((localFile, s3ObjectKey, localFileStat.st_size, localFileStat.st_mtime_ns))
+            except OSError:
+                files.append((localFile, s3ObjectKey, 0, None))
+
+    # In sync mode, skip files that have not changed since they were last pushed
+    if sync:
+        manifest = _open_s3_sync_manifest(direction="push", s3Endpoint=s3Endpoint, s3Bucket=s3_bucket,
+                                          s3ObjectKeyPrefix=s3_object_key_prefix, localDirectory=local_directory)
+        manifestEntries = _read_s3_sync_manifest(manifest)
+        changedFiles = list()
+        for localFile, s3ObjectKey, fileSize, fileMtimeNs in files:
+            manifestEntry = manifestEntries.get(s3ObjectKey)
+            if not manifestEntry or manifestEntry[0] != fileSize or manifestEntry[1] != fileMtimeNs:
+                changedFiles.append((localFile, s3ObjectKey, fileSize, fileMtimeNs))
+        if print_output:
+            print("Skipping " + str(len(files) - len(changedFiles)) + " unchanged file(s).")
+    else:
+        changedFiles = files
+    skippedFileCount = len(files) - len(changedFiles)
+
+    # Instantiate S3 client to be shared by all upload threads
+    try:
+        s3 = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle,
+                                    max_pool_connections=_get_s3_max_pool_connections(transferSettings), throttle=throttle, print_output=print_output)
+
+        # Open transfer journal; when resuming, skip files that were pushed by the interrupted transfer
+        journal = _open_s3_transfer_journal(s3, direction="push", s3Endpoint=s3Endpoint, s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix,
+                                            localDirectory=local_directory, resume=resume, print_output=print_output)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+    if resume:
+        completedFiles = journal.completed()
+        remainingFiles = [(localFile, s3ObjectKey, fileSize, fileMtimeNs) for localFile, s3ObjectKey, fileSize, fileMtimeNs in changedFiles
+                          if completedFiles.get(s3ObjectKey) != (fileSize, fileMtimeNs, None)]
+        if print_output:
+            print("Resuming transfer; skipping " + str(len(changedFiles) - len(remainingFiles)) + " file(s) that were already pushed.")
+        skippedFileCount += len(changedFiles) - len(remainingFiles)
+        changedFiles = remainingFiles
+
+    # Determine transfer settings, auto-tuning any settings that were not specified
+    maxWorkers, transferConfig = _build_s3_transfer_config(transferSettings=transferSettings, fileSizes=[fileSize for localFile, s3ObjectKey, fileSize, fileMtimeNs in changedFiles])
+
+    # With a progress callback, progress is reported in place of a message for each file
+    progress = None
+    if progress_callback:
+        progress = _S3TransferProgress(progress_callback, total_objects=len(changedFiles),
+                                       total_bytes=sum(fileSize for localFile, s3ObjectKey, fileSize, fileMtimeNs in changedFiles))
+    objectOutput = print_output and not progress
+
+    # Multithread the upload operation, retrying transient failures
+    stats = _S3TransferStats()
+    if progress:
+        progress.start()
+    try:
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            futures = dict()
+            for localFile, s3ObjectKey, fileSize, fileMtimeNs in changedFiles:
+                # Upload file
+                future = executor.submit(_run_s3_transfer, _upload_to_s3, max_retries=max_retries, progress=progress, s3=s3, s3Bucket=s3_bucket, localFile=localFile,
+                                         s3ObjectKey=s3ObjectKey, s3ExtraArgs=s3_extra_args, transferConfig=transferConfig, journal=journal, verify=verify,
+                                         print_output=objectOutput)
+                futures[future] = (s3ObjectKey, fileSize, fileMtimeNs)
+
+            # Record successfully pushed files in journal and sync manifest
+            for future in as_completed(futures):
+                s3ObjectKey, fileSize, fileMtimeNs = futures[future]
+                result = future.result()
+                stats.add(key=s3ObjectKey, size=fileSize, result=result, verified=result["Result"])
+                if not result["Error"]:
+                    journal.mark_completed(key=s3ObjectKey, size=fileSize, mtime_ns=fileMtimeNs)
+                    if sync:
+                        _update_s3_sync_manifest(manifest, key=s3ObjectKey, size=fileSize, mtimeNs=fileMtimeNs)
+    finally:
+        if progress:
+            progress.stop()
+    report = stats.report(skipped_object_count=skippedFileCount, elapsed_time=time.monotonic() - startTime)
+
+    # Keep journal if any files failed, so that the transfer can be resumed
+    journal.close(remove=(report["Failures"] == 0))
+
+    # In sync mode, delete objects that are not present in the local directory, if requested
+    if sync and delete:
+        try:
+            s3ObjectKeys = set(s3ObjectKey for localFile, s3ObjectKey, fileSize, fileMtimeNs in files)
+            staleKeys = list()
+            for page in s3.get_paginator("list_objects_v2").paginate(Bucket=s3_bucket, Prefix=s3_object_key_prefix):
+                for obj in page.get("Contents", []):
+                    if obj["Key"] not in s3ObjectKeys:
+                        staleKeys.append(obj["Key"])
+
+            # Delete objects in batches (S3 accepts up to 1000 keys per request)
+            failedKeys = list()
+            for batchStartIndex in range(0, len(staleKeys), 1000):
+                batch = staleKeys[batchStartIndex:batchStartIndex + 1000]
+                if print_output:
+                    for key in batch:
+                        print("Deleting object '" + key + "' from bucket '" + s3_bucket + "', which is not present in local directory.")
+                response = s3.delete_objects(Bucket=s3_bucket, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True})
+                batchFailedKeys = set(error["Key"] for error in response.get("Errors", []))
+                for key in batch:
+                    if key in batchFailedKeys:
+                        failedKeys.append(key)
+                    else:
+                        _update_s3_sync_manifest(manifest, key=key)
+        except Exception as err:
+            manifest.commit()
+            manifest.close()
+            if print_output:
+                print("Error: S3 API error: ", err)
+            raise APIConnectionError(err)
+
+        if failedKeys:
+            manifest.commit()
+            manifest.close()
+            if print_output:
+                print("Error: Failed to delete objects: ", failedKeys)
+            raise APIConnectionError("Failed to delete objects: " + ", ".join(failedKeys))
+
+    if sync:
+        manifest.commit()
+        manifest.close()
+
+    if print_output:
+        _print_s3_transfer_report(report)
+    if report["Failures"]:
+        if print_output:
+            print("Error: Failed to upload " + str(report["Failures"]) + " file(s).")
+    else:
+        print("Upload complete.")
+
+    return report
+
+
+def push_directory_to_s3_as_shards(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "",
+                                   shard_size: int = _S3_DEFAULT_SHARD_SIZE, s3_extra_args: str = None, verify: bool = False,
+                                   max_retries: int = 3, max_workers: int = None, multipart_chunksize: int = None,
+                                   max_bandwidth: int = None, max_rps: int = None,
+                                   throttle_schedule: list = None, progress_callback: callable = None,
+                                   print_output: bool = False) -> dict:
+    startTime = time.monotonic()
+
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferSettings = _retrieve_s3_transfer_settings(max_workers=max_workers, multipart_chunksize=multipart_chunksize, print_output=print_output)
+        throttle = _retrieve_s3_throttle(max_bandwidth=max_bandwidth, max_rps=max_rps, throttle_schedule=throttle_schedule, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Loop through all files in directory; files are packed in order of path, so that files with the same path
+    # apart from their extension are stored next to each other in the same shard (WebDataset convention)
+    files = list()
+    for dirpath, dirnames, filenames in os.walk(local_directory):
+        # Exclude hidden files and directories
+        filenames = [filename for filename in filenames if not filename[0] == '.']
+        dirnames[:] = [dirname for dirname in dirnames if not dirname[0] == '.']
+
+        for filename in filenames:
+            localFile = os.path.join(dirpath, filename)
+            memberName = os.path.relpath(localFile, local_directory).replace(os.sep, "/")
+            try:
+                files.append((localFile, memberName, os.path.getsize(localFile)))
+            except OSError:
+                files.append((localFile, memberName, 0))
+    files.sort(key=lambda file: file[1])
+
+    # Group files into shards
+    shards = _plan_tar_shards(files=files, shardSize=shard_size)
+    maxWorkers = transferSettings["max_workers"] or max(1, min(len(shards), _S3_SHARD_DEFAULT_MAX_WORKERS))
+    minPartSize = transferSettings["multipart_chunksize"] or boto3Transfer.TransferConfig().multipart_chunksize
+
+    # Instantiate S3 client to be shared by all upload threads
+    try:
+        s3 = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle,
+                                    max_pool_connections=max(_S3_TRANSFER_AUTO_CONCURRENCY, maxWorkers), throttle=throttle, print_output=print_output)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    # Multithread the upload operation; each shard is streamed to S3 while it is being packed, so that no temporary
+    # files are needed, and part size is raised for very large shards in order to stay within the S3 part limit
+    stats = _S3TransferStats()
+    shardEntries = [None] * len(shards)
+    progress = None
+    if progress_callback:
+        progress = _S3TransferProgress(progress_callback, total_objects=len(shards),
+                                       total_bytes=sum(-(-(estimatedShardSize + 2 * tarfile.BLOCKSIZE) // tarfile.RECORDSIZE) * tarfile.RECORDSIZE
+                                                       for shardFiles, estimatedShardSize in shards))
+    objectOutput = print_output and not progress
+    if progress:
+        progress.start()
+    try:
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            futures = dict()
+            for shardNumber, (shardFiles, estimatedShardSize) in enumerate(shards):
+                s3ObjectKey = s3_object_key_prefix + _S3_SHARD_KEY_FORMAT.format(shardNumber)
+                partSize = max(minPartSize, -(-(estimatedShardSize + tarfile.RECORDSIZE) // _S3_MAX_MULTIPART_PARTS))
+                future = executor.submit(_run_s3_transfer, _push_tar_shard_to_s3, max_retries=max_retries, progress=progress, s3=s3, s3Bucket=s3_bucket,
+                                         s3ObjectKey=s3ObjectKey, files=shardFiles, partSize=partSize, s3ExtraArgs=json.loads(s3_extra_args) if s3_extra_args else None,
+                                         verify=verify, print_output=objectOutput)
+                futures[future] = (shardNumber, s3ObjectKey)
+            for future in as_completed(futures):
+                shardNumber, s3ObjectKey = futures[future]
+                result = future.result()
+                if result["Error"]:
+                    stats.add(key=s3ObjectKey, size=0, result=result)
+                else:
+                    shardBytes, members, verified = result["Result"]
+                    stats.add(key=s3ObjectKey, size=shardBytes, result=result, verified=verified)
+                    shardEntries[shardNumber] = (shardBytes, members)
+    finally:
+        if progress:
+            progress.stop()
+    report = stats.report(skipped_object_count=0, elapsed_time=time.monotonic() - startTime)
+    report["Files"] = sum(len(shardEntry[1]) for shardEntry in shardEntries if shardEntry)
+
+    # Write index once all shards have been pushed; the index is not written if any shard failed, since it would
+    # otherwise describe an incomplete set of shards
+    if not report["Failures"]:
+        indexShards = list()
+        indexMembers = list()
+        for shardNumber, (shardBytes, members) in enumerate(shardEntries):
+            indexShards.append([_S3_SHARD_KEY_FORMAT.format(shardNumber), shardBytes])
+            indexMembers.extend([memberName, shardNumber, offset, size] for memberName, offset, size in members)
+        try:
+            _write_s3_shard_index(s3, s3Bucket=s3_bucket, s3ObjectKeyPrefix=s3_object_key_prefix, shards=indexShards, members=indexMembers)
+        except Exception as err:
+            if print_output:
+                print("Error: S3 API error: ", err)
+            raise APIConnectionError(err)
+
+    if print_output:
+        _print_s3_transfer_report(report)
+    if report["Failures"]:
+        if print_output:
+            print("Error: Failed to upload " + str(report["Failures"]) + " shard(s); shard index was not written.")
+    else:
+        print("Upload complete.")
+
+    return report
+
+
+def push_file_to_s3(s3_bucket: str, local_file: str, s3_object_key: str = None, s3_extra_args: str = None,
+                    verify: bool = False, multipart_threshold: int = None, multipart_chunksize: int = None, max_concurrency: int = None,
+                    max_io_queue: int = None, max_bandwidth: int = None, max_rps: int = None,
+                    throttle_schedule: list = None, print_output: bool = False):
+    # Retrieve S3 access details from existing config file
+    try:
+        s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+        transferSettings = _retrieve_s3_transfer_settings(max_workers=1, multipart_threshold=multipart_threshold,
+                                                          multipart_chunksize=multipart_chunksize, max_concurrency=max_concurrency,
+                                                          max_io_queue=max_io_queue, print_output=print_output)
+        throttle = _retrieve_s3_throttle(max_bandwidth=max_bandwidth, max_rps=max_rps, throttle_schedule=throttle_schedule, print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Set S3 object key
+    if not s3_object_key:
+        s3_object_key = local_file
+
+    # Determine transfer settings, auto-tuning any settings that were not specified
+    try:
+        fileSize = os.path.getsize(local_file)
+    except OSError:
+        fileSize = 0
+    maxWorkers, transferConfig = _build_s3_transfer_config(transferSettings=transferSettings, fileSizes=[fileSize])
+
+    # Upload file
+    try:
+        s3 = _instantiate_s3_client(s3Endpoint=s3Endpoint, s3AccessKeyId=s3AccessKeyId, s3SecretAccessKey=s3SecretAccessKey, s3VerifySSLCert=s3VerifySSLCert, s3CACertBundle=s3CACertBundle,
+                                    max_pool_connections=_get_s3_max_pool_connections(transferSettings), throttle=throttle, print_output=print_output)
+    except Exception as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+    try:
+        _upload_to_s3(s3=s3, s3Bucket=s3_bucket, localFile=local_file, s3ObjectKey=s3_object_key, s3ExtraArgs=s3_extra_args, transferConfig=transferConfig,
+                      verify=verify, print_output=print_output)
+    except APIConnectionError:
+        raise
+
+    print("Upload complete.")
+
+
+def restore_snapshot(volume_name: str, snapshot_name: str, cluster_name: str = None, svm_name : str = None, wait_until_complete: bool = True, print_output: bool = False):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+    
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        # Retrieve svm from config file
+        try:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        if print_output:
+            print("Restoring snapshot '" + snapshot_name + "'.")
+
+        try:
+            # Retrieve volume
+            volume = netappResources.Volume.find(name=volume_name, svm=svm)
+            if not volume:
+                if print_output:
+                    print("Error: Invalid volume name.")
+                raise InvalidVolumeParameterError("name")
+
+            # Retrieve snapshot
+            snapshot = netappResources.Snapshot.find(volume.uuid, name=snapshot_name)
+            if not snapshot:
+                if print_output:
+                    print("Error: Invalid snapshot name.")
+                raise InvalidSnapshotParameterError("name")
+
+            # Restore snapshot
+            response = volume.patch(volume.uuid, **{"restore_to.snapshot.name": snapshot.name, "restore_to.snapshot.uuid": snapshot.uuid}, poll=wait_until_complete)
+            if not wait_until_complete:
+                return _create_job_handle(response, description="restore snapshot '"+snapshot.name+"'", print_output=print_output)
+            if print_output:
+                print("Snapshot restored successfully.")
+
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+    else:
+        raise ConnectionTypeError()
+
+
+def sync_cloud_sync_relationship(relationship_id: str, wait_until_complete: bool = False, print_output: bool = False):
+    # Step 1: Obtain access token and account ID for accessing Cloud Sync API
+
+    # Retrieve refresh token
+    try:
+        refreshToken = _retrieve_cloud_central_refresh_token(print_output=print_output)
+    except InvalidConfigError:
+        raise
+
+    # Obtain access token and account ID
+    try:
+        accessToken, accountId = _get_cloud_sync_access_parameters(refreshToken=refreshToken, print_output=print_output)
+    except APIConnectionError:
+        raise
+
+    # Step 2: Trigger Cloud Sync sync
+
+    # Define parameters for API call
+    url = "https://cloudsync.netapp.com/api/relationships/%s/sync" % relationship_id
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "x-account-id": accountId,
+        "Authorization": "Bearer " + accessToken
+    }
+
+    # Call API to trigger sync
+    if print_output:
+        print("Triggering sync operation for Cloud Sync relationship (ID = " + relationship_id + ").")
+    response = requests.put(url = url, headers = headers)
+
+    # Check for API response status code of 202; if not 202, raise error
+    if response.status_code != 202:
+        errorMessage = "Error calling Cloud Sync API to trigger sync operation."
+        if print_output:
+            print("Error:", errorMessage)
+            _print_api_response(response)
+        raise APIConnectionError(errorMessage, response)
+
+    if print_output:
+        print("Sync operation successfully triggered.")
+
+    # Step 3: Obtain status of the sync operation; keep checking until the sync operation has completed
+
+    if wait_until_complete:
+        while True:
+            # Define parameters for API call
+            url = "https://cloudsync.netapp.com/api/relationships-v2/%s" % relationship_id
+            headers = {
+                "Accept": "application/json",
+                "x-account-id": accountId,
+                "Authorization": "Bearer " + accessToken
+            }
+
+            # Call API to obtain status of sync operation
+            response = requests.get(url = url, headers = headers)
+
+            # Parse response to retrieve status of sync operation
+            try:
+                responseBody = json.loads(response.text)
+                latestActivityType = responseBody["activity"]["type"]
+                latestActivityStatus = responseBody["activity"]["status"]
+            except:
+                errorMessage = "Error obtaining status of sync operation from Cloud Sync API."
+                if print_output:
+                    print("Error:", errorMessage)
+                    _print_api_response(response)
+                raise APIConnectionError(errorMessage, response)
+
+            # End execution if the latest update is complete
+            if latestActivityType == "Sync":
+                if latestActivityStatus == "DONE":
+                    if print_output:
+                        print("Success: Sync operation is complete.")
+                    break
+                elif latestActivityStatus == "FAILED":
+                    if print_output:
+                        failureMessage = responseBody["activity"]["failureMessage"]
+                        print("Error: Sync operation failed.")
+                        print("Message:", failureMessage)
+                    raise CloudSyncSyncOperationError(latestActivityStatus, failureMessage)
+                elif latestActivityStatus == "RUNNING":
+                    # Print message re: progress
+                    if print_output:
+                        print("Sync operation is not yet complete. Status:", latestActivityStatus)
+                        print("Checking again in 60 seconds...")
+                else:
+                    if print_output:
+                        print ("Error: Unknown sync operation status (" + latestActivityStatus + ") returned by Cloud Sync API.")
+                    raise CloudSyncSyncOperationError(latestActivityStatus)
+
+            # Sleep for 60 seconds before checking progress again
+            time.sleep(60)
+
+def create_snap_mirror_relationship(source_svm: str, source_vol: str, target_vol: str, target_svm: str = None, cluster_name: str = None, 
+        schedule: str = '', policy: str = 'MirrorAllSnapshots', action: str = None, print_output: bool = False):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output :
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        svm = config["svm"]
+        if not target_svm: 
+            target_svm = svm 
+
+        try: 
+            uuid = None
+            snapmirror_relationship = netappResources.SnapmirrorRelationship.get_collection(**{"destination.path": target_svm+":"+target_vol})
+            for rel in snapmirror_relationship:
+                # Retrieve relationship details
+                try:
+                    rel.get()
+                    uuid = rel.uuid
+                except netappError.NetAppRestError as err:
+                    if print_output:
+                        print("Error: ONTAP Rest API Error: ", err)
+            if uuid:
+                if print_output:
+                    print("Error: relationship alreay exists: "+target_svm+":"+target_vol)
+                raise InvalidConfigError()
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)         
+        
+        try:
+            newRelationDict = {
+                "source": {
+                    "path": source_svm+":"+source_vol
+                }, 
+                "destination": { 
+                    "path": target_svm+":"+target_vol
+                }
+                #due to bug 1311226 setting the policy wil be done using cli api 
+                # "policy":  {
+                #     "name": policy,
+                # },
+            }
+            # if schedule != '':
+            #     newRelationDict['schedule'] = schedule
+
+            if print_output:
+                print("Creating snapmirror relationship: "+source_svm+":"+source_vol+" -> "+target_svm+":"+target_vol)
+            newRelationship = netappResources.SnapmirrorRelationship.from_dict(newRelationDict)
+            newRelationship.post(poll=True, poll_timeout=120)
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        try:
+            if print_output:
+                print("Setting snapmirror policy as: "+policy+" schedule:"+schedule)
+                response = netappResources.CLI().execute("snapmirror modify",destination_path=target_svm+":"+target_vol,body={"policy": policy, "schedule":schedule})
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)            
+
+        try: 
+            uuid = None
+            relation = None
+            snapmirror_relationship = netappResources.SnapmirrorRelationship.get_collection(**{"destination.path": target_svm+":"+target_vol})
+            for relation in snapmirror_relationship:
+                # Retrieve relationship details
+                try:
+                    relation.get()
+                    uuid = relation.uuid
+                except netappError.NetAppRestError as err:
+                    if print_output:
+                        print("Error: ONTAP Rest API Error: ", err)
+                    raise APIConnectionError(err)
+            if not uuid:
+                if print_output:
+                    print("Error: relationship was not created: "+target_svm+":"+target_vol)
+                raise InvalidConfigError()
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        if action in ["resync","initialize"]:
+            try:
+                if print_output:
+                    print("Setting state to snapmirrored, action:"+action)
+                patchRelation = netappResources.SnapmirrorRelationship(uuid=uuid)
+                patchRelation.state = "snapmirrored"
+                patchRelation.patch(poll=True, poll_timeout=120)
+            except netappError.NetAppRestError as err:
+                if print_output:
+                    print("Error: ONTAP Rest API Error: ", err)
+                raise APIConnectionError(err)                
+
+def sync_snap_mirror_relationship(uuid: str = None, svm_name: str = None, volume_name: str = None, cluster_name: str = None, wait_until_complete: bool = False, print_output: bool = False):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output :
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    if connectionType == "ONTAP":
+        # Instantiate connection to ONTAP cluster
+        try:
+            _instantiate_connection(config=config, connectionType=connectionType, print_output=print_output)
+        except InvalidConfigError:
+            raise
+
+        if volume_name:
+            svm = config["svm"]
+            if svm_name: 
+                svm = svm_name
+
+            snapmirror_relationship = netappResources.SnapmirrorRelationship.get_collection(**{"destination.path": svm+":"+volume_name})
+            for rel in snapmirror_relationship:
+                # Retrieve relationship details
+                try:
+                    rel.get()
+                    uuid = rel.uuid
+                except netappError.NetAppRestError as err:
+                    if print_output:
+                        print("Error: ONTAP Rest API Error: ", err)
+            if not uuid:
+                snapmirror_relationship = netappResources.SnapmirrorRelationship.get_collection(**{"destination.path": svm+":"})
+                for rel in snapmirror_relationship:
+                    try:
+                        rel.get()
+                        uuid = rel.uuid
+                    except netappError.NetAppRestError as err:
+                        if print_output:
+                            print("Error: ONTAP Rest API Error: ", err)
+                    if uuid: 
+                        if print_output:
+                            print("volume is part of svm-dr relationshitp: "+svm+":")                    
+
+        if not uuid:
+            if print_output:
+                print("Error: relationship could not be found.")
+            raise SnapMirrorSyncOperationError("not found")
+
+        if print_output:
+            print("Triggering sync operation for SnapMirror relationship (UUID = " + uuid + ").")
+
+        try:
+            # Trigger sync operation for SnapMirror relationship
+            transfer = netappResources.SnapmirrorTransfer(uuid)
+            transfer.post(poll=True)
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        if print_output:
+            print("Sync operation successfully triggered.")
+
+        if wait_until_complete:
+            # Wait to perform initial check
+            print("Waiting for sync operation to complete.")
+            print("Status check will be performed in 10 seconds...")
+            time.sleep(10)
+
+            while True:
+                # Retrieve relationship
+                relationship = netappResources.SnapmirrorRelationship.find(uuid=uuid)
+                relationship.get()
+
+                # Check status of sync operation
+                if hasattr(relationship, "transfer"):
+                    transferState = relationship.transfer.state
+                else:
+                    transferState = None
+
+                # if transfer is complete, end execution
+                if (not transferState) or (transferState == "success"):
+                    healthy = relationship.healthy
+                    if healthy:
+                        if print_output:
+                            print("Success: Sync operation is complete.")
+                        break
+                    else:
+                        if print_output:
+                            print("Error: Relationship is not healthy. Access ONTAP System Manager for details.")
+                        raise SnapMirrorSyncOperationError("not healthy")
+                elif transferState != "transferring":
+                    if print_output:
+                        print ("Error: Unknown sync operation status (" + transferState + ") returned by ONTAP API.")
+                    raise SnapMirrorSyncOperationError(transferState)
+                else:
+                    # Print message re: progress
+                    if print_output:
+                        print("Sync operation is not yet complete. Status:", transferState)
+                        print("Checking again in 10 seconds...")
+
+                # Sleep for 10 seconds before checking progress again
+                time.sleep(10)
+
+    else:
+        raise ConnectionTypeError()
+
+
+def wait_all(handles: list, timeout: float = 120, poll_interval: float = 1, print_output: bool = False) -> list():
+    # Group pending jobs by the ONTAP connection that they were started on
+    pendingHandles = collections.OrderedDict()
+    for handle in handles:
+        if handle.state not in _JOB_TERMINAL_STATES:
+            pendingHandles.setdefault(id(handle._connection), []).append(handle)
+
+    # Poll the jobs for each connection together, using up to one API call per _QUERY_BATCH_SIZE jobs per poll
+    deadline = time.monotonic() + timeout
+    for connectionHandles in pendingHandles.values():
+        try:
+            with connectionHandles[0]._connection:
+                jobs = _wait_for_jobs([handle.uuid for handle in connectionHandles],
+                                      timeout=max(deadline - time.monotonic(), 0), poll_interval=poll_interval)
+        except netappError.NetAppRestError as err:
+            if print_output:
+                print("Error: ONTAP Rest API Error: ", err)
+            raise APIConnectionError(err)
+
+        for handle in connectionHandles:
+            handle.state = jobs[handle.uuid]["state"]
+            handle.message = jobs[handle.uuid]["message"]
+
+    if print_output:
+        print(tabulate.tabulate([[handle.description, handle.uuid, handle.state, handle.message] for handle in handles],
+                       headers=["Description", "Job UUID", "State", "Message"]))
+
+    return handles
+
+#
+# Deprecated function names
+#
+
+
+@deprecated
+def cloneVolume(newVolumeName: str, sourceVolumeName: str, sourceSnapshotName: str = None, unixUID: str = None, unixGID: str = None, mountpoint: str = None, printOutput: bool = False) :
+    clone_volume(new_volume_name=newVolumeName, source_volume_name=sourceVolumeName, source_snapshot_name=sourceSnapshotName,
+                             mountpoint=mountpoint, unix_uid=unixUID, unix_gid=unixGID, print_output=printOutput)
+
+
+@deprecated
+def createSnapshot(volumeName: str, snapshotName: str = None, printOutput: bool = False) :
+    create_snapshot(volume_name=volumeName, snapshot_name=snapshotName, print_output=printOutput)
+
+
+@deprecated
+def createVolume(volumeName: str, volumeSize: str, guaranteeSpace: bool = False, volumeType: str = "flexvol", unixPermissions: str = "0777", unixUID: str = "0", unixGID: str = "0", exportPolicy: str = "default", snapshotPolicy: str = "none", aggregate: str = None, mountpoint: str = None, printOutput: bool = False) :
+    create_volume(volume_name=volumeName, volume_size=volumeSize, guarantee_space=guaranteeSpace, volume_type=volumeType, unix_permissions=unixPermissions, unix_uid=unixUID,
+                              unix_gid=unixGID, export_policy=exportPolicy, snapshot_policy=snapshotPolicy, aggregate=aggregate, mountpoint=mountpoint, print_output=printOutput)
+
+
+@deprecated
+def deleteSnapshot(volumeName: str, snapshotName: str, printOutput: bool = False) :
+    delete_snapshot(volume_name=volumeName, snapshot_name=snapshotName, print_output=printOutput)
+
+
+@deprecated
+def deleteVolume(volumeName: str, printOutput: bool = False) :
+    delete_volume(volume_name=volumeName, print_output=printOutput)
+
+
+@deprecated
+def listCloudSyncRelationships(printOutput: bool = False) -> list() :
+    return list_cloud_sync_relationships(print_output=printOutput)
+
+
+@deprecated
+def listSnapMirrorRelationships(printOutput: bool = False) -> list() :
+    return list_snap_mirror_relationships(print_output=printOutput)
+
+
+@deprecated
+def listSnapshots(volumeName: str, printOutput: bool = False) -> list() :
+    return list_snapshots(volume_name=volumeName, print_output=printOutput)
+
+
+@deprecated
+def listVolumes(checkLocalMounts: bool = False, includeSpaceUsageDetails: bool = False, printOutput: bool = False) -> list() :
+    return list_volumes(check_local_mounts=checkLocalMounts, include_space_usage_details=includeSpaceUsageDetails, print_output=printOutput)
+
+
+@deprecated
+def mountVolume(volumeName: str, mountpoint: str, printOutput: bool = False) :
+    mount_volume(volume_name=volumeName, mountpoint=mountpoint, print_output=printOutput)
+
+
+@deprecated
+def prepopulateFlexCache(volumeName: str, paths: list, printOutput: bool = False) :
+    prepopulate_flex_cache(volume_name=volumeName, paths=paths, print_output=printOutput)
+
+
+@deprecated
+def pullBucketFromS3(s3Bucket: str, localDirectory: str, s3ObjectKeyPrefix: str = "", printOutput: bool = False) :
+    return pull_bucket_from_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, print_output=printOutput)
+
+
+@deprecated
+def pullObjectFromS3(s3Bucket: str, s3ObjectKey: str, localFile: str = None, printOutput: bool = False) :
+    pull_object_from_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, print_output=printOutput)
+
+
+@deprecated
+def pushDirectoryToS3(s3Bucket: str, localDirectory: str, s3ObjectKeyPrefix: str = "", s3ExtraArgs: str = None, printOutput: bool = False) :
+    return push_directory_to_s3(s3_bucket=s3Bucket, local_directory=localDirectory, s3_object_key_prefix=s3ObjectKeyPrefix, s3_extra_args=s3ExtraArgs, print_output=printOutput)
+
+
+@deprecated
+def pushFileToS3(s3Bucket: str, localFile: str, s3ObjectKey: str = None, s3ExtraArgs: str = None, printOutput: bool = False) :
+    push_file_to_s3(s3_bucket=s3Bucket, s3_object_key=s3ObjectKey, local_file=localFile, s3_extra_args=s3ExtraArgs, print_output=printOutput)
+
+
+@deprecated
+def restoreSnapshot(volumeName: str, snapshotName: str, printOutput: bool = False) :
+    restore_snapshot(volume_name=volumeName, snapshot_name=snapshotName, print_output=printOutput)
+
+
+@deprecated
+def syncCloudSyncRelationship(relationshipID: str, waitUntilComplete: bool = False, printOutput: bool = False) :
+    sync_cloud_sync_relationship(relationship_id=relationshipID, wait_until_complete=waitUntilComplete, print_output=printOutput)
+
+
+@deprecated
+def syncSnapMirrorRelationship(uuid: str, waitUntilComplete: bool = False, printOutput: bool = False) :
+    sync_snap_mirror_relationship(uuid=uuid, wait_until_complete=waitUntilComplete, print_output=printOutput)
@@ -0,0 +1,932 @@
+"""NetApp DataOps Toolkit for Traditional Environments asyncio module.
+
+This module provides coroutine versions of a subset of the public functions
+in netapp_dataops.traditional, for use by applications that run inside of an
+asyncio event loop. Requests to the ONTAP REST API and to S3 are sent through
+aiohttp sessions that are shared across calls, so that many operations can be
+in flight at once on a single thread. Each coroutine returns the same values,
+and raises the same exception types, as its synchronous counterpart.
+
+This module requires the optional 'aio' dependencies, which can be installed
+with: python3 -m pip install netapp-dataops-traditional[aio]
+"""
+
+import asyncio
+import json
+import os
+import ssl
+import threading
+import time
+import urllib.parse
+import uuid as uuidlib
+import weakref
+import xml.etree.ElementTree as ElementTree
+
+import aiohttp
+import boto3
+from botocore.client import Config as BotoConfig
+from botocore.serialize import create_serializer
+from netapp_ontap.resources import Snapshot as NetAppSnapshot
+from netapp_ontap.resources import Volume as NetAppVolume
+from tabulate import tabulate
+
+from netapp_dataops.traditional import (
+    APIConnectionError,
+    ConnectionTypeError,
+    InvalidConfigError,
+    InvalidSnapshotParameterError,
+    InvalidVolumeParameterError,
+    SnapMirrorSyncOperationError,
+    _COLLECTION_PAGE_SIZE,
+    _JOB_TERMINAL_STATES,
+    _SNAPSHOT_FIELDS,
+    _S3_TRANSFER_AUTO_CONCURRENCY,
+    _construct_clone_dict,
+    _construct_export_policy_dict,
+    _construct_volume_dict,
+    _decode_config_secret,
+    _get_snapshots_exceeding_retention,
+    _print_invalid_config_error,
+    _read_local_mounts,
+    _retrieve_config,
+    _retrieve_s3_access_details
+)
+
+
+# Maximum number of concurrent connections that a shared session will open to a single host
+_SESSION_CONNECTIONS_PER_HOST = 100
+
+# Objects larger than this are uploaded to S3 using a multipart upload (same default as boto3)
+_S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
+# Size of each part of a multipart upload (same default as boto3)
+_S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+# Maximum number of parts that S3 allows in a multipart upload
+_S3_MAX_PARTS = 10000
+
+# Size of the chunks that downloaded objects are written to disk in
+_S3_DOWNLOAD_CHUNKSIZE = 1024 * 1024
+
+_S3_XML_NAMESPACE = {"s3": "http://s3.amazonaws.com/doc/2006-03-01/"}
+
+
+#
+# Class definitions
+#
+
+
+class _ONTAPRestError(Exception):
+    '''Error that will be raised when the ONTAP REST API returns an error or cannot be reached'''
+    pass
+
+
+class _S3RestError(Exception):
+    '''Error that will be raised when the S3 API returns an error or cannot be reached'''
+    pass
+
+
+# Shared aiohttp sessions, keyed by event loop and then by SSL verification setting. aiohttp sessions are
+# bound to the event loop that they were created on, so each event loop gets its own set of sessions.
+_sessions = weakref.WeakKeyDictionary()
+
+# Shared boto3 S3 clients, which are only used to sign requests locally, keyed by S3 endpoint and credentials
+_s3Clients = dict()
+_s3ClientsLock = threading.Lock()
+
+
+def _get_session(verify) -> aiohttp.ClientSession:
+    # 'verify' is True, False, or the path to a CA certificate bundle
+    loopSessions = _sessions.setdefault(asyncio.get_running_loop(), dict())
+    session = loopSessions.get(verify)
+    if session is None or session.closed:
+        if verify is True:
+            sslContext = None
+        elif verify:
+            sslContext = ssl.create_default_context(cafile=verify)
+        else:
+            sslContext = False
+        connector = aiohttp.TCPConnector(limit=0, limit_per_host=_SESSION_CONNECTIONS_PER_HOST, ssl=sslContext)
+        session = aiohttp.ClientSession(connector=connector)
+        loopSessions[verify] = session
+    return session
+
+
+class _ONTAPSession:
+    '''Minimal asynchronous ONTAP REST API client that sends requests through a shared aiohttp session'''
+
+    def __init__(self, config: dict, print_output: bool = False):
+        try:
+            hostname = config["hostname"]
+            username = config["username"]
+            passwordBase64 = config["password"]
+            verifySSLCert = config["verifySSLCert"]
+        except:
+            if print_output:
+                _print_invalid_config_error()
+            raise InvalidConfigError()
+
+        # Decode base64-encoded password
+        password = _decode_config_secret(passwordBase64)
+
+        self._hostUrl = "https://" + hostname
+        self._auth = aiohttp.BasicAuth(username, password)
+        self._session = _get_session(bool(verifySSLCert))
+
+    async def request(self, method: str, path: str, params: dict = None, body: dict = None) -> dict:
+        try:
+            async with self._session.request(method, self._hostUrl + path, params=params, json=body, auth=self._auth) as response:
+                try:
+                    responseBody = await response.json(content_type=None)
+                except ValueError:
+                    responseBody = None
+                if response.status >= 400:
+                    try:
+                        message = responseBody["error"]["message"]
+                    except (KeyError, TypeError):
+                        message = response.reason
+                    raise _ONTAPRestError(str(response.status) + " " + str(message))
+                return responseBody if responseBody else dict()
+        except aiohttp.ClientError as err:
+            raise _ONTAPRestError(err)
+
+    async def get_collection(self, path: str, **query):
+        # Retrieve records one page at a time, following the 'next' links returned by ONTAP
+        query.setdefault("max_records", _COLLECTION_PAGE_SIZE)
+        page = await self.request("GET", path, params=query)
+        while True:
+            for record in page.get("records", []):
+                yield record
+            try:
+                nextHref = page["_links"]["next"]["href"]
+            except KeyError:
+                return
+            page = await self.request("GET", nextHref)
+
+    async def find(self, path: str, **query) -> dict:
+        query.setdefault("max_records", 1)
+        async for record in self.get_collection(path, **query):
+            return record
+        return None
+
+    async def wait_for_job(self, response: dict, timeout: float = 120, poll_interval: float = 1):
+        # Wait for the job started by a POST/PATCH/DELETE request to complete; requests that were completed
+        # synchronously do not return a job
+        try:
+            jobUUID = response["job"]["uuid"]
+        except (KeyError, TypeError):
+            return
+
+        deadline = time.monotonic() + timeout
+        while True:
+            job = await self.request("GET", "/api/cluster/jobs/" + jobUUID, params={"fields": "state,message"})
+            if job.get("state") in _JOB_TERMINAL_STATES:
+                if job["state"] != "success":
+                    raise _ONTAPRestError("Job " + jobUUID + " " + job["state"] + ": " + str(job.get("message")))
+                return
+            if time.monotonic() >= deadline:
+                raise _ONTAPRestError("Job " + jobUUID + " did not complete within " + str(timeout) + " seconds.")
+            await asyncio.sleep(poll_interval)
+
+
+class _S3Session:
+    '''Asynchronous S3 client; requests are signed locally by boto3 as presigned URLs and sent through a shared aiohttp session'''
+
+    def __init__(self, client, session: aiohttp.ClientSession):
+        self._client = client
+        self._serializer = create_serializer(client.meta.service_model.metadata["protocol"])
+        self._session = session
+
+    def _presign(self, operation: str, params: dict, method: str = None) -> (str, dict):
+        # Headers that are derived from request parameters (e.g. ContentType, Metadata) are signed as part of the
+        # presigned URL, so they must also be sent with the request
+        url = self._client.generate_presigned_url(operation, Params=params, HttpMethod=method)
+        operationModel = self._client.meta.service_model.operation_model(self._client.meta.method_to_api_mapping[operation])
+        headers = self._serializer.serialize_to_request(params, operationModel)["headers"]
+        return url, dict(headers)
+
+    async def request(self, operation: str, params: dict, method: str = None, data=None) -> aiohttp.ClientResponse:
+        url, headers = self._presign(operation, params, method)
+        try:
+            response = await self._session.request(method if method else "GET", url, headers=headers, data=data)
+        except aiohttp.ClientError as err:
+            raise _S3RestError(err)
+        if response.status >= 400:
+            body = await response.text()
+            response.release()
+            raise _S3RestError(str(response.status) + " " + str(response.reason) + ": " + body)
+        return response
+
+    async def request_xml(self, operation: str, params: dict, method: str = None, data=None) -> ElementTree.Element:
+        response = await self.request(operation, params, method=method, data=data)
+        async with response:
+            return ElementTree.fromstring(await response.read())
+
+    async def list_object_keys(self, bucket: str, prefix: str):
+        params = {"Bucket": bucket, "Prefix": prefix}
+        while True:
+            result = await self.request_xml("list_objects_v2", params)
+            # Object keys are URL encoded in list responses
+            for key in result.iterfind("s3:Contents/s3:Key", _S3_XML_NAMESPACE):
+                yield urllib.parse.unquote_plus(key.text)
+            continuationToken = result.findtext("s3:NextContinuationToken", namespaces=_S3_XML_NAMESPACE)
+            if not continuationToken:
+                return
+            params["ContinuationToken"] = continuationToken
+
+
+#
+# Private functions
+#
+
+
+def _retrieve_ontap_session(cluster_name: str = None, print_output: bool = False) -> (dict, _ONTAPSession):
+    # Retrieve config details from config file
+    try:
+        config = _retrieve_config(print_output=print_output)
+    except InvalidConfigError:
+        raise
+    try:
+        connectionType = config["connectionType"]
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    if connectionType != "ONTAP":
+        raise ConnectionTypeError()
+
+    if cluster_name:
+        config = dict(config, hostname=cluster_name)
+
+    return config, _ONTAPSession(config=config, print_output=print_output)
+
+
+def _get_s3_client(s3Endpoint: str, s3AccessKeyId: str, s3SecretAccessKey: str):
+    # Called from the default executor; the lock ensures that concurrent first calls build a single client
+    with _s3ClientsLock:
+        clientKey = (s3Endpoint, s3AccessKeyId, s3SecretAccessKey)
+        client = _s3Clients.get(clientKey)
+        if client is None:
+            session = boto3.session.Session(aws_access_key_id=s3AccessKeyId, aws_secret_access_key=s3SecretAccessKey)
+            client = session.client(service_name='s3', endpoint_url=s3Endpoint, config=BotoConfig(signature_version='s3v4'))
+            _s3Clients[clientKey] = client
+        return client
+
+
+async def _retrieve_s3_session(print_output: bool = False) -> _S3Session:
+    s3Endpoint, s3AccessKeyId, s3SecretAccessKey, s3VerifySSLCert, s3CACertBundle = _retrieve_s3_access_details(print_output=print_output)
+
+    # Building a client loads botocore's service model from disk, so new clients are built outside of the event loop
+    clientKey = (s3Endpoint, s3AccessKeyId, s3SecretAccessKey)
+    client = _s3Clients.get(clientKey)
+    if client is None:
+        client = await asyncio.get_running_loop().run_in_executor(None, _get_s3_client, *clientKey)
+
+    if s3VerifySSLCert and s3CACertBundle:
+        return _S3Session(client, _get_session(s3CACertBundle))
+    return _S3Session(client, _get_session(bool(s3VerifySSLCert)))
+
+
+async def _find_volume(ontap: _ONTAPSession, volume_name: str, svm: str, fields: str = "name,uuid") -> NetAppVolume:
+    record = await ontap.find("/api/storage/volumes", **{"name": volume_name, "svm.name": svm, "fields": fields})
+    return NetAppVolume.from_dict(record) if record else None
+
+
+async def _find_snapshot(ontap: _ONTAPSession, volume_uuid: str, snapshot_name: str) -> NetAppSnapshot:
+    record = await ontap.find("/api/storage/volumes/" + volume_uuid + "/snapshots", name=snapshot_name, fields=_SNAPSHOT_FIELDS)
+    return NetAppSnapshot.from_dict(record) if record else None
+
+
+async def _find_latest_snapshot(ontap: _ONTAPSession, volume_uuid: str, prefix: str) -> NetAppSnapshot:
+    # Let ONTAP sort the matching snapshots and return only the newest one
+    record = await ontap.find("/api/storage/volumes/" + volume_uuid + "/snapshots", name=prefix + "*", order_by="create_time desc",
+                              fields=_SNAPSHOT_FIELDS)
+    return NetAppSnapshot.from_dict(record) if record else None
+
+
+async def _get_snapshots(ontap: _ONTAPSession, volume_uuid: str, name: str = None, order_by: str = "create_time") -> list:
+    query = {"fields": _SNAPSHOT_FIELDS, "order_by": order_by}
+    if name:
+        query["name"] = name
+    return [NetAppSnapshot.from_dict(record) async for record in ontap.get_collection("/api/storage/volumes/" + volume_uuid + "/snapshots", **query)]
+
+
+async def _snapshot_policy_exists(ontap: _ONTAPSession, snapshot_policy: str, svm: str) -> bool:
+    # Check for a cluster-scoped snapshot policy or a snapshot policy owned by the svm
+    async for snapshotPolicy in ontap.get_collection("/api/storage/snapshot-policies", name=snapshot_policy, fields="name,svm.name"):
+        if snapshotPolicy.get("name") == snapshot_policy:
+            if "svm" not in snapshotPolicy or snapshotPolicy["svm"].get("name") == svm:
+                return True
+    return False
+
+
+async def _download_from_s3(s3: _S3Session, s3Bucket: str, s3ObjectKey: str, localFile: str, print_output: bool = False):
+    if print_output:
+        print("Downloading object '" + s3ObjectKey + "' from bucket '" + s3Bucket + "' and saving as '" + localFile + "'.")
+
+    # Create directories that don't exist
+    dirpath = os.path.dirname(localFile)
+    if dirpath:
+        os.makedirs(dirpath, exist_ok=True)
+
+    # Download to a temporary file that replaces the local file once the download is complete
+    tempFile = localFile + "." + uuidlib.uuid4().hex[:8]
+    try:
+        response = await s3.request("get_object", {"Bucket": s3Bucket, "Key": s3ObjectKey})
+        async with response:
+            # Write chunks from the default executor, so that disk I/O does not block the event loop
+            loop = asyncio.get_running_loop()
+            file = await loop.run_in_executor(None, open, tempFile, "wb")
+            try:
+                async for chunk in response.content.iter_chunked(_S3_DOWNLOAD_CHUNKSIZE):
+                    await loop.run_in_executor(None, file.write, chunk)
+            finally:
+                await loop.run_in_executor(None, file.close)
+        os.replace(tempFile, localFile)
+    except (_S3RestError, aiohttp.ClientError, OSError) as err:
+        if os.path.exists(tempFile):
+            os.remove(tempFile)
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+
+async def _upload_to_s3(s3: _S3Session, s3Bucket: str, localFile: str, s3ObjectKey: str, s3ExtraArgs: dict = None,
+                       max_part_concurrency: int = _S3_TRANSFER_AUTO_CONCURRENCY, print_output: bool = False):
+    if print_output:
+        print("Uploading file '" + localFile + "' to bucket '" + s3Bucket + "' and applying key '" + s3ObjectKey + "'.")
+
+    params = dict(s3ExtraArgs) if s3ExtraArgs else dict()
+    params["Bucket"] = s3Bucket
+    params["Key"] = s3ObjectKey
+
+    try:
+        fileSize = os.path.getsize(localFile)
+        if fileSize <= _S3_MULTIPART_THRESHOLD:
+            with open(localFile, "rb") as file:
+                response = await s3.request("put_object", params, method="PUT", data=file)
+                response.release()
+        else:
+            await _multipart_upload_to_s3(s3, params, localFile, fileSize, max_concurrency=max_part_concurrency)
+    except (_S3RestError, aiohttp.ClientError, OSError) as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+
+async def _multipart_upload_to_s3(s3: _S3Session, params: dict, localFile: str, fileSize: int, max_concurrency: int = _S3_TRANSFER_AUTO_CONCURRENCY):
+    partSize = max(_S3_MULTIPART_CHUNKSIZE, -(-fileSize // _S3_MAX_PARTS))
+    result = await s3.request_xml("create_multipart_upload", params, method="POST")
+    uploadId = result.findtext("s3:UploadId", namespaces=_S3_XML_NAMESPACE)
+    partParams = {"Bucket": params["Bucket"], "Key": params["Key"], "UploadId": uploadId}
+
+    loop = asyncio.get_running_loop()
+
+    def read_part(offset: int) -> bytes:
+        with open(localFile, "rb") as file:
+            file.seek(offset)
+            return file.read(partSize)
+
+    # A part is only read from disk once it can be sent, so that at most max_concurrency parts are held in memory
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload_part(partNumber: int) -> str:
+        async with semaphore:
+            data = await loop.run_in_executor(None, read_part, (partNumber - 1) * partSize)
+            response = await s3.request("upload_part", dict(partParams, PartNumber=partNumber), method="PUT", data=data)
+            response.release()
+            return response.headers["ETag"]
+
+    try:
+        etags = await asyncio.gather(*[upload_part(partNumber) for partNumber in range(1, -(-fileSize // partSize) + 1)])
+        parts = "".join("<Part><PartNumber>%d</PartNumber><ETag>%s</ETag></Part>" % (i + 1, etag) for i, etag in enumerate(etags))
+        await s3.request_xml("complete_multipart_upload", partParams, method="POST",
+                             data="<CompleteMultipartUpload>" + parts + "</CompleteMultipartUpload>")
+    except BaseException:
+        try:
+            response = await s3.request("abort_multipart_upload", partParams, method="DELETE")
+            response.release()
+        except (_S3RestError, aiohttp.ClientError):
+            pass
+        raise
+
+
+async def _run_bounded(items, worker, max_concurrency: int):
+    # Await worker(item) for each item of an async iterable, with at most max_concurrency workers running at once;
+    # items are only taken from the iterable as workers become free, so memory usage does not grow with the number of
+    # items. If the iterable raises, the items that were already taken are processed before the error is re-raised.
+    queue = asyncio.Queue(maxsize=max_concurrency)
+    workerErrors = list()
+
+    async def consume():
+        while True:
+            item = await queue.get()
+            try:
+                await worker(item)
+            except Exception as err:
+                workerErrors.append(err)
+            finally:
+                queue.task_done()
+
+    consumers = [asyncio.ensure_future(consume()) for i in range(max_concurrency)]
+    try:
+        try:
+            async for item in items:
+                await queue.put(item)
+        finally:
+            await queue.join()
+    finally:
+        for consumer in consumers:
+            consumer.cancel()
+    if workerErrors:
+        raise workerErrors[0]
+
+
+#
+# Public importable functions
+#
+
+
+async def clone_volume(new_volume_name: str, source_volume_name: str, cluster_name: str = None, source_snapshot_name: str = None,
+                       source_svm: str = None, target_svm: str = None, export_hosts: str = None, export_policy: str = None, split: bool = False,
+                       unix_uid: str = None, unix_gid: str = None, junction: str = None, snapshot_policy: str = None, print_output: bool = False):
+    config, ontap = _retrieve_ontap_session(cluster_name=cluster_name, print_output=print_output)
+
+    # Retrieve values from config file if not passed into function
+    try:
+        sourcesvm = config["svm"]
+        if source_svm:
+            sourcesvm = source_svm
+
+        targetsvm = sourcesvm
+        if target_svm:
+            targetsvm = target_svm
+
+        if not unix_uid:
+            unix_uid = config["defaultUnixUID"]
+        if not unix_gid:
+            unix_gid = config["defaultUnixGID"]
+        if not snapshot_policy:
+            snapshot_policy = config["defaultSnapshotPolicy"]
+        # A custom export policy is only created for export_hosts if no export policy was specified
+        createExportPolicy = False
+        if not export_policy and not export_hosts:
+            export_policy = config["defaultExportPolicy"]
+        elif not export_policy:
+            export_policy = "netapp_dataops_"+new_volume_name
+            createExportPolicy = True
+    except Exception as e:
+        if print_output:
+            print(e)
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    # Check unix uid and gid for validity
+    try:
+        unix_uid = int(unix_uid)
+    except:
+        if print_output:
+            print("Error: Invalid unix uid specified. Value be an integer. Example: '0' for root user.")
+        raise InvalidVolumeParameterError("unixUID")
+    try:
+        unix_gid = int(unix_gid)
+    except:
+        if print_output:
+            print("Error: Invalid unix gid specified. Value must be an integer. Example: '0' for root group.")
+        raise InvalidVolumeParameterError("unixGID")
+
+    try:
+        # Perform independent lookups concurrently
+        currentVolume, currentExportPolicy, snapshotPolicyExists, sourceVolume = await asyncio.gather(
+            _find_volume(ontap, new_volume_name, targetsvm),
+            ontap.find("/api/protocols/nfs/export-policies", **{"name": export_policy, "svm.name": targetsvm}),
+            _snapshot_policy_exists(ontap, snapshot_policy=snapshot_policy, svm=targetsvm),
+            _find_volume(ontap, source_volume_name, sourcesvm)
+        )
+
+        if currentVolume:
+            if print_output:
+                print("Error: clone:"+new_volume_name+" already exists.")
+            raise InvalidVolumeParameterError("name")
+        if not createExportPolicy and not currentExportPolicy:
+            if print_output:
+                print("Error: export policy:"+export_policy+" dones not exists.")
+            raise InvalidVolumeParameterError("name")
+        if not snapshotPolicyExists:
+            if print_output:
+                print("Error: snapshot-policy:"+snapshot_policy+" could not be found")
+            raise InvalidVolumeParameterError("snapshot_policy")
+        if not sourceVolume:
+            if print_output:
+                print("Error: Invalid source volume name.")
+            raise InvalidVolumeParameterError("name")
+
+        # Retrieve source snapshot; a trailing '*' selects the latest snapshot matching the prefix
+        sourceSnapshot = None
+        if source_snapshot_name and source_snapshot_name.endswith("*"):
+            source_snapshot_prefix = source_snapshot_name[:-1]
+            sourceSnapshot = await _find_latest_snapshot(ontap, sourceVolume.uuid, source_snapshot_prefix)
+            if not sourceSnapshot:
+                if print_output:
+                    print("Error: Could not find snapshot prefixed by '"+source_snapshot_prefix+"'.")
+                raise InvalidSnapshotParameterError("name")
+            if print_output:
+                print("Snapshot '" + sourceSnapshot.name + "' will be used to create the clone.")
+        elif source_snapshot_name:
+            sourceSnapshot = await _find_snapshot(ontap, sourceVolume.uuid, source_snapshot_name)
+            if not sourceSnapshot:
+                if print_output:
+                    print("Error: Invalid source snapshot name.")
+                raise InvalidSnapshotParameterError("name")
+
+        # Create custom export policy if needed
+        if createExportPolicy:
+            if currentExportPolicy:
+                await ontap.request("DELETE", "/api/protocols/nfs/export-policies/" + str(currentExportPolicy["id"]))
+            if print_output:
+                print("Creating export-policy:"+export_policy)
+            await ontap.request("POST", "/api/protocols/nfs/export-policies",
+                                body=_construct_export_policy_dict(export_policy, targetsvm, export_hosts))
+
+        # Create clone volume, with export policy and snapshot policy applied as part of the clone request
+        if print_output:
+            print("Creating clone volume '" + targetsvm+':'+new_volume_name + "' from source volume '" + sourcesvm+':'+source_volume_name + "'.")
+            if unix_uid == 0:
+                print("Warning: Cannot apply uid of '0' when creating clone; uid of source volume will be retained.")
+            if unix_gid == 0:
+                print("Warning: Cannot apply gid of '0' when creating clone; gid of source volume will be retained.")
+        newVolumeDict = _construct_clone_dict(new_volume_name=new_volume_name, source_svm=sourcesvm, target_svm=targetsvm,
+                                              source_volume=sourceVolume, source_snapshot=sourceSnapshot, export_policy=export_policy,
+                                              snapshot_policy=snapshot_policy, unix_uid=unix_uid, unix_gid=unix_gid, junction=junction)
+        try:
+            response = await ontap.request("POST", "/api/storage/volumes", body=newVolumeDict)
+            await ontap.wait_for_job(response)
+        except _ONTAPRestError:
+            # Do not leave the custom export policy behind if the clone could not be created
+            if createExportPolicy:
+                try:
+                    newExportPolicy = await ontap.find("/api/protocols/nfs/export-policies", **{"name": export_policy, "svm.name": targetsvm})
+                    if newExportPolicy:
+                        await ontap.request("DELETE", "/api/protocols/nfs/export-policies/" + str(newExportPolicy["id"]))
+                except _ONTAPRestError as err:
+                    if print_output:
+                        print("Warning: Could not delete export-policy:"+export_policy+": ", err)
+            raise
+        if print_output:
+            print("Clone volume created successfully.")
+
+        # Split clone
+        if split:
+            if print_output:
+                print("Splitting clone")
+            newVolume = await _find_volume(ontap, new_volume_name, targetsvm)
+            await ontap.request("PATCH", "/api/storage/volumes/" + newVolume.uuid, body={"clone": {"split_initiated": True}})
+
+    except _ONTAPRestError as err:
+        if print_output:
+            print("Error: ONTAP Rest API Error: ", err)
+        raise APIConnectionError(err)
+
+
+async def create_snapshot(volume_name: str, cluster_name: str = None, svm_name: str = None, snapshot_name: str = None, retention_count: int = 0,
+                          retention_days: bool = False, snapmirror_label: str = None, print_output: bool = False):
+    config, ontap = _retrieve_ontap_session(cluster_name=cluster_name, print_output=print_output)
+
+    if not snapshot_name:
+        snapshot_name = "netapp_dataops"
+
+    # Retrieve svm from config file
+    try:
+        svm = config["svm"]
+        if svm_name:
+            svm = svm_name
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    snapshot_name_original = snapshot_name
+    retention_count = int(retention_count)
+    if retention_count > 0:
+        snapshot_name += '.' + time.strftime("%Y-%m-%d_%H%M%S")
+
+    if print_output:
+        print("Creating snapshot '" + snapshot_name + "'.")
+
+    try:
+        # Retrieve volume
+        volume = await _find_volume(ontap, volume_name, svm)
+        if not volume:
+            if print_output:
+                print("Error: Invalid volume name.")
+            raise InvalidVolumeParameterError("name")
+
+        # Create snapshot
+        snapshotDict = {"name": snapshot_name}
+        if snapmirror_label:
+            if print_output:
+                print("Setting snapmirror label as:"+snapmirror_label)
+            snapshotDict["snapmirror_label"] = snapmirror_label
+        response = await ontap.request("POST", "/api/storage/volumes/" + volume.uuid + "/snapshots", body=snapshotDict)
+        await ontap.wait_for_job(response)
+        if print_output:
+            print("Snapshot created successfully.")
+
+        # Delete snapshots exceeding retention count, skipping snapshots that have owners
+        if retention_count > 0:
+            snapshots = await _get_snapshots(ontap, volume.uuid, name=snapshot_name_original+".*")
+            expiredSnapshots = set(_get_snapshots_exceeding_retention(snapshots, snapshot_name_prefix=snapshot_name_original,
+                                                                       retention_count=retention_count, retention_days=retention_days))
+
+            async def delete_snapshot(snapshot: NetAppSnapshot):
+                if print_output:
+                    print("Deleting snapshot '" + snapshot.name + "'.")
+                if hasattr(snapshot, "owners"):
+                    if print_output:
+                        print('Warning: Snapshot cannot be deleted since it has owners:'+','.join(snapshot.owners))
+                    return
+                response = await ontap.request("DELETE", "/api/storage/volumes/" + volume.uuid + "/snapshots/" + snapshot.uuid)
+                await ontap.wait_for_job(response)
+                if print_output:
+                    print("Snapshot deleted successfully.")
+
+            await asyncio.gather(*[delete_snapshot(snapshot) for snapshot in snapshots if snapshot.name in expiredSnapshots])
+
+    except _ONTAPRestError as err:
+        if print_output:
+            print("Error: ONTAP Rest API Error: ", err)
+        raise APIConnectionError(err)
+
+
+async def list_snapshots(volume_name: str, cluster_name: str = None, svm_name: str = None, print_output: bool = False) -> list():
+    config, ontap = _retrieve_ontap_session(cluster_name=cluster_name, print_output=print_output)
+
+    # Retrieve svm from config file
+    try:
+        svm = config["svm"]
+        if svm_name:
+            svm = svm_name
+    except:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    try:
+        # Retrieve volume
+        volume = await _find_volume(ontap, volume_name, svm)
+        if not volume:
+            if print_output:
+                print("Error: Invalid volume name.")
+            raise InvalidVolumeParameterError("name")
+
+        # Construct list of snapshots
+        snapshotsList = [{"Snapshot Name": snapshot.name, "Create Time": snapshot.create_time}
+                         for snapshot in await _get_snapshots(ontap, volume.uuid)]
+
+    except _ONTAPRestError as err:
+        if print_output:
+            print("Error: ONTAP Rest API Error: ", err)
+        raise APIConnectionError(err)
+
+    # Print list of snapshots
+    if print_output:
+        print(tabulate(snapshotsList, headers="keys"))
+
+    return snapshotsList
+
+
+async def list_volumes(check_local_mounts: bool = False, include_space_usage_details: bool = False, print_output: bool = False,
+                       cluster_name: str = None, svm_name: str = None) -> list():
+    config, ontap = _retrieve_ontap_session(cluster_name=cluster_name, print_output=print_output)
+
+    try:
+        svmname = config["svm"]
+        if svm_name:
+            svmname = svm_name
+
+        # Retrieve local mounts if desired
+        mounts = None
+        if check_local_mounts:
+            mounts = await asyncio.get_running_loop().run_in_executor(None, _read_local_mounts)
+
+        # Retrieve all volumes for SVM; older ONTAP versions reject the 'constituents' field
+        volumeFields = "nas.path,size,style,clone,flexcache_endpoint_type"
+        if include_space_usage_details:
+            volumeFields += ",space"
+        try:
+            records = [record async for record in ontap.get_collection("/api/storage/volumes", **{
+                "svm.name": svmname, "fields": volumeFields + (",constituents" if include_space_usage_details else "")})]
+        except _ONTAPRestError:
+            if not include_space_usage_details:
+                raise
+            records = [record async for record in ontap.get_collection("/api/storage/volumes", **{"svm.name": svmname, "fields": volumeFields})]
+
+        # Construct list of volumes; do not include SVM root volume
+        volumesList = list()
+        for record in records:
+            volumeDict = _construct_volume_dict(volume=NetAppVolume.from_dict(record), config=config, svm=svmname,
+                                                include_space_usage_details=include_space_usage_details, mounts=mounts)
+            if volumeDict:
+                volumesList.append(volumeDict)
+
+    except _ONTAPRestError as err:
+        if print_output:
+            print("Error: ONTAP Rest API Error: ", err)
+        raise APIConnectionError(err)
+    except KeyError:
+        if print_output:
+            _print_invalid_config_error()
+        raise InvalidConfigError()
+
+    # Print list of volumes
+    if print_output:
+        print(tabulate(volumesList, headers="keys"))
+
+    return volumesList
+
+
+async def pull_bucket_from_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "", max_concurrency: int = 64, print_output: bool = False) -> dict:
+    s3 = await _retrieve_s3_session(print_output=print_output)
+
+    # Add slash to end of local directory path if not present
+    if not local_directory.endswith(os.sep):
+        local_directory += os.sep
+
+    # Download objects as they are listed; a failed object is recorded and does not stop the other downloads
+    objectCount = 0
+    failedObjects = list()
+
+    async def download(key: str):
+        nonlocal objectCount
+        try:
+            await _download_from_s3(s3, s3Bucket=s3_bucket, s3ObjectKey=key, localFile=local_directory+key, print_output=print_output)
+            objectCount += 1
+        except APIConnectionError as err:
+            failedObjects.append({"Key": key, "Error": err})
+
+    async def list_objects():
+        async for key in s3.list_object_keys(s3_bucket, s3_object_key_prefix):
+            if not key.endswith("/"):
+                yield key
+
+    try:
+        await _run_bounded(list_objects(), download, max_concurrency=max_concurrency)
+    except (_S3RestError, aiohttp.ClientError) as err:
+        if print_output:
+            print("Error: S3 API error: ", err)
+        raise APIConnectionError(err)
+
+    if print_output:
+        if failedObjects:
+            print("Error: Failed to download " + str(len(failedObjects)) + " object(s).")
+        else:
+            print("Download complete.")
+
+    return {"Objects": objectCount, "Failures": len(failedObjects), "Failed Objects": failedObjects}
+
+
+async def pull_object_from_s3(s3_bucket: str, s3_object_key: str, local_file: str = None, print_output: bool = False):
+    s3 = await _retrieve_s3_session(print_output=print_output)
+
+    # Set local file name
+    if not local_file:
+        local_file = s3_object_key
+
+    await _download_from_s3(s3, s3Bucket=s3_bucket, s3ObjectKey=s3_object_key, localFile=local_file, print_output=print_output)
+
+    if print_output:
+        print("Download complete.")
+
+
+async def push_directory_to_s3(s3_bucket: str, local_directory: str, s3_object_key_prefix: str = "", s3_extra_args: str = None,
+                               max_concurrency: int = 64, print_output: bool = False) -> dict:
+    s3 = await _retrieve_s3_session(print_output=print_output)
+    s3ExtraArgs = json.loads(s3_extra_args) if s3_extra_args else None
+
+    # Keep the total number of parts in flight near the same target as the synchronous transfers
+    maxPartConcurrency = max(1, _S3_TRANSFER_AUTO_CONCURRENCY // max_concurrency)
+
+    # Upload files as they are found; a failed file is recorded and does not stop the other uploads
+    fileCount = 0
+    failedObjects = list()
+
+    async def upload(localFile: str):
+        nonlocal fileCount
+        s3ObjectKey = s3_object_key_prefix + os.path.relpath(localFile, local_directory)
+        try:
+            await _upload_to_s3(s3, s3Bucket=s3_bucket, localFile=localFile, s3ObjectKey=s3ObjectKey, s3ExtraArgs=s3ExtraArgs,
+                                max_part_concurrency=maxPartConcurrency, print_output=print_output)
+            fileCount += 1
+        except APIConnectionError as err:
+            failedObjects.append({"Key": s3ObjectKey, "Error": err})
+
+    async def list_files():
+        # Loop through all files in directory, excluding hidden files and directories
+        for dirpath, dirnames, filenames in os.walk(local_directory):
+            filenames = [filename for filename in filenames if not filename[0] == '.']
+            dirnames[:] = [dirname for dirname in dirnames if not dirname[0] == '.']
+            for filename in filenames:
+                yield os.path.join(dirpath, filename)
+
+    await _run_bounded(list_files(), upload, max_concurrency=max_concurrency)
+
+    if print_output:
+        if failedObjects:
+            print("Error: Failed to upload " + str(len(failedObjects)) + " file(s).")
+        else:
+            print("Upload complete.")
+
+    return {"Objects": fileCount, "Failures": len(failedObjects), "Failed Objects": failedObjects}
+
+
+async def push_file_to_s3(s3_bucket: str, local_file: str, s3_object_key: str = None, s3_extra_args: str = None, print_output: bool = False):
+    s3 = await _retrieve_s3_session(print_output=print_output)
+
+    # Set S3 object key
+    if not s3_object_key:
+        s3_object_key = local_file
+
+    await _upload_to_s3(s3, s3Bucket=s3_bucket, localFile=local_file, s3ObjectKey=s3_object_key,
+                        s3ExtraArgs=json.loads(s3_extra_args) if s3_extra_args else None, print_output=print_output)
+
+    if print_output:
+        print("Upload complete.")
+
+
+async def sync_snap_mirror_relationship(uuid: str = None, svm_name: str = None, volume_name: str = None, cluster_name: str = None,
+                                        wait_until_complete: bool = False, print_output: bool = False):
+    config, ontap = _retrieve_ontap_session(cluster_name=cluster_name, print_output=print_output)
+
+    try:
+        if volume_name:
+            svm = config["svm"]
+            if svm_name:
+                svm = svm_name
+
+            # Look up relationship by destination volume, falling back to an svm-dr relationship
+            relationship = await ontap.find("/api/snapmirror/relationships", **{"destination.path": svm+":"+volume_name})
+            if not relationship:
+                relationship = await ontap.find("/api/snapmirror/relationships", **{"destination.path": svm+":"})
+                if relationship and print_output:
+                    print("volume is part of svm-dr relationshitp: "+svm+":")
+            if relationship:
+                uuid = relationship["uuid"]
+
+        if not uuid:
+            if print_output:
+                print("Error: relationship could not be found.")
+            raise SnapMirrorSyncOperationError("not found")
+
+        if print_output:
+            print("Triggering sync operation for SnapMirror relationship (UUID = " + uuid + ").")
+
+        # Trigger sync operation for SnapMirror relationship
+        response = await ontap.request("POST", "/api/snapmirror/relationships/" + uuid + "/transfers", body=dict())
+        await ontap.wait_for_job(response)
+
+        if print_output:
+            print("Sync operation successfully triggered.")
+
+        if wait_until_complete:
+            if print_output:
+                print("Waiting for sync operation to complete.")
+                print("Status check will be performed in 10 seconds...")
+            await asyncio.sleep(10)
+
+            while True:
+                # Retrieve relationship and check status of sync operation
+                relationship = await ontap.request("GET", "/api/snapmirror/relationships/" + uuid, params={"fields": "healthy,transfer.state"})
+                transferState = relationship.get("transfer", dict()).get("state")
+
+                # if transfer is complete, end execution
+                if (not transferState) or (transferState == "success"):
+                    if relationship.get("healthy"):
+                        if print_output:
+                            print("Success: Sync operation is complete.")
+                        break
+                    else:
+                        if print_output:
+                            print("Error: Relationship is not healthy. Access ONTAP System Manager for details.")
+                        raise SnapMirrorSyncOperationError("not healthy")
+                elif transferState != "transferring":
+                    if print_output:
+                        print("Error: Unknown sync operation status (" + transferState + ") returned by ONTAP API.")
+                    raise SnapMirrorSyncOperationError(transferState)
+                elif print_output:
+                    print("Sync operation is not yet complete. Status:", transferState)
+                    print("Checking again in 10 seconds...")
+
+                # Sleep for 10 seconds before checking progress again
+                await asyncio.sleep(10)
+
+    except _ONTAPRestError as err:
+        if print_output:
+            print("Error: ONTAP Rest API Error: ", err)
+        raise APIConnectionError(err)
+
+
+async def close_sessions():
+    # Close the shared HTTP sessions that belong to the running event loop
+    for session in _sessions.pop(asyncio.get_running_loop(), dict()).values():
+        await session.close()
@@ -0,0 +1,49 @@
+"""Regression test for the import cost of netapp_dataops.traditional.
+
+The ONTAP, S3 and YAML client libraries are imported lazily, on first use, so
+that the CLI and library start quickly. This test fails if a new top-level
+import pulls one of them (or pandas, which the toolkit no longer uses) back in.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be loaded by 'import netapp_dataops.traditional'
+LAZY_MODULES = ("boto3", "botocore", "netapp_ontap", "requests", "yaml", "aiohttp", "pandas", "numpy")
+
+# Generous upper bound on the cumulative import time of the package, in microseconds; importing the package eagerly
+# took roughly 750ms
+IMPORT_TIME_BUDGET_US = 300000
+
+
+def _import_with_importtime(module: str) -> (list, str):
+    # Import the module in a fresh interpreter and return the modules that it loaded and the '-X importtime' report
+    code = "import sys, " + module + "; print(','.join(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PACKAGE_ROOT,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    return result.stdout.strip().split(","), result.stderr
+
+
+def _cumulative_import_time(report: str, module: str) -> int:
+    # Lines of the report look like 'import time:  self [us] | cumulative | imported package'
+    for line in report.splitlines():
+        match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)$", line)
+        if match and match.group(2) == module:
+            return int(match.group(1))
+    raise AssertionError("'" + module + "' not found in -X importtime report")
+
+
+def test_import_does_not_load_lazy_modules():
+    loadedModules, report = _import_with_importtime("netapp_dataops.traditional")
+    loadedLazyModules = [module for module in LAZY_MODULES if module in loadedModules]
+    assert not loadedLazyModules, "import netapp_dataops.traditional loaded: " + ", ".join(loadedLazyModules)
+
+
+def test_import_time_within_budget():
+    loadedModules, report = _import_with_importtime("netapp_dataops.traditional")
+    importTime = _cumulative_import_time(report, "netapp_dataops.traditional")
+    assert importTime < IMPORT_TIME_BUDGET_US, "import netapp_dataops.traditional took " + str(importTime) + "us"
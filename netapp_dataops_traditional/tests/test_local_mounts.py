@@ -0,0 +1,72 @@
+"""Tests for the index of the local mount table that list_volumes, mount_volume
+and mount_volumes use to find the local mountpoints of volumes.
+"""
+
+from netapp_dataops import traditional
+from netapp_dataops.traditional import _LocalMounts
+
+
+def test_mountpoint_matches_mount_source():
+    mounts = _LocalMounts([("10.0.0.1:/vol1", "/mnt/vol1")])
+    assert mounts.get_mountpoint("10.0.0.1:/vol1", export_path="/vol1") == "/mnt/vol1"
+    assert mounts.sources_by_mountpoint["/mnt/vol1"] == "10.0.0.1:/vol1"
+
+
+def test_mountpoint_matches_export_path_of_other_data_lif():
+    # Volumes that were mounted through a data LIF other than the one in the config file are matched on export path
+    mounts = _LocalMounts([("10.0.0.7:/vol1", "/mnt/vol1"), ("[fe80::1]:/vol2", "/mnt/vol2")])
+    assert mounts.get_mountpoint("10.0.0.1:/vol1", export_path="/vol1") == "/mnt/vol1"
+    assert mounts.get_mountpoint("10.0.0.1:/vol2", export_path="/vol2") == "/mnt/vol2"
+    assert mounts.get_mountpoint("10.0.0.1:/vol3", export_path="/vol3") is None
+
+
+def test_exact_mount_source_takes_precedence_over_export_path():
+    mounts = _LocalMounts([("10.0.0.1:/vol1", "/mnt/a"), ("10.0.0.7:/vol1", "/mnt/b")])
+    assert mounts.get_mountpoint("10.0.0.1:/vol1", export_path="/vol1") == "/mnt/a"
+
+
+def test_non_nfs_mounts_are_not_indexed_by_export_path():
+    mounts = _LocalMounts([("proc", "/proc"), ("/dev/sda1", "/")])
+    assert mounts.mountpoints_by_export_path == {}
+    assert mounts.get_mountpoint("10.0.0.1:/", export_path="/") is None
+
+
+def test_read_local_mounts_parses_mountinfo(tmp_path, monkeypatch):
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(
+        # No optional fields before the '-' separator
+        "22 1 0:21 / /proc rw,nosuid - proc proc rw\n"
+        # Several optional fields, and a mountpoint with an escaped space
+        "36 35 98:0 / /mnt/my\\040data rw,noatime shared:12 master:1 - nfs4 10.0.0.1:/vol1 rw,vers=4.1\n"
+        # Mount stacked on top of another mount at the same mountpoint
+        "37 35 98:0 / /mnt/b rw,noatime - nfs 10.0.0.1:/vol2 rw\n"
+        "38 37 98:0 / /mnt/b rw,noatime - nfs 10.0.0.1:/vol3 rw\n"
+        # Line without a separator is skipped
+        "39 35 98:0 / /mnt/c rw\n"
+    )
+    monkeypatch.setattr(traditional, "_MOUNTINFO_PATH", str(mountinfo))
+
+    mounts = traditional._read_local_mounts()
+    assert mounts.mountpoints_by_source == {
+        "proc": "/proc",
+        "10.0.0.1:/vol1": "/mnt/my data",
+        "10.0.0.1:/vol2": "/mnt/b",
+        "10.0.0.1:/vol3": "/mnt/b"
+    }
+    assert mounts.sources_by_mountpoint["/mnt/b"] == "10.0.0.1:/vol3"
+    assert "/mnt/c" not in mounts.sources_by_mountpoint
+
+
+def test_unescape_mountinfo_field():
+    assert traditional._unescape_mountinfo_field("/mnt/a\\040b\\011c\\134d") == "/mnt/a b\tc\\d"
+    assert traditional._unescape_mountinfo_field("/mnt/plain") == "/mnt/plain"
+
+
+def test_read_local_mounts_falls_back_to_mount_command(tmp_path, monkeypatch):
+    # e.g. on macOS, where /proc/self/mountinfo does not exist
+    monkeypatch.setattr(traditional, "_MOUNTINFO_PATH", str(tmp_path / "missing"))
+    monkeypatch.setattr(traditional.subprocess, "check_output",
+                        lambda command: b"/dev/disk1s1 on / (apfs, local)\n10.0.0.1:/vol1 on /mnt/vol1 (nfs)\n")
+
+    mounts = traditional._read_local_mounts()
+    assert mounts.mountpoints_by_source == {"/dev/disk1s1": "/", "10.0.0.1:/vol1": "/mnt/vol1"}
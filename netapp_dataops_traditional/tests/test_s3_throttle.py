@@ -0,0 +1,166 @@
+"""Tests for the S3 bandwidth and request rate limits: the token bucket that
+enforces a rate, and the throttle schedule that changes the limits by time of
+day. The clock is replaced with a fake clock, so that the tests do not sleep.
+"""
+
+import time
+
+import pytest
+
+from netapp_dataops import traditional
+
+
+class _FakeClock:
+    # Stand-in for the time module; sleeping advances the monotonic clock instead of blocking
+    def __init__(self, hour: int = 12, minute: int = 0):
+        self.now = 1000.0
+        self.sleeps = list()
+        self.set_time_of_day(hour, minute)
+
+    def set_time_of_day(self, hour: int, minute: int):
+        self._localTime = time.struct_time((2024, 1, 1, hour, minute, 0, 0, 1, -1))
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def localtime(self) -> time.struct_time:
+        return self._localTime
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fakeClock = _FakeClock()
+    monkeypatch.setattr(traditional, "time", fakeClock)
+    return fakeClock
+
+
+def test_token_bucket_without_rate_does_not_sleep(clock):
+    bucket = traditional._S3TokenBucket()
+    bucket.consume(10 ** 12)
+    assert clock.sleeps == []
+
+
+def test_token_bucket_starts_full(clock):
+    bucket = traditional._S3TokenBucket(rate=100)
+    bucket.consume(100)
+    assert clock.sleeps == []
+
+    # The bucket is empty, so the next 50 tokens take half a second
+    bucket.consume(50)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_refills_at_rate_up_to_one_second_of_tokens(clock):
+    bucket = traditional._S3TokenBucket(rate=100)
+    bucket.consume(100)
+
+    clock.now += 0.25
+    bucket.consume(25)
+    assert clock.sleeps == []
+
+    # Idle time beyond one second does not accumulate further tokens
+    clock.now += 10
+    bucket.consume(200)
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_token_bucket_allows_amounts_larger_than_bucket(clock):
+    bucket = traditional._S3TokenBucket(rate=100)
+    bucket.consume(350)
+    assert clock.sleeps == [pytest.approx(2.5)]
+
+    # The debt was paid off by the sleep
+    clock.now += 1
+    bucket.consume(100)
+    assert clock.sleeps == [pytest.approx(2.5)]
+
+
+def test_token_bucket_enforces_rate_on_average(clock):
+    bucket = traditional._S3TokenBucket(rate=1000)
+    start = clock.now
+    for i in range(100):
+        bucket.consume(100)
+
+    # 10000 tokens at 1000 tokens per second, less the one second's worth of tokens that the bucket started with
+    assert clock.now - start == pytest.approx(9.0)
+
+
+def test_token_bucket_rate_change(clock):
+    bucket = traditional._S3TokenBucket(rate=1000)
+
+    # Lowering the rate caps the tokens in the bucket at the new rate
+    bucket.set_rate(100)
+    bucket.consume(200)
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+    bucket.set_rate(None)
+    bucket.consume(10 ** 12)
+    assert bucket.rate is None
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_parse_throttle_schedule():
+    windows = traditional._parse_s3_throttle_schedule([
+        {"start": "08:00", "end": "18:30", "maxBandwidth": "1000000"},
+        {"start": "22:00", "end": "06:00", "maxRps": 50, "maxBandwidth": None}
+    ])
+    assert windows == [
+        (8 * 60, 18 * 60 + 30, {"max_bandwidth": 1000000}),
+        (22 * 60, 6 * 60, {"max_rps": 50})
+    ]
+
+
+@pytest.mark.parametrize("entry", [
+    {"start": "25:00", "end": "06:00", "maxRps": 50},
+    {"start": "22:00", "maxRps": 50},
+    {"start": "22:00", "end": "06:00", "maxRps": 0}
+])
+def test_parse_throttle_schedule_rejects_invalid_windows(entry):
+    with pytest.raises((KeyError, ValueError)):
+        traditional._parse_s3_throttle_schedule([entry])
+
+
+@pytest.mark.parametrize("hour, minute, expectedBandwidth, expectedRps", [
+    (21, 59, 1000, None),
+    (22, 0, 1000, 50),
+    (23, 59, 1000, 50),
+    (0, 0, 1000, 50),
+    (5, 59, 1000, 50),
+    (6, 0, 1000, None),
+    (8, 0, 500, None),
+    (18, 29, 500, None),
+    (18, 30, 1000, None)
+])
+def test_throttle_schedule_windows(clock, hour, minute, expectedBandwidth, expectedRps):
+    schedule = traditional._parse_s3_throttle_schedule([
+        {"start": "08:00", "end": "18:30", "maxBandwidth": 500},
+        {"start": "22:00", "end": "06:00", "maxRps": 50}
+    ])
+    clock.set_time_of_day(hour, minute)
+    throttle = traditional._S3Throttle(max_bandwidth=1000, schedule=schedule)
+    assert throttle._bandwidth.rate == expectedBandwidth
+    assert throttle._requests.rate == expectedRps
+
+
+def test_throttle_schedule_is_rechecked_as_time_passes(clock):
+    schedule = traditional._parse_s3_throttle_schedule([{"start": "23:30", "end": "00:30", "maxRps": 10}])
+    clock.set_time_of_day(23, 29)
+    throttle = traditional._S3Throttle(schedule=schedule)
+    assert throttle._requests.rate is None
+
+    # The schedule is only rechecked once the check interval has elapsed
+    clock.set_time_of_day(23, 30)
+    throttle._update_limits()
+    assert throttle._requests.rate is None
+    clock.now += traditional._S3_THROTTLE_SCHEDULE_INTERVAL
+    throttle._update_limits()
+    assert throttle._requests.rate == 10
+
+    clock.set_time_of_day(0, 30)
+    clock.now += traditional._S3_THROTTLE_SCHEDULE_INTERVAL
+    throttle._update_limits()
+    assert throttle._requests.rate is None
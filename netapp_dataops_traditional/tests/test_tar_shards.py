@@ -0,0 +1,124 @@
+"""Tests for the packing of files into tar shards by push_directory_to_s3_as_shards,
+and for the shard index that pull_shard_member_from_s3 uses to retrieve a
+single member with a byte-range request.
+"""
+
+import io
+import os
+import tarfile
+
+import pytest
+
+from netapp_dataops import traditional
+
+
+class _InMemoryS3:
+    # Stand-in for the subset of the boto3 S3 client API that _S3MultipartUploadStream uses
+    def __init__(self):
+        self.objects = dict()
+        self._uploads = dict()
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes):
+        self.objects[(Bucket, Key)] = Body
+        return dict()
+
+    def create_multipart_upload(self, Bucket: str, Key: str):
+        uploadId = str(len(self._uploads))
+        self._uploads[uploadId] = dict()
+        return {"UploadId": uploadId}
+
+    def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes):
+        self._uploads[UploadId][PartNumber] = Body
+        return {"ETag": '"' + str(PartNumber) + '"'}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict):
+        parts = self._uploads.pop(UploadId)
+        self.objects[(Bucket, Key)] = b"".join(parts[part["PartNumber"]] for part in MultipartUpload["Parts"])
+        return dict()
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str):
+        self._uploads.pop(UploadId, None)
+
+
+def _write_files(directory, sizes: dict) -> list:
+    # Write files with the given member names and sizes; returns (localFile, memberName, fileSize) tuples
+    files = list()
+    for memberName, size in sizes.items():
+        localFile = os.path.join(str(directory), *memberName.split("/"))
+        os.makedirs(os.path.dirname(localFile), exist_ok=True)
+        with open(localFile, "wb") as file:
+            file.write(os.urandom(size))
+        files.append((localFile, memberName, size))
+    return files
+
+
+@pytest.mark.parametrize("partSize", [4096, 1024 * 1024])
+def test_shard_index_offsets_match_member_data(tmp_path, partSize):
+    files = _write_files(tmp_path, {
+        "empty": 0,
+        "one_byte": 1,
+        "just_under_a_block": 511,
+        "one_block": 512,
+        "just_over_a_block": 513,
+        "dir/nested/larger": 10000,
+        "dir/" + "long_name_" * 15: 700,
+        "dir/café": 42
+    })
+
+    s3 = _InMemoryS3()
+    shardSize, members, verified = traditional._push_tar_shard_to_s3(s3, s3Bucket="bucket", s3ObjectKey="shard-00000.tar",
+                                                                      files=files, partSize=partSize)
+    shard = s3.objects[("bucket", "shard-00000.tar")]
+    assert shardSize == len(shard)
+    assert verified is None
+
+    # Each indexed (offset, size) byte range is exactly the contents of the file
+    assert [memberName for memberName, offset, size in members] == [memberName for localFile, memberName, fileSize in files]
+    for (localFile, memberName, fileSize), (indexedName, offset, size) in zip(files, members):
+        with open(localFile, "rb") as file:
+            assert shard[offset:offset + size] == file.read()
+        assert size == fileSize
+
+    # The shard is a valid tar archive whose members have the same offsets as the index
+    with tarfile.open(fileobj=io.BytesIO(shard), mode="r:") as tar:
+        assert [(tarInfo.name, tarInfo.offset_data, tarInfo.size) for tarInfo in tar.getmembers()] == members
+
+
+def test_plan_tar_shards_groups_files_by_estimated_size():
+    files = [("f" + str(i), "f" + str(i), 1000) for i in range(10)]
+    memberSize = traditional._get_tar_member_size("f0", 1000)
+
+    shards = traditional._plan_tar_shards(files, shardSize=memberSize * 3)
+    assert [len(shardFiles) for shardFiles, estimatedShardSize in shards] == [3, 3, 3, 1]
+    assert [file for shardFiles, estimatedShardSize in shards for file in shardFiles] == files
+    assert [estimatedShardSize for shardFiles, estimatedShardSize in shards] == [memberSize * 3] * 3 + [memberSize]
+
+
+def test_plan_tar_shards_puts_file_larger_than_shard_size_in_its_own_shard():
+    files = [("small", "small", 10), ("large", "large", 100000), ("small2", "small2", 10)]
+    shards = traditional._plan_tar_shards(files, shardSize=4096)
+    assert [[memberName for localFile, memberName, fileSize in shardFiles] for shardFiles, estimatedShardSize in shards] == \
+        [["small"], ["large"], ["small2"]]
+
+
+def test_tar_member_size_estimate_matches_shard_size(tmp_path):
+    files = _write_files(tmp_path, {"a": 100, "b/" + "c" * 120: 5000, "d": 0})
+    s3 = _InMemoryS3()
+    shardSize, members, verified = traditional._push_tar_shard_to_s3(s3, s3Bucket="bucket", s3ObjectKey="shard.tar", files=files,
+                                                                      partSize=1024 * 1024)
+
+    # The shard consists of its members, followed by the end-of-archive marker, padded to a multiple of the record size
+    membersSize = sum(traditional._get_tar_member_size(memberName, fileSize) for localFile, memberName, fileSize in files)
+    assert membersSize + 2 * tarfile.BLOCKSIZE <= shardSize <= membersSize + tarfile.RECORDSIZE
+
+
+@pytest.mark.parametrize("memberName", ["../escaped", "dir/../../escaped", "/etc/passwd", "..", "."])
+def test_local_path_for_tar_member_rejects_path_traversal(tmp_path, memberName):
+    with pytest.raises(ValueError):
+        traditional._get_local_path_for_tar_member(str(tmp_path / "target"), memberName)
+
+
+def test_local_path_for_tar_member_stays_in_directory(tmp_path):
+    localDirectory = str(tmp_path / "target")
+    assert traditional._get_local_path_for_tar_member(localDirectory, "dir/file") == os.path.join(localDirectory, "dir", "file")
+    assert traditional._get_local_path_for_tar_member(localDirectory, "dir/../file") == os.path.join(localDirectory, "file")